@@ -1,57 +1,149 @@
 import os
 import logging
-from pathlib import Path
+import queue
+import time
+from logging.handlers import QueueHandler, QueueListener
 
-from dotenv import load_dotenv
-from fastapi import FastAPI, Request, status
-from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi import FastAPI, Request
 
+from .responses import ORJSONResponse
+from .settings import get_settings
 from .routers import resume
 
-# Load environment variables from .env file in backend directory
-env_path = Path(__file__).parent.parent / ".env"
-load_dotenv(dotenv_path=env_path)
+# Load environment settings once (cached for the life of the process)
+settings = get_settings()
 
-# Configure logging
+# Configure logging. Records go through a queue so request handlers never
+# block on the stream write syscall; a background listener does the I/O.
+log_queue: queue.SimpleQueue = queue.SimpleQueue()
+stream_handler = logging.StreamHandler()
+stream_handler.setFormatter(
+    logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+)
 logging.basicConfig(
     level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
     handlers=[
-        logging.StreamHandler()
+        QueueHandler(log_queue)
     ]
 )
+log_listener = QueueListener(log_queue, stream_handler, respect_handler_level=True)
+log_listener.start()
 logger = logging.getLogger(__name__)
 
 app = FastAPI(
     title="AI Resume Builder Backend",
-    debug=True
+    debug=True,
+    default_response_class=ORJSONResponse,
 )
 
-# Add request logging middleware
-@app.middleware("http")
-async def log_requests(request: Request, call_next):
-    logger.info(f"Request: {request.method} {request.url}")
-    try:
-        response = await call_next(request)
-        logger.info(f"Response status: {response.status_code}")
-        return response
-    except Exception as e:
-        logger.error(f"Unhandled exception: {str(e)}", exc_info=True)
-        return JSONResponse(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            content={"detail": "Internal server error"}
-        )
-
-# Allow local frontend (Vite) during development.
-# Adjust origins as needed for production.
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],  # Allow all origins in development
-    allow_credentials=False,  # Must be False when allow_origins is ["*"]
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+
+class AppMiddleware:
+    """Single pure-ASGI layer handling CORS and request logging.
+
+    Consolidates what used to be CORSMiddleware plus a separate logging
+    middleware into one coroutine frame and one send wrapper per request.
+    Avoids BaseHTTPMiddleware, which spawns a task and copies the body for
+    every request.
+    """
+
+    # max-age lets browsers cache the preflight for a day instead of
+    # resending OPTIONS before every cross-origin request
+    PREFLIGHT_HEADERS = [
+        (b"access-control-allow-methods", b"GET, POST, OPTIONS"),
+        (b"access-control-allow-headers", b"content-type, authorization"),
+        (b"access-control-max-age", b"86400"),
+    ]
+
+    def __init__(self, app):
+        self.app = app
+        # Origin allow-list comes from settings (CORS_ORIGINS env);
+        # defaults to "*" for local development with the Vite frontend
+        origins = settings.cors_origins
+        self.allow_any_origin = "*" in origins
+        self.allowed_origins = {origin.encode() for origin in origins}
+
+    def _allow_origin(self, scope) -> bytes | None:
+        """Resolve the Access-Control-Allow-Origin value for this request."""
+        if self.allow_any_origin:
+            return b"*"
+        for name, value in scope["headers"]:
+            if name == b"origin":
+                return value if value in self.allowed_origins else None
+        return None
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+
+        allow_origin = self._allow_origin(scope)
+
+        # Answer CORS preflight directly with a static header list
+        if scope["method"] == "OPTIONS":
+            headers = list(self.PREFLIGHT_HEADERS)
+            if allow_origin is not None:
+                headers.append((b"access-control-allow-origin", allow_origin))
+            await send({
+                "type": "http.response.start",
+                "status": 200,
+                "headers": headers,
+            })
+            await send({"type": "http.response.body", "body": b""})
+            return
+
+        # %-style args defer formatting until the record is actually emitted
+        logger.info("Request: %s %s", scope["method"], scope["path"])
+        start = time.perf_counter()
+        response_started = False
+
+        async def send_wrapper(message):
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+                if allow_origin is not None:
+                    message["headers"] = list(message.get("headers") or [])
+                    message["headers"].append((b"access-control-allow-origin", allow_origin))
+                elapsed_ms = (time.perf_counter() - start) * 1000
+                logger.info("Response status: %s (%.1f ms)", message["status"], elapsed_ms)
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        except Exception:
+            logger.error("Unhandled exception", exc_info=True)
+            if response_started:
+                # Too late to replace the response; let the server abort it
+                raise
+            # Plain JSON 500 through send_wrapper so it carries the CORS
+            # header; debug mode would otherwise leak an HTML traceback
+            await send_wrapper({
+                "type": "http.response.start",
+                "status": 500,
+                "headers": [(b"content-type", b"application/json")],
+            })
+            await send({
+                "type": "http.response.body",
+                "body": b'{"detail":"Internal server error"}',
+            })
+
+
+app.add_middleware(AppMiddleware)
+
+# Opt-in profiling: run with PROFILING=1 and add ?profile=1 to any request
+# to get an interactive pyinstrument HTML report instead of the response.
+# Gated behind the env var so production pays zero cost.
+if os.getenv("PROFILING"):
+    from fastapi.responses import HTMLResponse
+    from pyinstrument import Profiler
+
+    @app.middleware("http")
+    async def profile_request(request: Request, call_next):
+        if request.query_params.get("profile"):
+            profiler = Profiler(async_mode="enabled")
+            profiler.start()
+            await call_next(request)
+            profiler.stop()
+            return HTMLResponse(profiler.output_html())
+        return await call_next(request)
 
 app.include_router(resume.router)
 
@@ -59,3 +151,16 @@ app.include_router(resume.router)
 @app.get("/health")
 async def health_check():
     return {"status": "ok"}
+
+
+@app.on_event("shutdown")
+async def stop_log_listener():
+    # Flush any queued log records before the process exits
+    log_listener.stop()
+
+
+@app.on_event("shutdown")
+async def close_http_clients():
+    # Close the pooled async clients' keep-alive connections
+    from .services import summary_generation_service
+    await summary_generation_service.close_clients()
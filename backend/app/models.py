@@ -3,7 +3,14 @@ from __future__ import annotations
 from typing import List, Optional, Literal
 from uuid import UUID
 
-from pydantic import BaseModel, Field
+from pydantic import AliasChoices, BaseModel, Field, field_validator
+
+# Template ids the frontend can request. Validated once by pydantic-core so
+# invalid values are rejected with a 422 before any handler code runs.
+TemplateId = Literal[
+    "template_1", "template_2", "template_3",
+    "template_4", "template_5", "template_6",
+]
 
 
 class Links(BaseModel):
@@ -29,36 +36,62 @@ class Contacts(BaseModel):
     linkedin_url: Optional[str] = None
 
 
+# End-date spellings that mean "still in this role"
+_OPEN_ENDED_DATES = frozenset({
+    "present", "current", "now", "ongoing",
+    "till date", "till now", "till present",
+})
+
+
 class ExperienceEntry(BaseModel):
-    job_title: Optional[str] = None
-    employer: Optional[str] = None
-    location: Optional[str] = None
-    start_date: Optional[str] = None
-    end_date: Optional[str] = None
-    description: Optional[str] = None
+    """Experience entry. Validation aliases accept the alternative key names
+    LLM responses use (title/company/responsibilities etc.) declaratively in
+    pydantic-core, so whole lists can be validated in one pass instead of a
+    Python loop that probes each synonym per entry."""
+
+    job_title: Optional[str] = Field(
+        None, validation_alias=AliasChoices("job_title", "title", "position"))
+    employer: Optional[str] = Field(
+        None, validation_alias=AliasChoices("employer", "company", "organization"))
+    location: Optional[str] = Field(
+        None, validation_alias=AliasChoices("location", "city"))
+    start_date: Optional[str] = Field(
+        None, validation_alias=AliasChoices("start_date", "start"))
+    end_date: Optional[str] = Field(
+        None, validation_alias=AliasChoices("end_date", "end"))
+    description: Optional[str] = Field(
+        None, validation_alias=AliasChoices("description", "responsibilities", "duties"))
+
+    @field_validator("*", mode="before")
+    @classmethod
+    def _strip_to_none(cls, value):
+        """Coerce values to stripped strings, mapping empties to None."""
+        if value is None:
+            return None
+        value = str(value).strip()
+        return value or None
+
+    @field_validator("end_date")
+    @classmethod
+    def _open_ended_to_none(cls, value: Optional[str]) -> Optional[str]:
+        """An end date of "Present"/"Current"/... means the role is ongoing."""
+        if value and value.lower() in _OPEN_ENDED_DATES:
+            return None
+        return value
 
 
 class EducationEntry(BaseModel):
-    school_name: Optional[str] = None
+    """Education entry. Serialization aliases map backend field names to the
+    frontend expected names (institution, start_year, end_year) in a single
+    pydantic-core pass when dumped with by_alias=True."""
+
+    school_name: Optional[str] = Field(None, serialization_alias="institution")
     degree: Optional[str] = None
     field_of_study: Optional[str] = None
     location: Optional[str] = None
-    start_date: Optional[str] = None
-    end_date: Optional[str] = None
+    start_date: Optional[str] = Field(None, serialization_alias="start_year")
+    end_date: Optional[str] = Field(None, serialization_alias="end_year")
     description: Optional[str] = None
-    
-    def model_dump(self, **kwargs):
-        """Serialize to frontend-compatible format with exact field names."""
-        data = super().model_dump(**kwargs)
-        # Map backend fields to frontend expected fields
-        return {
-            "institution": data.get("school_name") or "",
-            "location": data.get("location") or "",
-            "degree": data.get("degree") or "",
-            "start_year": data.get("start_date") or "",
-            "end_year": data.get("end_date") or "",
-            "description": data.get("description") or "",
-        }
 
 
 class Skills(BaseModel):
@@ -76,22 +109,14 @@ class ProjectEntry(BaseModel):
 
 
 class CertificateEntry(BaseModel):
-    certificate_name: Optional[str] = None
-    issuing_organization: Optional[str] = None
-    date_of_completion: Optional[str] = None  # MM/YYYY format
-    credential_id: Optional[str] = None
-    credential_url: Optional[str] = None
-    
-    def model_dump(self, **kwargs):
-        """Serialize to frontend-compatible format with camelCase field names."""
-        data = super().model_dump(**kwargs)
-        return {
-            "name": data.get("certificate_name"),
-            "organization": data.get("issuing_organization"),
-            "completionDate": data.get("date_of_completion"),
-            "credentialId": data.get("credential_id"),
-            "credentialUrl": data.get("credential_url"),
-        }
+    """Certificate entry. Serialization aliases produce the camelCase field
+    names the frontend expects when dumped with by_alias=True."""
+
+    certificate_name: Optional[str] = Field(None, serialization_alias="name")
+    issuing_organization: Optional[str] = Field(None, serialization_alias="organization")
+    date_of_completion: Optional[str] = Field(None, serialization_alias="completionDate")  # MM/YYYY format
+    credential_id: Optional[str] = Field(None, serialization_alias="credentialId")
+    credential_url: Optional[str] = Field(None, serialization_alias="credentialUrl")
 
 
 class ResumeData(BaseModel):
@@ -103,92 +128,23 @@ class ResumeData(BaseModel):
     certifications: Optional[List[CertificateEntry]] = None
     achievements: Optional[List[str]] = None
     summary: Optional[str] = None
-    
-    def model_dump(self, **kwargs):
-        """Serialize with proper handling of CertificateEntry and EducationEntry objects."""
-        data = super().model_dump(**kwargs)
-        # Convert CertificateEntry objects to frontend format
-        if self.certifications:
-            data["certifications"] = [
-                cert.model_dump() if isinstance(cert, CertificateEntry) else cert
-                for cert in self.certifications
-            ]
-        # Convert EducationEntry objects to frontend format (map school_name→institution, start_date→start_year, end_date→end_year)
-        if self.education:
-            data["education"] = [
-                edu.model_dump() if isinstance(edu, EducationEntry) else edu
-                for edu in self.education
-            ]
-        return data
 
 
 class StoredResume(BaseModel):
     resume_id: UUID
-    template_id: str
+    template_id: TemplateId
     data: ResumeData
 
 
 class ParsedResumeResponse(BaseModel):
     resume_id: UUID
-    template_id: str
+    template_id: TemplateId
     data: ResumeData
-    
-    def model_dump(self, **kwargs):
-        """Ensure education data is normalized when serializing response.
-        
-        This is CRITICAL: FastAPI calls this method when serializing the response.
-        We must normalize education entries here to ensure frontend compatibility.
-        Also ensures UUID is converted to string for JSON serialization.
-        """
-        # First, get the base serialized data
-        # ResumeData.model_dump() should already normalize education, but we double-check here
-        data = super().model_dump(**kwargs)
-        
-        # CRITICAL: Convert UUID to string for JSON serialization compatibility
-        # This ensures JSONResponse can serialize the response without errors
-        if isinstance(data.get("resume_id"), UUID):
-            data["resume_id"] = str(data["resume_id"])
-        
-        # CRITICAL: Normalize education entries at the response level
-        # This ensures the frontend always receives the correct field names
-        if data.get("data") and isinstance(data["data"], dict) and data["data"].get("education"):
-            normalized_education = []
-            education_list = data["data"]["education"]
-            
-            for edu in education_list:
-                if isinstance(edu, dict):
-                    # Normalize dict entries (handles both already-normalized and raw formats)
-                    normalized_education.append({
-                        "institution": edu.get("institution") or edu.get("school_name") or "",
-                        "location": edu.get("location") or "",
-                        "degree": edu.get("degree") or "",
-                        "start_year": edu.get("start_year") or edu.get("start_date") or "",
-                        "end_year": edu.get("end_year") or edu.get("end_date") or "",
-                        "description": edu.get("description") or "",
-                    })
-                else:
-                    # If it's an EducationEntry object, use its model_dump
-                    if hasattr(edu, 'model_dump'):
-                        normalized_education.append(edu.model_dump())
-                    else:
-                        # Fallback: create normalized dict
-                        normalized_education.append({
-                            "institution": getattr(edu, 'school_name', None) or getattr(edu, 'institution', None) or "",
-                            "location": getattr(edu, 'location', None) or "",
-                            "degree": getattr(edu, 'degree', None) or "",
-                            "start_year": getattr(edu, 'start_date', None) or getattr(edu, 'start_year', None) or "",
-                            "end_year": getattr(edu, 'end_date', None) or getattr(edu, 'end_year', None) or "",
-                            "description": getattr(edu, 'description', None) or "",
-                        })
-            
-            data["data"]["education"] = normalized_education
-        
-        return data
 
 
 class ChangeTemplateRequest(BaseModel):
     resume_id: UUID
-    template_id: str
+    template_id: TemplateId
 
 
 class GenerateSummaryRequest(BaseModel):
@@ -202,4 +158,15 @@ class GenerateSummaryResponse(BaseModel):
 
 class ExtractProjectsRequest(BaseModel):
     """Request model for extracting projects from resume text."""
-    resume_text: str = Field(..., description="The resume text to extract projects from")
\ No newline at end of file
+    resume_text: str = Field(..., description="The resume text to extract projects from")
+
+
+# Build the pydantic-core schemas eagerly at import so the first HTTP request
+# doesn't pay the lazy schema-construction cost for the nested models.
+for _model in (
+    Links, Contacts, ExperienceEntry, EducationEntry, Skills, ProjectEntry,
+    CertificateEntry, ResumeData, StoredResume, ParsedResumeResponse,
+    ChangeTemplateRequest, GenerateSummaryRequest, GenerateSummaryResponse,
+    ExtractProjectsRequest,
+):
+    _model.model_rebuild()
\ No newline at end of file
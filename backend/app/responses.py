@@ -0,0 +1,23 @@
+from __future__ import annotations
+
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+
+
+class ORJSONResponse(JSONResponse):
+    """JSONResponse backed by orjson for much faster serialization.
+
+    orjson handles UUID and datetime natively, so responses built from
+    Pydantic model dumps no longer need manual string conversion.
+    """
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(
+            content,
+            default=str,
+            option=orjson.OPT_SERIALIZE_UUID | orjson.OPT_NON_STR_KEYS,
+        )
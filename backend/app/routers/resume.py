@@ -1,153 +1,82 @@
-from fastapi import APIRouter, UploadFile, File, Form, HTTPException
-from fastapi.responses import JSONResponse
+from fastapi import APIRouter, UploadFile, File, Form, HTTPException, Request, Response
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
 from uuid import UUID
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
+from collections import OrderedDict
+import hashlib
 import json
 
 from ..services import file_service, template_mapping_service, summary_generation_service
 from ..storage import storage
-from ..models import ParsedResumeResponse, ChangeTemplateRequest, GenerateSummaryRequest, GenerateSummaryResponse, ResumeData
+from ..models import ParsedResumeResponse, ChangeTemplateRequest, GenerateSummaryRequest, GenerateSummaryResponse, ResumeData, TemplateId
 
 router = APIRouter(prefix="", tags=["resume"])
 
-
-def ensure_uuid_serialization(response_data: dict) -> dict:
-    """Ensure UUID objects are converted to strings for JSON serialization.
-    
-    This is a safety net to ensure UUIDs are JSON-serializable.
-    """
-    if isinstance(response_data.get("resume_id"), UUID):
-        response_data["resume_id"] = str(response_data["resume_id"])
-    return response_data
+# Cache of final serialized response bytes (and their ETag) per resume.
+# Resume data only changes through upload-resume / change-template, which
+# refresh the entry, so repeated GETs skip pydantic construction and
+# serialization entirely. Bounded LRU (same shape as the parser's response
+# cache): an evicted entry is just re-serialized from storage on next GET.
+_RESPONSE_CACHE_MAX_ENTRIES = 128
+_response_cache: "OrderedDict[UUID, Tuple[bytes, str]]" = OrderedDict()
 
 
-def ensure_education_normalization(response_data: dict) -> dict:
-    """Ensure education entries have correct field names for frontend.
-    
-    This is a safety net to ensure normalization happens even if model_dump() is bypassed.
-    """
-    if response_data.get("data") and isinstance(response_data["data"], dict):
-        education_list = response_data["data"].get("education")
-        if education_list:
-            normalized = []
-            for edu in education_list:
-                if isinstance(edu, dict):
-                    normalized.append({
-                        "institution": str(edu.get("institution") or edu.get("school_name") or ""),
-                        "location": str(edu.get("location") or ""),
-                        "degree": str(edu.get("degree") or ""),
-                        "start_year": str(edu.get("start_year") or edu.get("start_date") or ""),
-                        "end_year": str(edu.get("end_year") or edu.get("end_date") or ""),
-                        "description": str(edu.get("description") or ""),
-                    })
-                else:
-                    # If it's an object, try to get attributes
-                    normalized.append({
-                        "institution": str(getattr(edu, 'institution', None) or getattr(edu, 'school_name', None) or ""),
-                        "location": str(getattr(edu, 'location', None) or ""),
-                        "degree": str(getattr(edu, 'degree', None) or ""),
-                        "start_year": str(getattr(edu, 'start_year', None) or getattr(edu, 'start_date', None) or ""),
-                        "end_year": str(getattr(edu, 'end_year', None) or getattr(edu, 'end_date', None) or ""),
-                        "description": str(getattr(edu, 'description', None) or ""),
-                    })
-            response_data["data"]["education"] = normalized
-    return response_data
-
-
-def normalize_education(education_list: List[Any]) -> List[Dict[str, str]]:
-    """Normalize education entries to match frontend expected format.
-    
-    Maps:
-    - school_name → institution
-    - start_date → start_year
-    - end_date → end_year
-    
-    Returns empty strings for missing fields.
-    """
-    if not education_list:
-        return []
-    
-    normalized = []
-    for edu in education_list:
-        # Handle both dict and EducationEntry objects
-        if isinstance(edu, dict):
-            normalized.append({
-                "institution": edu.get("institution") or edu.get("school_name") or "",
-                "location": edu.get("location") or "",
-                "degree": edu.get("degree") or "",
-                "start_year": edu.get("start_year") or edu.get("start_date") or "",
-                "end_year": edu.get("end_year") or edu.get("end_date") or "",
-                "description": edu.get("description") or "",
-            })
-        else:
-            # If it's an EducationEntry object, use its model_dump
-            normalized.append(edu.model_dump())
-    
-    return normalized
-
-
-def normalize_resume_data(resume_data: ResumeData) -> ResumeData:
-    """Normalize ResumeData to ensure education fields match frontend format.
-    
-    This ensures that when FastAPI serializes the response, education entries
-    have the correct field names (institution, start_year, end_year) that the frontend expects.
-    """
-    if resume_data.education:
-        # The EducationEntry.model_dump() already handles the mapping,
-        # but we ensure it's called by converting to dict and back if needed
-        # Actually, since we're using model_dump() in EducationEntry, this should work
-        # But to be extra safe, we ensure the data structure is correct
-        pass  # The model_dump() in EducationEntry already handles normalization
-    return resume_data
+def _cache_response(resume_id: UUID, response_obj: ParsedResumeResponse) -> Tuple[bytes, str]:
+    """Serialize a response once, compute its ETag, and cache both."""
+    body = response_obj.model_dump_json(by_alias=True).encode()
+    # blake2b is faster than sha256 at this payload size
+    etag = f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+    _response_cache[resume_id] = (body, etag)
+    _response_cache.move_to_end(resume_id)
+    if len(_response_cache) > _RESPONSE_CACHE_MAX_ENTRIES:
+        _response_cache.popitem(last=False)
+    return body, etag
 
 
 @router.post("/upload-resume", response_model=ParsedResumeResponse)
-async def upload_resume(file: UploadFile = File(...), template_id: str = Form(...)):
-    # Check file extension instead of content_type (more reliable)
-    filename = file.filename or ""
-    if not filename.lower().endswith('.pdf'):
-        raise HTTPException(status_code=400, detail="Only PDF files are supported")
-    
-    # Also check content type if available, but be flexible
-    if file.content_type and file.content_type not in ["application/pdf", "application/x-pdf"]:
+async def upload_resume(file: UploadFile = File(...), template_id: TemplateId = Form(...)):
+    # Check the PDF magic bytes instead of filename/content_type: rejects
+    # renamed files immediately without reading the whole upload
+    first_bytes = await file.read(5)
+    await file.seek(0)
+    if first_bytes != b"%PDF-":
         raise HTTPException(status_code=400, detail="Only PDF files are supported")
 
     try:
-        resume_id_str, parsed_resume = await file_service.handle_resume_upload(file, template_id)
-        resume_id_uuid = UUID(resume_id_str)
+        resume_id, parsed_resume = await file_service.handle_resume_upload(file, template_id)
 
         # Create response object
-        response_obj = ParsedResumeResponse(resume_id=resume_id_uuid, template_id=template_id, data=parsed_resume)
-        
-        # CRITICAL: Get normalized data using model_dump() to ensure education fields are correctly mapped
-        # This ensures frontend receives: institution, start_year, end_year (not school_name, start_date, end_date)
-        response_data = response_obj.model_dump()
-        
-        # Double-check normalization (safety net)
-        response_data = ensure_education_normalization(response_data)
-        # Ensure UUID is converted to string for JSON serialization
-        response_data = ensure_uuid_serialization(response_data)
-        
-        # Return as JSONResponse to ensure our normalization is used
-        return JSONResponse(content=response_data)
+        response_obj = ParsedResumeResponse(resume_id=resume_id, template_id=template_id, data=parsed_resume)
+
+        # Serialization aliases on the models map education/certificate fields
+        # to the frontend names; model_dump_json serializes straight to bytes
+        # in pydantic-core without an intermediate dict or jsonable_encoder
+        body, etag = _cache_response(resume_id, response_obj)
+        return Response(content=body, media_type="application/json", headers={"ETag": etag})
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error processing resume: {str(e)}")
 
 
 @router.get("/resume/{resume_id}", response_model=ParsedResumeResponse)
-async def get_resume(resume_id: UUID):
-    stored = storage.get_resume(resume_id)
-    if not stored:
-        raise HTTPException(status_code=404, detail="Resume not found")
-
-    # Create response and normalize education fields
-    response_obj = ParsedResumeResponse(resume_id=resume_id, template_id=stored.template_id, data=stored.data)
-    response_data = response_obj.model_dump()
-    response_data = ensure_education_normalization(response_data)
-    # Ensure UUID is converted to string for JSON serialization
-    response_data = ensure_uuid_serialization(response_data)
-    return JSONResponse(content=response_data)
+async def get_resume(resume_id: UUID, request: Request):
+    cached = _response_cache.get(resume_id)
+    if cached is not None:
+        _response_cache.move_to_end(resume_id)
+    else:
+        stored = storage.get_resume(resume_id)
+        if not stored:
+            raise HTTPException(status_code=404, detail="Resume not found")
+
+        # Stored data was validated on upload; skip re-running the validators
+        response_obj = ParsedResumeResponse.model_construct(resume_id=resume_id, template_id=stored.template_id, data=stored.data)
+        cached = _cache_response(resume_id, response_obj)
+
+    body, etag = cached
+    # Unchanged since the client's last fetch: skip the body entirely
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+    return Response(content=body, media_type="application/json", headers={"ETag": etag})
 
 
 @router.post("/change-template", response_model=ParsedResumeResponse)
@@ -156,24 +85,21 @@ async def change_template(payload: ChangeTemplateRequest):
     if not updated:
         raise HTTPException(status_code=404, detail="Resume not found")
 
-    # Create response and normalize education fields
-    response_obj = ParsedResumeResponse(resume_id=updated.resume_id, template_id=updated.template_id, data=updated.data)
-    response_data = response_obj.model_dump()
-    response_data = ensure_education_normalization(response_data)
-    # Ensure UUID is converted to string for JSON serialization
-    response_data = ensure_uuid_serialization(response_data)
-    return JSONResponse(content=response_data)
+    # Stored data was validated on upload; skip re-running the validators.
+    # Template changed, so refresh the cached response bytes and ETag.
+    response_obj = ParsedResumeResponse.model_construct(resume_id=updated.resume_id, template_id=updated.template_id, data=updated.data)
+    body, etag = _cache_response(updated.resume_id, response_obj)
+    return Response(content=body, media_type="application/json", headers={"ETag": etag})
 
 
 @router.post("/generate-summary", response_model=GenerateSummaryResponse)
 async def generate_summary(payload: GenerateSummaryRequest):
     """Generate a professional summary based on job description using google/flan-t5-base model."""
     try:
-        # Convert ResumeData to dict if provided
-        resume_dict = None
-        if payload.resume_data:
-            resume_dict = payload.resume_data.model_dump() if hasattr(payload.resume_data, 'model_dump') else payload.resume_data.dict()
-        
+        # Convert ResumeData to dict if provided; exclude_none keeps the
+        # downstream LLM prompt payload small
+        resume_dict = payload.resume_data.model_dump(mode="json", exclude_none=True) if payload.resume_data else None
+
         summary = await summary_generation_service.generate_summary_from_job_description(
             job_description=payload.job_description,
             resume_data=resume_dict
@@ -186,3 +112,25 @@ async def generate_summary(payload: GenerateSummaryRequest):
         raise HTTPException(status_code=500, detail=f"Error generating summary: {str(e)}")
 
 
+@router.post("/generate-summary/stream")
+async def generate_summary_stream(payload: GenerateSummaryRequest):
+    """Stream the generated summary as plain-text chunks.
+
+    The browser can render tokens as they arrive, so perceived latency is
+    time-to-first-token rather than the full completion time.
+    """
+    # Validate before the response starts: a generator can't raise a 400
+    # once chunks are flowing
+    if not payload.job_description or not payload.job_description.strip():
+        raise HTTPException(status_code=400, detail="Job description cannot be empty")
+
+    resume_dict = payload.resume_data.model_dump(mode="json", exclude_none=True) if payload.resume_data else None
+    return StreamingResponse(
+        summary_generation_service.generate_summary_stream(
+            job_description=payload.job_description,
+            resume_data=resume_dict,
+        ),
+        media_type="text/plain",
+    )
+
+
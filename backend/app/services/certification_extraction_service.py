@@ -1,15 +1,23 @@
 from __future__ import annotations
 
-import json
+import asyncio
+import hashlib
+import logging
 import os
 import re
-from typing import Optional, List
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
 
+import httpx
+import orjson
+import tiktoken
 from dotenv import load_dotenv
-from openai import OpenAI
+from openai import AsyncOpenAI, OpenAI
 
 from ..models import CertificateEntry
 
+logger = logging.getLogger(__name__)
+
 # Load environment variables
 load_dotenv()
 
@@ -18,106 +26,187 @@ OPENROUTER_API_KEY = os.getenv("OPENROUTER_API_KEY")
 if not OPENROUTER_API_KEY:
     raise ValueError("OPENROUTER_API_KEY not found in environment variables")
 
+# Shared transport settings: keep-alive pooling plus HTTP/2 multiplexing so
+# repeated and concurrent calls reuse connections instead of paying a TLS
+# handshake each time
+_HTTP_LIMITS = httpx.Limits(max_keepalive_connections=32, max_connections=64)
+
 client = OpenAI(
     base_url="https://openrouter.ai/api/v1",
     api_key=OPENROUTER_API_KEY,
+    http_client=httpx.Client(http2=True, limits=_HTTP_LIMITS, timeout=60.0),
+)
+
+# Tokenizer matching the extraction model, loaded once. Truncating by tokens
+# instead of characters never cuts mid-character, drops fewer certificate
+# entries, and keeps the prompt length deterministic.
+_TOKEN_ENCODER = tiktoken.encoding_for_model("gpt-4o-mini")
+_MAX_PROMPT_TOKENS = 3500
+
+# Non-blocking client for async callers (awaiting the LLM round-trip instead
+# of stalling the event loop) and for concurrent batch extraction
+aclient = AsyncOpenAI(
+    base_url="https://openrouter.ai/api/v1",
+    api_key=OPENROUTER_API_KEY,
+    http_client=httpx.AsyncClient(http2=True, limits=_HTTP_LIMITS, timeout=60.0),
 )
 
+# Precompiled patterns, hoisted to module level so no call site pays
+# pattern parsing / re-cache lookups (the URL validator used to be
+# recompiled once per certificate entry)
+_RE_WS = re.compile(r'\s+')
+_RE_DBL_NL = re.compile(r'\n\s*\n')
+# Single-pass OCR character fixes (translate is C-implemented and makes one
+# new string instead of one per replace call)
+_OCR_FIX = str.maketrans({'|': 'I', '0': 'O'})
+_RE_DATE_PREFIX = re.compile(r'^(issued|completed|earned|obtained|received|date[:]?)\s*:?\s*', re.IGNORECASE)
+_RE_YEAR = re.compile(r'\b(19|20)\d{2}\b')
+# Month names in one alternation (longest-first so "september" wins over "sep")
+_MONTH_MAP = {
+    'january': '01', 'february': '02', 'march': '03', 'april': '04',
+    'may': '05', 'june': '06', 'july': '07', 'august': '08',
+    'september': '09', 'october': '10', 'november': '11', 'december': '12',
+    'sept': '09',
+    'jan': '01', 'feb': '02', 'mar': '03', 'apr': '04',
+    'jun': '06', 'jul': '07', 'aug': '08',
+    'sep': '09', 'oct': '10', 'nov': '11', 'dec': '12',
+}
+_MONTH_ALT = '|'.join(sorted(_MONTH_MAP, key=len, reverse=True))
+# Every accepted date format in one alternation; the named group that matched
+# identifies the format, so one search replaces the old chain of six
+# per-format match/search calls
+_RE_DATE_ANY = re.compile(
+    r'(?P<mmY>^(?P<mmY_m>\d{1,2})[/-](?P<mmY_y>\d{4})$)'
+    r'|(?P<isoY>^(?P<iso_y>\d{4})[-/](?P<iso_m>\d{1,2})$)'
+    r'|(?P<ddmmY>^\d{1,2}[/-](?P<ddm_m>\d{1,2})[/-](?P<ddm_y>\d{4})$)'
+    r'|(?P<monY>\b(?P<mon_m>' + _MONTH_ALT + r')\b.{0,20}?(?P<mon_y>(?:19|20)\d{2}))'
+    r'|(?P<mmYin>\b(?P<in_m>\d{1,2})[/-](?P<in_y>\d{4}))'
+    r'|(?P<yOnly>\b(?P<y_y>(?:19|20)\d{2})\b)',
+    re.IGNORECASE,
+)
+_RE_SECTION_HEADING = re.compile(
+    r'(?im)^\s*((?:work\s+)?experience|education|projects?|skills|'
+    r'certifications?|certificates?|licenses?(?:\s*&\s*certifications?)?|'
+    r'training(?:\s*&\s*certifications?)?|courses?(?:\s*&\s*certifications?)?)'
+    r'\s*:?\s*$'
+)
+# Accepted key spellings per CertificateEntry field, tried in order of
+# likelihood. Data-driven so adding an alias is a one-line change instead of
+# another chained item.get(...)
+_FIELD_ALIASES = {
+    "certificate_name": (
+        "certificate_name", "name", "certification", "title", "certificate",
+    ),
+    "issuing_organization": (
+        "issuing_organization", "organization", "issuer", "platform",
+        "issued_by", "provider",
+    ),
+    "date_of_completion": (
+        "date_of_completion", "date", "completion_date", "issue_date",
+        "issued_date", "earned_date", "completed",
+    ),
+    "credential_id": (
+        "credential_id", "credential", "id", "license_id", "certificate_id",
+        "credential_number", "license_number",
+    ),
+    "credential_url": (
+        "credential_url", "url", "link", "verification_url",
+        "certificate_url", "verification_link",
+    ),
+}
+_RE_CERT_PREFIX = re.compile(r'^(certificate|certification|cert):\s*', re.IGNORECASE)
+_RE_ORG_PREFIX = re.compile(r'^(issued by|from|by):\s*', re.IGNORECASE)
+_RE_ID_PREFIX = re.compile(r'^(id|credential|license|certificate|number)[:\s#]*', re.IGNORECASE)
+# Cheap scheme check; the real validation is urlsplit on the candidate.
+# Linear-time, no backtracking risk, and handles IPv6 hosts and long TLDs
+# that the old hand-rolled pattern rejected.
+_RE_URL_CHEAP = re.compile(r'^https?://\S+$', re.IGNORECASE)
+
 
 def _normalize_text(text: str) -> str:
     """Normalize and clean extracted text while preserving meaning."""
     # Remove excessive whitespace
-    text = re.sub(r'\s+', ' ', text)
+    text = _RE_WS.sub(' ', text)
     # Fix common OCR errors
-    text = text.replace('|', 'I').replace('0', 'O')  # Common OCR mistakes
+    text = text.translate(_OCR_FIX)  # Common OCR mistakes
     # Normalize line breaks
-    text = re.sub(r'\n\s*\n', '\n', text)
+    text = _RE_DBL_NL.sub('\n', text)
     return text.strip()
 
 
+def _prune_to_cert_sections(text: str) -> str:
+    """Drop resume sections clearly irrelevant to certifications.
+
+    Splits on known section headings and keeps only certification-adjacent
+    sections plus a short lead-in, cutting the per-request token count by
+    well over half on typical resumes. Falls back to the full text when no
+    recognizable headings (or no certification section) are found, so recall
+    never regresses.
+    """
+    parts = _RE_SECTION_HEADING.split(text)
+    if len(parts) < 3:
+        return text
+
+    kept = [text[:200]]
+    for heading, body in zip(parts[1::2], parts[2::2]):
+        lowered = heading.lower()
+        if any(k in lowered for k in ('cert', 'licen', 'train', 'course')):
+            kept.append(f"{heading}:\n{body}")
+
+    if len(kept) == 1:
+        return text
+    return "\n".join(kept)
+
+
 def _normalize_date(date_str: Optional[str]) -> Optional[str]:
     """Normalize date to MM/YYYY format when possible."""
     if not date_str:
         return None
     
     date_str = str(date_str).strip()
-    
+
     # Remove common prefixes/suffixes
-    date_str = re.sub(r'^(issued|completed|earned|obtained|received|date[:]?)\s*:?\s*', '', date_str, flags=re.IGNORECASE)
+    date_str = _RE_DATE_PREFIX.sub('', date_str)
     date_str = date_str.strip()
-    
-    # Format: MM/YYYY or M/YYYY
-    mm_yyyy_match = re.match(r'^(\d{1,2})[/-](\d{4})$', date_str)
-    if mm_yyyy_match:
-        month = mm_yyyy_match.group(1).zfill(2)
-        year = mm_yyyy_match.group(2)
-        # Validate month
-        if 1 <= int(month) <= 12:
-            return f"{month}/{year}"
-    
-    # Format: YYYY-MM (ISO format)
-    iso_match = re.match(r'^(\d{4})[-/](\d{1,2})$', date_str)
-    if iso_match:
-        year = iso_match.group(1)
-        month = iso_match.group(2).zfill(2)
-        if 1 <= int(month) <= 12:
-            return f"{month}/{year}"
-    
-    # Format: Month YYYY or MMM YYYY (full or abbreviated)
-    month_names = {
-        'january': '01', 'february': '02', 'march': '03', 'april': '04',
-        'may': '05', 'june': '06', 'july': '07', 'august': '08',
-        'september': '09', 'october': '10', 'november': '11', 'december': '12',
-        'jan': '01', 'feb': '02', 'mar': '03', 'apr': '04',
-        'may': '05', 'jun': '06', 'jul': '07', 'aug': '08',
-        'sep': '09', 'sept': '09', 'oct': '10', 'nov': '11', 'dec': '12'
-    }
-    
-    date_lower = date_str.lower()
-    for month_name, month_num in month_names.items():
-        # Check if month name appears in the date string
-        if month_name in date_lower:
-            # Extract year (4 digits starting with 19 or 20)
-            year_match = re.search(r'\b(19|20)\d{2}\b', date_str)
-            if year_match:
-                return f"{month_num}/{year_match.group(0)}"
-    
-    # Format: DD/MM/YYYY or DD-MM-YYYY (extract month and year)
-    ddmmyyyy_match = re.match(r'^\d{1,2}[/-](\d{1,2})[/-](\d{4})$', date_str)
-    if ddmmyyyy_match:
-        month = ddmmyyyy_match.group(1).zfill(2)
-        year = ddmmyyyy_match.group(2)
-        if 1 <= int(month) <= 12:
-            return f"{month}/{year}"
-    
-    # Format: YYYY only
-    year_match = re.search(r'\b(19|20)\d{2}\b', date_str)
+
+    # One scan over the string; the named group that matched tells us the
+    # format. Exact formats (MM/YYYY, YYYY-MM, DD/MM/YYYY) are anchored, the
+    # rest match in free text with leftmost occurrence winning.
+    m = _RE_DATE_ANY.search(date_str)
+    if not m:
+        # Return None if can't normalize (better than returning invalid date)
+        return None
+
+    if m.group('mmY'):
+        month, year = m.group('mmY_m'), m.group('mmY_y')
+    elif m.group('isoY'):
+        month, year = m.group('iso_m'), m.group('iso_y')
+    elif m.group('ddmmY'):
+        month, year = m.group('ddm_m'), m.group('ddm_y')
+    elif m.group('monY'):
+        # Month YYYY / MMM YYYY (full or abbreviated month name)
+        return f"{_MONTH_MAP[m.group('mon_m').lower()]}/{m.group('mon_y')}"
+    elif m.group('mmYin'):
+        month, year = m.group('in_m'), m.group('in_y')
+    else:
+        # Year only: default to January
+        return f"01/{m.group('y_y')}"
+
+    month = month.zfill(2)
+    if 1 <= int(month) <= 12:
+        return f"{month}/{year}"
+
+    # Numeric month out of range; salvage the year if there is one
+    year_match = _RE_YEAR.search(date_str)
     if year_match:
-        year = year_match.group(0)
-        # Default to January if only year is found
-        return f"01/{year}"
-    
-    # If already in MM/YYYY format but with extra text, try to extract
-    mm_yyyy_in_text = re.search(r'(\d{1,2})[/-](\d{4})', date_str)
-    if mm_yyyy_in_text:
-        month = mm_yyyy_in_text.group(1).zfill(2)
-        year = mm_yyyy_in_text.group(2)
-        if 1 <= int(month) <= 12:
-            return f"{month}/{year}"
-    
-    # Return None if can't normalize (better than returning invalid date)
+        return f"01/{year_match.group(0)}"
     return None
 
 
-def _call_openrouter(prompt: str, model: str = "openai/gpt-4o-mini") -> str:
-    """Call OpenRouter API with the given prompt."""
-    try:
-        response = client.chat.completions.create(
-            model=model,
-            messages=[
-                {
-                    "role": "system",
-                    "content": """You are an expert resume parser specialized in CERTIFICATION extraction.
+# Static system prompt. All invariant instructions, formats and examples live
+# here so the prefix is byte-identical across calls and provider-side prompt
+# caching can hit; only the short "RESUME TEXT:" user message varies.
+_SYSTEM_PROMPT = """You are an expert resume parser specialized in CERTIFICATION extraction.
 
 TASK:
 Extract ONLY certificate / certification / course completion details from the given resume text.
@@ -172,45 +261,311 @@ CRITICAL EXTRACTION RULES:
    - All other fields can be null if not found
    - Return empty array [] if no valid certificates found
 
-Return ONLY valid JSON (no markdown, no explanations, no comments).""",
-                },
+7. FIELD DETAILS:
+   a) certificate_name (REQUIRED):
+      - Full name of the certification or course
+      - Examples: "AWS Certified Solutions Architect", "Machine Learning by Stanford", "Microsoft Azure Fundamentals"
+      - Preserve exact name as written
+   b) issuing_organization (OPTIONAL):
+      - Platform, company, or authority that issued the certificate
+      - Examples: "AWS", "Coursera", "Microsoft", "Google", "Stanford University", "Udemy", "NPTEL"
+      - Extract from context if not explicitly stated; if unclear, use null
+   c) date_of_completion (OPTIONAL):
+      - Completion date or issue date, normalized to MM/YYYY
+      - If only year is found, use "01/YYYY"; if not found, use null
+   d) credential_id (OPTIONAL):
+      - License number, certificate ID, or credential identifier
+      - Examples: "AZ-900", "AWS-12345", "License #123456"
+      - Only extract if explicitly mentioned; if not found, use null
+   e) credential_url (OPTIONAL):
+      - Verification link or certificate URL (must start with http:// or https://)
+      - Examples: "https://www.coursera.org/verify/ABC123", "https://credly.com/badges/xyz"
+      - If not found, use null
+
+8. OUTPUT FORMAT (STRICT JSON only, no markdown, no explanations):
+   {
+     "certificates": [
+       {
+         "certificate_name": "AWS Certified Solutions Architect",
+         "issuing_organization": "AWS",
+         "date_of_completion": "03/2023",
+         "credential_id": "AWS-12345",
+         "credential_url": "https://www.credly.com/badges/abc123"
+       }
+     ]
+   }
+   If no certificates found, return: {"certificates": []}
+
+EXAMPLES OF VALID CERTIFICATES:
+✓ "AWS Certified Solutions Architect - Associate" → certificate
+✓ "Google Cloud Professional Cloud Architect" → certificate
+✓ "Machine Learning by Stanford (Coursera)" → certificate
+✓ "Microsoft Azure Fundamentals (AZ-900)" → certificate
+✓ "PMP Certification" → certificate
+✓ "Oracle Certified Java Developer" → certificate
+
+EXAMPLES OF INVALID (DO NOT EXTRACT):
+✗ "Software Developer Intern at Google" → internship
+✗ "Built a web application using React" → project
+✗ "Bachelor of Science in Computer Science" → education
+✗ "5 years of experience in Python" → experience/skill
+
+Return ONLY valid JSON (no markdown, no explanations, no comments)."""
+
+
+# Bump whenever the system prompt or parsing logic changes so stale cache
+# entries are invalidated
+PROMPT_VERSION = "v1"
+
+# Content-hash cache of extraction results. Re-uploading the same resume
+# (common during template switching and dev loops) skips the LLM round-trip
+# entirely. Keyed by (sha256 of normalized text, PROMPT_VERSION, model).
+_extraction_cache: Dict[Tuple[str, str, str], Optional[List[CertificateEntry]]] = {}
+
+
+def _cache_key(normalized_text: str, model: str) -> Tuple[str, str, str]:
+    h = hashlib.sha256(normalized_text.encode()).hexdigest()
+    return (h, PROMPT_VERSION, model)
+
+
+def _call_openrouter(prompt: str, model: str = "openai/gpt-4o-mini") -> str:
+    """Call OpenRouter API with the given prompt.
+
+    The system prompt is a byte-identical module constant so provider-side
+    prefix caching (automatic on OpenAI routes for >1024-token prefixes)
+    applies across calls.
+    """
+    try:
+        response = client.chat.completions.create(
+            model=model,
+            messages=[
+                {"role": "system", "content": _SYSTEM_PROMPT},
                 {"role": "user", "content": prompt},
             ],
             temperature=0.1,
             max_tokens=3000,
         )
+        usage = getattr(response, "usage", None)
+        details = getattr(usage, "prompt_tokens_details", None)
+        if details is not None:
+            logger.info(
+                "Prompt cache: %s cached tokens", getattr(details, "cached_tokens", 0)
+            )
         return response.choices[0].message.content.strip()
     except Exception as e:
         raise ValueError(f"Error calling OpenRouter API: {str(e)}")
 
 
+def _find_balanced_json(text: str) -> Optional[str]:
+    """Locate the first balanced {...} or [...] slice in a single pass.
+
+    Replaces the greedy r'\\{.*\\}' DOTALL fallback, which backtracks
+    catastrophically on large malformed outputs; this walk is O(n) always.
+    """
+    start = None
+    depth = 0
+    in_string = False
+    escaped = False
+    opener = closer = ''
+    for i, ch in enumerate(text):
+        if start is None:
+            if ch in '{[':
+                start = i
+                opener, closer = ch, ('}' if ch == '{' else ']')
+                depth = 1
+            continue
+        if in_string:
+            if escaped:
+                escaped = False
+            elif ch == '\\':
+                escaped = True
+            elif ch == '"':
+                in_string = False
+            continue
+        if ch == '"':
+            in_string = True
+        elif ch == opener:
+            depth += 1
+        elif ch == closer:
+            depth -= 1
+            if depth == 0:
+                return text[start:i + 1]
+    return None
+
+
 def _extract_json_from_response(response: str) -> dict:
     """Extract JSON from the API response, handling markdown code blocks."""
-    # Remove markdown code blocks if present
     response = response.strip()
+
+    # Happy path: the model returned bare JSON
+    try:
+        return orjson.loads(response)
+    except orjson.JSONDecodeError:
+        pass
+
+    # Remove markdown code blocks if present
     if response.startswith("```"):
-        # Extract content between code blocks
         parts = response.split("```")
         if len(parts) >= 3:
             response = parts[1]
             # Remove language identifier if present
             if "\n" in response:
                 response = response.split("\n", 1)[1]
+        response = response.strip()
+        try:
+            return orjson.loads(response)
+        except orjson.JSONDecodeError:
+            pass
+
+    # Last resort: pull the first balanced JSON value out of surrounding text
+    candidate = _find_balanced_json(response)
+    if candidate is not None:
+        try:
+            return orjson.loads(candidate)
+        except orjson.JSONDecodeError:
+            pass
+    raise ValueError("Failed to parse JSON from response")
+
+
+def _entries_from_response(response: str) -> Optional[List[CertificateEntry]]:
+    """Parse the LLM JSON response into validated CertificateEntry objects.
+
+    Shared by the sync and async extraction paths.
+    """
+
+    data = _extract_json_from_response(response)
+    logger.info(f"Parsed JSON data type: {type(data)}")
     
-    # Remove any leading/trailing non-JSON text
-    response = response.strip()
+    # Handle both formats: direct array or wrapped in "certificates" key
+    certificates_list = None
+    if isinstance(data, list):
+        certificates_list = data
+        logger.info(f"Found direct array with {len(certificates_list)} entries")
+    elif isinstance(data, dict):
+        if "certificates" in data:
+            certificates_list = data["certificates"]
+            logger.info(f"Found certificates key with value type: {type(certificates_list)}")
+        else:
+            logger.warning(f"Dict response missing 'certificates' key. Keys: {list(data.keys())}")
+            # Try to find any array in the dict
+            for key, value in data.items():
+                if isinstance(value, list):
+                    certificates_list = value
+                    logger.info(f"Using array from key '{key}' with {len(certificates_list)} entries")
+                    break
     
-    try:
-        return json.loads(response)
-    except json.JSONDecodeError as e:
-        # Try to find JSON object in the response
-        json_match = re.search(r'\{.*\}', response, re.DOTALL)
-        if json_match:
-            try:
-                return json.loads(json_match.group(0))
-            except:
-                pass
-        raise ValueError(f"Failed to parse JSON from response: {str(e)}")
+    if certificates_list is None:
+        logger.warning("No certificates list found in response")
+        return None
+    
+    if not isinstance(certificates_list, list):
+        logger.warning(f"Certificates list is not a list, got: {type(certificates_list)}")
+        return None
+    
+    if len(certificates_list) == 0:
+        logger.info("Certificates list is empty - no certifications found")
+        return None
+    
+    logger.info(f"Processing {len(certificates_list)} certificate entries")
+    
+    entries = []
+    for idx, item in enumerate(certificates_list):
+        if not isinstance(item, dict):
+            logger.warning(f"Entry {idx} is not a dict, skipping")
+            continue
+
+        # Normalize keys once, then resolve each field from its alias table
+        # with a single short-circuiting scan
+        lowered = {k.lower(): v for k, v in item.items()}
+
+        def pick(field):
+            return next((lowered[a] for a in _FIELD_ALIASES[field] if lowered.get(a)), None)
+
+        # Extract and clean certificate_name (REQUIRED field)
+        certificate_name = pick("certificate_name")
+        if certificate_name:
+            certificate_name = str(certificate_name).strip()
+            # Remove common prefixes/suffixes that might have been included
+            certificate_name = _RE_CERT_PREFIX.sub('', certificate_name)
+            certificate_name = certificate_name.strip()
+            if not certificate_name or len(certificate_name) < 2:
+                certificate_name = None
+        else:
+            certificate_name = None
+        
+        # Skip entry if certificate_name is missing (required field)
+        if not certificate_name:
+            logger.warning(f"Skipping entry {idx+1}: missing required certificate_name")
+            continue
+        
+        # Extract and clean issuing_organization
+        issuing_organization = pick("issuing_organization")
+        if issuing_organization:
+            issuing_organization = str(issuing_organization).strip()
+            # Clean common prefixes
+            issuing_organization = _RE_ORG_PREFIX.sub('', issuing_organization)
+            issuing_organization = issuing_organization.strip()
+            if not issuing_organization or len(issuing_organization) < 2:
+                issuing_organization = None
+        else:
+            issuing_organization = None
+        
+        # Extract and normalize date_of_completion
+        date_of_completion = pick("date_of_completion")
+        if date_of_completion:
+            date_of_completion = _normalize_date(str(date_of_completion).strip())
+        else:
+            date_of_completion = None
+        
+        # Extract credential_id
+        credential_id = pick("credential_id")
+        if credential_id:
+            credential_id = str(credential_id).strip()
+            # Remove common prefixes
+            credential_id = _RE_ID_PREFIX.sub('', credential_id)
+            credential_id = credential_id.strip()
+            if not credential_id or len(credential_id) < 1:
+                credential_id = None
+        else:
+            credential_id = None
+        
+        # Extract credential_url (validate it's a URL)
+        credential_url = pick("credential_url")
+        if credential_url:
+            credential_url = str(credential_url).strip()
+            # If it doesn't start with http, try to add https://
+            if not _RE_URL_CHEAP.match(credential_url):
+                credential_url = f"https://{credential_url}"
+            # Validate it's a URL
+            parts = urlsplit(credential_url)
+            if parts.scheme not in ("http", "https") or not parts.netloc or "." not in parts.netloc:
+                credential_url = None
+            elif len(credential_url) < 10:  # Too short to be a valid URL
+                credential_url = None
+        else:
+            credential_url = None
+        
+        # Only add entry if we have at least certificate_name
+        if certificate_name:
+            # Fields were cleaned and validated above; model_construct skips
+            # a redundant pydantic validation pass per entry
+            entries.append(CertificateEntry.model_construct(
+                certificate_name=certificate_name,
+                issuing_organization=issuing_organization,
+                date_of_completion=date_of_completion,
+                credential_id=credential_id,
+                credential_url=credential_url,
+            ))
+            logger.info(f"Added certificate {idx+1}: {certificate_name} from {issuing_organization}")
+        else:
+            logger.warning(f"Skipping entry {idx+1}: missing certificate_name")
+    
+    if entries:
+        logger.info(f"Successfully extracted {len(entries)} certifications")
+        return entries
+    else:
+        logger.warning("No valid certificate entries created")
+        return None
 
 
 def extract_certifications(resume_text: str) -> Optional[List[CertificateEntry]]:
@@ -225,295 +580,118 @@ def extract_certifications(resume_text: str) -> Optional[List[CertificateEntry]]
     
     Returns None if no certifications found or if extraction fails.
     """
-    import logging
-    logger = logging.getLogger(__name__)
     
     if not resume_text or not resume_text.strip():
         logger.warning("Resume text is empty")
         return None
     
-    normalized_text = _normalize_text(resume_text)
+    # Prune before normalization: the heading regex needs line boundaries,
+    # which _normalize_text collapses
+    normalized_text = _normalize_text(_prune_to_cert_sections(resume_text))
     
-    # Limit text length to avoid token issues
-    if len(normalized_text) > 4000:
-        normalized_text = normalized_text[:4000] + "..."
+    # Limit prompt length by token count, at a deterministic boundary
+    tokens = _TOKEN_ENCODER.encode(normalized_text)
+    if len(tokens) > _MAX_PROMPT_TOKENS:
+        normalized_text = _TOKEN_ENCODER.decode(tokens[:_MAX_PROMPT_TOKENS])
     
+    # Identical input + prompt version + model: reuse the previous result
+    # and skip the API entirely
+    key = _cache_key(normalized_text, "openai/gpt-4o-mini")
+    if key in _extraction_cache:
+        logger.info("Extraction cache hit; skipping API call")
+        return _extraction_cache[key]
+
     logger.info(f"Extracting certifications from {len(normalized_text)} characters")
-    
-    prompt = f"""Extract ONLY certificate / certification / course completion details from the resume text below.
 
-RESUME TEXT:
-{normalized_text}
+    # All instructions live in the static system prompt; the user message is
+    # just the variable tail so the cached prefix stays byte-identical
+    prompt = f"RESUME TEXT:\n{normalized_text}"
 
-EXTRACTION INSTRUCTIONS:
+    try:
+        response = _call_openrouter(prompt, model="openai/gpt-4o-mini")
+        logger.info(f"OpenRouter response received: {len(response)} characters")
+        entries = _entries_from_response(response)
+        _extraction_cache[key] = entries
+        return entries
+    except ValueError as e:
+        logger.error(f"JSON parsing error: {str(e)}")
+        logger.error(f"Response was: {response[:500] if 'response' in locals() else 'N/A'}")
+        return None
+    except Exception as e:
+        logger.error(f"Error extracting certifications: {str(e)}", exc_info=True)
+        return None
 
-1. SCAN FOR CERTIFICATE SECTIONS:
-   Look for headings like: "Certificates", "Certifications", "Licenses & Certifications", "Professional Certifications", "Courses & Certifications", "Online Certifications", "Training & Certifications", "Additional Qualifications"
 
-2. EXTRACT EACH CERTIFICATE:
-   For each certificate found, extract:
-   
-   a) certificate_name (REQUIRED):
-      - Full name of the certification or course
-      - Examples: "AWS Certified Solutions Architect", "Machine Learning by Stanford", "Microsoft Azure Fundamentals"
-      - Preserve exact name as written
-   
-   b) issuing_organization (OPTIONAL):
-      - Platform, company, or authority that issued the certificate
-      - Examples: "AWS", "Coursera", "Microsoft", "Google", "Stanford University", "Udemy", "NPTEL"
-      - Extract from context if not explicitly stated
-      - If unclear, use null
-   
-   c) date_of_completion (OPTIONAL):
-      - Completion date or issue date
-      - Normalize to MM/YYYY format
-      - Examples: "01/2023", "03/2022", "12/2021"
-      - If only year is found, use "01/YYYY"
-      - If not found, use null
-   
-   d) credential_id (OPTIONAL):
-      - License number, certificate ID, or credential identifier
-      - Examples: "AZ-900", "AWS-12345", "License #123456"
-      - Only extract if explicitly mentioned
-      - If not found, use null
-   
-   e) credential_url (OPTIONAL):
-      - Verification link or certificate URL
-      - Must be a valid URL (starts with http:// or https://)
-      - Examples: "https://www.coursera.org/verify/ABC123", "https://credly.com/badges/xyz"
-      - If not found, use null
 
-3. EXCLUSION RULES:
-   - DO NOT extract internships, projects, work experience, or education
-   - DO NOT extract skills or technical proficiencies
-   - DO NOT extract workshops unless explicitly titled as "Certificate"
-   - Only extract items that are clearly certificates, certifications, licenses, or course completions
+async def _call_openrouter_async(prompt: str, model: str = "openai/gpt-4o-mini") -> str:
+    """Async counterpart of _call_openrouter using the non-blocking client."""
+    try:
+        response = await aclient.chat.completions.create(
+            model=model,
+            messages=[
+                {"role": "system", "content": _SYSTEM_PROMPT},
+                {"role": "user", "content": prompt},
+            ],
+            temperature=0.1,
+            max_tokens=3000,
+        )
+        return response.choices[0].message.content.strip()
+    except Exception as e:
+        raise ValueError(f"Error calling OpenRouter API: {str(e)}")
+
 
-4. OUTPUT FORMAT:
-   Return STRICT JSON only (no markdown, no explanations):
-   {{
-     "certificates": [
-       {{
-         "certificate_name": "AWS Certified Solutions Architect",
-         "issuing_organization": "AWS",
-         "date_of_completion": "03/2023",
-         "credential_id": "AWS-12345",
-         "credential_url": "https://www.credly.com/badges/abc123"
-       }},
-       {{
-         "certificate_name": "Machine Learning",
-         "issuing_organization": "Coursera",
-         "date_of_completion": "01/2022",
-         "credential_id": null,
-         "credential_url": "https://www.coursera.org/verify/xyz789"
-       }}
-     ]
-   }}
+async def extract_certifications_async(resume_text: str) -> Optional[List[CertificateEntry]]:
+    """Async variant of extract_certifications.
 
-5. VALIDATION:
-   - certificate_name is REQUIRED for each entry
-   - If certificate_name is missing, skip that entry
-   - All other fields can be null
-   - If no certificates found, return: {{"certificates": []}}
-   - Return ONLY valid JSON (no markdown code blocks, no explanations)
+    Awaits the LLM round-trip instead of blocking the event loop; parsing of
+    the response is shared with the sync path.
+    """
 
-EXAMPLES OF VALID CERTIFICATES:
-✓ "AWS Certified Solutions Architect - Associate" → certificate
-✓ "Google Cloud Professional Cloud Architect" → certificate
-✓ "Machine Learning by Stanford (Coursera)" → certificate
-✓ "Microsoft Azure Fundamentals (AZ-900)" → certificate
-✓ "PMP Certification" → certificate
-✓ "Oracle Certified Java Developer" → certificate
+    if not resume_text or not resume_text.strip():
+        logger.warning("Resume text is empty")
+        return None
 
-EXAMPLES OF INVALID (DO NOT EXTRACT):
-✗ "Software Developer Intern at Google" → internship
-✗ "Built a web application using React" → project
-✗ "Bachelor of Science in Computer Science" → education
-✗ "5 years of experience in Python" → experience/skill
+    # Prune before normalization: the heading regex needs line boundaries,
+    # which _normalize_text collapses
+    normalized_text = _normalize_text(_prune_to_cert_sections(resume_text))
+
+    # Limit prompt length by token count, at a deterministic boundary
+    tokens = _TOKEN_ENCODER.encode(normalized_text)
+    if len(tokens) > _MAX_PROMPT_TOKENS:
+        normalized_text = _TOKEN_ENCODER.decode(tokens[:_MAX_PROMPT_TOKENS])
+
+    key = _cache_key(normalized_text, "openai/gpt-4o-mini")
+    if key in _extraction_cache:
+        logger.info("Extraction cache hit; skipping API call")
+        return _extraction_cache[key]
+
+    prompt = f"RESUME TEXT:\n{normalized_text}"
 
-Return ONLY the JSON object with certificates array."""
-    
     try:
-        response = _call_openrouter(prompt, model="openai/gpt-4o-mini")
-        logger.info(f"OpenRouter response received: {len(response)} characters")
-        
-        data = _extract_json_from_response(response)
-        logger.info(f"Parsed JSON data type: {type(data)}")
-        
-        # Handle both formats: direct array or wrapped in "certificates" key
-        certificates_list = None
-        if isinstance(data, list):
-            certificates_list = data
-            logger.info(f"Found direct array with {len(certificates_list)} entries")
-        elif isinstance(data, dict):
-            if "certificates" in data:
-                certificates_list = data["certificates"]
-                logger.info(f"Found certificates key with value type: {type(certificates_list)}")
-            else:
-                logger.warning(f"Dict response missing 'certificates' key. Keys: {list(data.keys())}")
-                # Try to find any array in the dict
-                for key, value in data.items():
-                    if isinstance(value, list):
-                        certificates_list = value
-                        logger.info(f"Using array from key '{key}' with {len(certificates_list)} entries")
-                        break
-        
-        if certificates_list is None:
-            logger.warning("No certificates list found in response")
-            return None
-        
-        if not isinstance(certificates_list, list):
-            logger.warning(f"Certificates list is not a list, got: {type(certificates_list)}")
-            return None
-        
-        if len(certificates_list) == 0:
-            logger.info("Certificates list is empty - no certifications found")
-            return None
-        
-        logger.info(f"Processing {len(certificates_list)} certificate entries")
-        
-        entries = []
-        for idx, item in enumerate(certificates_list):
-            if not isinstance(item, dict):
-                logger.warning(f"Entry {idx} is not a dict, skipping")
-                continue
-            
-            # Extract and clean certificate_name (REQUIRED field)
-            certificate_name = (
-                item.get("certificate_name") or 
-                item.get("name") or 
-                item.get("certification") or 
-                item.get("title") or
-                item.get("certificate")
-            )
-            if certificate_name:
-                certificate_name = str(certificate_name).strip()
-                # Remove common prefixes/suffixes that might have been included
-                certificate_name = re.sub(r'^(certificate|certification|cert):\s*', '', certificate_name, flags=re.IGNORECASE)
-                certificate_name = certificate_name.strip()
-                if not certificate_name or len(certificate_name) < 2:
-                    certificate_name = None
-            else:
-                certificate_name = None
-            
-            # Skip entry if certificate_name is missing (required field)
-            if not certificate_name:
-                logger.warning(f"Skipping entry {idx+1}: missing required certificate_name")
-                continue
-            
-            # Extract and clean issuing_organization
-            issuing_organization = (
-                item.get("issuing_organization") or 
-                item.get("organization") or 
-                item.get("issuer") or 
-                item.get("platform") or
-                item.get("issued_by") or
-                item.get("provider")
-            )
-            if issuing_organization:
-                issuing_organization = str(issuing_organization).strip()
-                # Clean common prefixes
-                issuing_organization = re.sub(r'^(issued by|from|by):\s*', '', issuing_organization, flags=re.IGNORECASE)
-                issuing_organization = issuing_organization.strip()
-                if not issuing_organization or len(issuing_organization) < 2:
-                    issuing_organization = None
-            else:
-                issuing_organization = None
-            
-            # Extract and normalize date_of_completion
-            date_of_completion = (
-                item.get("date_of_completion") or 
-                item.get("date") or 
-                item.get("completion_date") or 
-                item.get("issue_date") or
-                item.get("issued_date") or
-                item.get("earned_date") or
-                item.get("completed")
-            )
-            if date_of_completion:
-                date_of_completion = _normalize_date(str(date_of_completion).strip())
-            else:
-                date_of_completion = None
-            
-            # Extract credential_id
-            credential_id = (
-                item.get("credential_id") or 
-                item.get("credential") or 
-                item.get("id") or 
-                item.get("license_id") or
-                item.get("certificate_id") or
-                item.get("credential_number") or
-                item.get("license_number")
-            )
-            if credential_id:
-                credential_id = str(credential_id).strip()
-                # Remove common prefixes
-                credential_id = re.sub(r'^(id|credential|license|certificate|number)[:\s#]*', '', credential_id, flags=re.IGNORECASE)
-                credential_id = credential_id.strip()
-                if not credential_id or len(credential_id) < 1:
-                    credential_id = None
-            else:
-                credential_id = None
-            
-            # Extract credential_url (validate it's a URL)
-            credential_url = (
-                item.get("credential_url") or 
-                item.get("url") or 
-                item.get("link") or 
-                item.get("verification_url") or
-                item.get("certificate_url") or
-                item.get("verification_link")
-            )
-            if credential_url:
-                credential_url = str(credential_url).strip()
-                # Validate it's a URL
-                url_pattern = re.compile(
-                    r'^https?://'  # http:// or https://
-                    r'(?:(?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+[A-Z]{2,6}\.?|'  # domain...
-                    r'localhost|'  # localhost...
-                    r'\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})'  # ...or ip
-                    r'(?::\d+)?'  # optional port
-                    r'(?:/?|[/?]\S+)$', re.IGNORECASE)
-                
-                if not url_pattern.match(credential_url):
-                    # If it doesn't start with http, try to add https://
-                    if not credential_url.startswith(('http://', 'https://')):
-                        credential_url = f"https://{credential_url}"
-                        if not url_pattern.match(credential_url):
-                            credential_url = None
-                    else:
-                        credential_url = None
-                
-                if credential_url and len(credential_url) < 10:  # Too short to be a valid URL
-                    credential_url = None
-            else:
-                credential_url = None
-            
-            # Only add entry if we have at least certificate_name
-            if certificate_name:
-                entries.append(CertificateEntry(
-                    certificate_name=certificate_name,
-                    issuing_organization=issuing_organization,
-                    date_of_completion=date_of_completion,
-                    credential_id=credential_id,
-                    credential_url=credential_url,
-                ))
-                logger.info(f"Added certificate {idx+1}: {certificate_name} from {issuing_organization}")
-            else:
-                logger.warning(f"Skipping entry {idx+1}: missing certificate_name")
-        
-        if entries:
-            logger.info(f"Successfully extracted {len(entries)} certifications")
-            return entries
-        else:
-            logger.warning("No valid certificate entries created")
-            return None
-            
+        response = await _call_openrouter_async(prompt, model="openai/gpt-4o-mini")
+        entries = _entries_from_response(response)
+        _extraction_cache[key] = entries
+        return entries
     except ValueError as e:
         logger.error(f"JSON parsing error: {str(e)}")
-        logger.error(f"Response was: {response[:500] if 'response' in locals() else 'N/A'}")
         return None
     except Exception as e:
         logger.error(f"Error extracting certifications: {str(e)}", exc_info=True)
         return None
 
+
+async def extract_certifications_batch(
+    resume_texts: List[str], max_concurrency: int = 8
+) -> List[Optional[List[CertificateEntry]]]:
+    """Extract certifications for many resumes concurrently.
+
+    Bounded by a semaphore so N resumes complete in roughly max(T_i) instead
+    of sum(T_i) without flooding the API.
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def _extract_one(text: str) -> Optional[List[CertificateEntry]]:
+        async with semaphore:
+            return await extract_certifications_async(text)
+
+    return list(await asyncio.gather(*(_extract_one(t) for t in resume_texts)))
@@ -3,8 +3,9 @@ from __future__ import annotations
 import os
 import tempfile
 from typing import Tuple
-from uuid import uuid4
+from uuid import UUID, uuid4
 
+import aiofiles.tempfile
 from fastapi import UploadFile
 
 from . import text_extraction_service, nlp_parsing_service
@@ -15,22 +16,37 @@ from ..storage import storage
 UPLOAD_DIR = os.path.join(tempfile.gettempdir(), "resume_uploads")
 os.makedirs(UPLOAD_DIR, exist_ok=True)
 
+# Stream uploads to disk in chunks instead of buffering the whole PDF
+CHUNK_SIZE = 64 * 1024
+MAX_UPLOAD_SIZE = 10_000_000  # 10 MB
 
-async def handle_resume_upload(file: UploadFile, template_id: str) -> Tuple[str, ResumeData]:
+
+async def handle_resume_upload(file: UploadFile, template_id: str) -> Tuple[UUID, ResumeData]:
     """Save uploaded PDF, extract text (with OCR fallback), parse, and persist resume.
 
     Returns a tuple of (resume_id, parsed_resume_data).
     """
     tmp_path = None
     try:
-        # Persist uploaded file to a temporary location
+        # Persist uploaded file to a temporary location, streaming in chunks
+        # so peak memory stays bounded regardless of upload size. Writes go
+        # through aiofiles so concurrent uploads overlap on I/O instead of
+        # blocking the event loop on slow disks.
         suffix = os.path.splitext(file.filename or "resume.pdf")[1] or ".pdf"
-        with tempfile.NamedTemporaryFile(delete=False, dir=UPLOAD_DIR, suffix=suffix) as tmp:
-            contents = await file.read()
-            if not contents:
-                raise ValueError("Uploaded file is empty")
-            tmp.write(contents)
+        async with aiofiles.tempfile.NamedTemporaryFile(
+            "wb", delete=False, dir=UPLOAD_DIR, suffix=suffix
+        ) as tmp:
+            # Record the path before writing anything so the finally block
+            # also removes files from rejected (oversize/empty) uploads
             tmp_path = tmp.name
+            total_size = 0
+            while chunk := await file.read(CHUNK_SIZE):
+                total_size += len(chunk)
+                if total_size > MAX_UPLOAD_SIZE:
+                    raise ValueError("Uploaded file is too large (max 10 MB)")
+                await tmp.write(chunk)
+            if total_size == 0:
+                raise ValueError("Uploaded file is empty")
 
         # Extract raw text from the PDF (text-based or scanned)
         raw_text = text_extraction_service.extract_text_with_ocr_fallback(tmp_path)
@@ -46,13 +62,13 @@ async def handle_resume_upload(file: UploadFile, template_id: str) -> Tuple[str,
         stored = StoredResume(resume_id=resume_id, template_id=template_id, data=resume_data)
         storage.save_resume(stored)
 
-        # Convert UUID to string and ensure resume_data is serializable
-        return str(resume_id), resume_data
-    except Exception as e:
-        # Clean up temp file on error
-        if tmp_path and os.path.exists(tmp_path):
+        return resume_id, resume_data
+    finally:
+        # The temp file is only needed for text extraction; remove it on
+        # success and failure alike so UPLOAD_DIR stays bounded instead of
+        # accumulating one file per upload
+        if tmp_path:
             try:
                 os.unlink(tmp_path)
-            except:
+            except OSError:
                 pass
-        raise
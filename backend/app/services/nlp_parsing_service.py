@@ -1,12 +1,21 @@
 from __future__ import annotations
 
-import json
+import hashlib
+import logging
 import os
 import re
-from typing import Dict, Optional
-
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Dict, Optional, Tuple
+
+import httpx
+import orjson
+import tiktoken
 from dotenv import load_dotenv
 from openai import OpenAI
+from pydantic import TypeAdapter
 
 from ..models import (
     Contacts,
@@ -22,22 +31,106 @@ from . import section_detection_service, certification_extraction_service
 # Load environment variables
 load_dotenv()
 
+# Logging is configured centrally in main.py (queue handler + listener);
+# calling basicConfig here would install a root handler first and turn
+# main.py's configuration into a no-op
+logger = logging.getLogger(__name__)
+
 # Initialize OpenRouter client
 OPENROUTER_API_KEY = os.getenv("OPENROUTER_API_KEY")
 if not OPENROUTER_API_KEY:
     raise ValueError("OPENROUTER_API_KEY not found in environment variables")
 
+# Shared transport settings: keep-alive pooling plus HTTP/2 multiplexing so
+# the concurrent section parsers reuse warm connections instead of paying a
+# TCP+TLS handshake per call. The one client is thread-safe and shared by
+# every parser in this module.
+_HTTP_LIMITS = httpx.Limits(max_keepalive_connections=32, max_connections=64)
+
 client = OpenAI(
     base_url="https://openrouter.ai/api/v1",
     api_key=OPENROUTER_API_KEY,
+    http_client=httpx.Client(http2=True, limits=_HTTP_LIMITS, timeout=60.0),
 )
 
 
 # Regex patterns for validation
 EMAIL_REGEX = re.compile(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}')
 PHONE_REGEX = re.compile(r'(\+?\d[\d\s().-]{7,}\d)')
-POSTCODE_INDIA = re.compile(r'\b\d{6}\b')
-POSTCODE_USA = re.compile(r'\b\d{5}\b')
+# India (6 digits) or USA (5 digits), anchored so "123456abc" is rejected
+POSTCODE_RE = re.compile(r'\A(?:\d{5}|\d{6})\Z')
+
+# Hot-path patterns compiled once at import; the module-level pattern objects
+# skip the re-cache lookup every call site used to pay
+PHONE_CLEAN_RE = re.compile(r'[\s\-()]')
+PHONE_VALID_RE = re.compile(r'^\+?\d{10,15}$')
+NAME_WORD_RE = re.compile(r"^[A-Za-z\-']+$")
+# A header line of 2-4 capitalized words is a strong name candidate
+NAME_LINE_RE = re.compile(r'^\s*([A-Z][a-z]+(?:\s+[A-Z][a-z]+){1,3})\s*$', re.MULTILINE)
+# Experience-description cleanup as one alternation: junk characters,
+# bullet markers and whitespace runs are all handled in a single traversal
+# by dispatching on the matched group, instead of four separate sub passes
+# per entry
+# Quick membership test for anything the cleaner would actually rewrite;
+# modern models usually return already-clean text, so one failed search
+# lets _clean_description skip the rewriting pass entirely
+DESC_NEEDS_CLEAN_RE = re.compile(
+    r'[^\w\s\.,;:!?\-()\[\]{}\n•\*]'
+    r'|\n\s*[•\*\-]'
+    r'|\n{3,}'
+    r'|[ \t]{2,}'
+    r'|[\t\r]'
+)
+# The junk alternative swallows adjacent horizontal whitespace so a token
+# between spaces ("stuff \ud83d\ude80 fast") collapses to a single space, matching
+# the baseline's junk-removal-then-whitespace-collapse order
+DESC_CLEAN_ALL_RE = re.compile(
+    r'(?P<junk>[ \t\r]*[^\w\s\.,;:!?\-()\[\]{}\n\u2022\*]+[ \t\r]*)'
+    r'|(?P<bullet>\n\s*[\u2022\*\-]\s*)'
+    r'|(?P<nl>\n{3,})'
+    r'|(?P<sp>[ \t\r]+)'
+)
+_DESC_REPLACEMENTS = {'bullet': '\n\u2022 ', 'nl': '\n\n', 'sp': ' '}
+
+
+def _desc_replace(m: "re.Match[str]") -> str:
+    if m.lastgroup == 'junk':
+        # Junk flanked by whitespace leaves one space behind; junk fused
+        # into a word ("stuff\ud83d\ude80fast") is dropped outright
+        text = m.group(0)
+        return ' ' if text[0] in ' \t\r' or text[-1] in ' \t\r' else ''
+    return _DESC_REPLACEMENTS[m.lastgroup]
+
+
+def _clean_description(description: str) -> Optional[str]:
+    """Clean an experience description in one pass: strip emojis/unusual
+    symbols, normalize bullets to '\u2022 ', and collapse whitespace runs."""
+    if not DESC_NEEDS_CLEAN_RE.search(description):
+        return description.strip() or None
+    cleaned = DESC_CLEAN_ALL_RE.sub(_desc_replace, description).strip()
+    return cleaned or None
+YEAR_RE = re.compile(r'\b(19|20)\d{2}\b')
+SCHOOL_PREFIX_RE = re.compile(r'^(university|college|school|institute)[:\s]*', re.IGNORECASE)
+START_DATE_PREFIX_RE = re.compile(r'^(from|start|since)[:\s]*', re.IGNORECASE)
+END_DATE_PREFIX_RE = re.compile(r'^(to|end|until|graduated|completed)[:\s]*', re.IGNORECASE)
+
+# Prompt truncation is token-based (same encoder family as the models used),
+# so the cap means the same thing for dense Unicode text as for ASCII
+_TOKEN_ENCODER = tiktoken.encoding_for_model("gpt-4o-mini")
+
+
+def _truncate_tokens(text: str, max_tokens: int) -> str:
+    """Cap text at max_tokens, appending '...' when truncated.
+
+    English averages ~4 characters per token, so anything comfortably under
+    that bound skips the encode entirely.
+    """
+    if len(text) < 4 * max_tokens:
+        return text
+    ids = _TOKEN_ENCODER.encode(text)
+    if len(ids) <= max_tokens:
+        return text
+    return _TOKEN_ENCODER.decode(ids[:max_tokens]) + "..."
 
 # Common job title keywords to avoid confusing with names
 JOB_TITLE_KEYWORDS = [
@@ -52,21 +145,75 @@ ORG_KEYWORDS = [
     'ltd', 'llc', 'company', 'technologies', 'solutions', 'systems'
 ]
 
-
+# All name-disqualifying keywords as one alternation so _is_likely_name scans
+# the candidate once instead of once per keyword
+NAME_BLOCKLIST_RE = re.compile('|'.join(re.escape(k) for k in JOB_TITLE_KEYWORDS + ORG_KEYWORDS))
+
+# Used by the summary scrub's name-line filter: frozenset gives O(1) word
+# membership, and the job keywords collapse into one substring alternation
+COMMON_WORDS = frozenset([
+    'the', 'and', 'or', 'of', 'in', 'at', 'to', 'for', 'with', 'on', 'is',
+    'are', 'was', 'were', 'be', 'been', 'have', 'has', 'had', 'do', 'does',
+    'did', 'will', 'would', 'should', 'could', 'may', 'might', 'must', 'can',
+])
+JOB_WORDS_RE = re.compile('|'.join(JOB_TITLE_KEYWORDS))
+
+# Cheap pre-filter shared by the section parsers: a section with almost no
+# text, or no alphabetic token of 3+ letters, has nothing an LLM round trip
+# could extract
+_ALPHA_TOKEN_RE = re.compile(r'[A-Za-z]{3,}')
+_MIN_SECTION_CHARS = 10
+
+
+def _has_parseable_content(text: str) -> bool:
+    """Return True if text is worth sending to the LLM at all."""
+    return (len(text.strip()) >= _MIN_SECTION_CHARS
+            and _ALPHA_TOKEN_RE.search(text) is not None)
+
+
+# Lone-CR normalization plus common OCR character fixes in one translate
+# table (CRLF is collapsed separately so it maps to a single newline).
+# Curly quotes map to their ASCII forms so apostrophes in names (O'Brien)
+# satisfy NAME_WORD_RE regardless of how the PDF encoded them.
+# Deliberately does NOT map 0 -> O: that corrupted every phone number,
+# postcode and year before the regex fallbacks ever saw them, forcing
+# redundant LLM round trips. OCR zeros are fixed only inside alphabetic
+# runs of name candidates instead.
+_NORMALIZE_TABLE = str.maketrans({
+    '\r': '\n', '|': 'I',
+    '‘': "'", '’': "'",   # curly single quotes
+    '“': '"', '”': '"',   # curly double quotes
+})
+_OCR_ZERO_RE = re.compile(r'(?<=[A-Za-z])0(?=[A-Za-z])')
+# Space/tab runs and 3+ newline runs in one alternation; the callback decides
+# which replacement applies from the first matched character
+_WS_COLLAPSE_RE = re.compile(r'[ \t]+|\n{3,}')
+
+
+def _ws_collapse_repl(match: re.Match) -> str:
+    return '\n\n' if match.group(0)[0] == '\n' else ' '
+
+
+@lru_cache(maxsize=4096)
 def _normalize_text(text: str) -> str:
     """Normalize and clean extracted text while preserving structure (keep newlines).
-    
+
     We must preserve newlines so section_detection_service can find headings.
+
+    Memoized: parse_resume normalizes the full document and section parsers
+    re-normalize their (identical) slices, so repeated inputs hit the cache.
+    Strings are immutable, so caching on the value is safe.
     """
-    # Normalize Windows/Mac line endings to \n
-    text = text.replace('\r\n', '\n').replace('\r', '\n')
-    # Collapse excessive spaces but keep newlines
-    text = re.sub(r'[ \t]+', ' ', text)
-    # Collapse more than two consecutive newlines to exactly two
-    text = re.sub(r'\n{3,}', '\n\n', text)
-    # Fix common OCR errors
-    text = text.replace('|', 'I').replace('0', 'O')  # Common OCR mistakes
-    return text.strip()
+    if len(text) < 32:
+        # Too short to be worth a cache slot; normalize inline
+        return _WS_COLLAPSE_RE.sub(
+            _ws_collapse_repl, text.replace('\r\n', '\n').translate(_NORMALIZE_TABLE)
+        ).strip()
+    # Line endings and OCR fixes in two C-level passes, then one combined
+    # whitespace sweep — instead of four replaces plus two regex passes,
+    # each of which re-walked and re-allocated the full document
+    text = text.replace('\r\n', '\n').translate(_NORMALIZE_TABLE)
+    return _WS_COLLAPSE_RE.sub(_ws_collapse_repl, text).strip()
 
 
 def _validate_email(email: Optional[str]) -> Optional[str]:
@@ -79,16 +226,17 @@ def _validate_email(email: Optional[str]) -> Optional[str]:
     return None
 
 
+def _is_valid_cleaned_phone(cleaned: str) -> bool:
+    """Check an already-cleaned phone number (at least 10 digits)."""
+    return bool(PHONE_VALID_RE.match(cleaned))
+
+
 def _validate_phone(phone: Optional[str]) -> Optional[str]:
     """Validate and clean phone number."""
     if not phone:
         return None
-    # Remove spaces, dashes, brackets
-    cleaned = re.sub(r'[\s\-()]', '', phone.strip())
-    # Check if it's a valid phone number (at least 10 digits)
-    if re.match(r'^\+?\d{10,15}$', cleaned):
-        return cleaned
-    return None
+    cleaned = _clean_phone(phone)
+    return cleaned if _is_valid_cleaned_phone(cleaned) else None
 
 
 def _split_name(full_name: Optional[str]) -> tuple[Optional[str], Optional[str]]:
@@ -118,45 +266,40 @@ def _split_name(full_name: Optional[str]) -> tuple[Optional[str], Optional[str]]
 
 def _is_likely_name(text: str) -> bool:
     """Check if text is likely a person name (not job title or organization)."""
-    text_lower = text.lower()
-    
-    # Check if it contains job title keywords
-    for keyword in JOB_TITLE_KEYWORDS:
-        if keyword in text_lower:
-            return False
-    
-    # Check if it contains organization keywords
-    for keyword in ORG_KEYWORDS:
-        if keyword in text_lower:
-            return False
-    
+    # One linear scan for any job-title or organization keyword instead of
+    # 29 sequential substring searches over the candidate
+    if NAME_BLOCKLIST_RE.search(text.lower()):
+        return False
+
     # Check if it's mostly alphabetic (names should be)
     words = text.split()
     if not words:
         return False
-    
+
     # All words should be alphabetic (allow hyphens and apostrophes)
-    for word in words:
-        if not re.match(r'^[A-Za-z\-\']+$', word):
-            return False
-    
-    return True
+    return all(NAME_WORD_RE.match(word) for word in words)
 
 
 def _clean_phone(phone: str) -> str:
     """Clean phone number: remove spaces, dashes, brackets."""
-    return re.sub(r'[\s\-()]', '', phone.strip())
-
-
-def _call_openrouter(prompt: str, model: str = "openai/gpt-4.1-mini") -> str:
-    """Call OpenRouter API with the given prompt."""
-    try:
-        response = client.chat.completions.create(
-            model=model,
-            messages=[
-                {
-                    "role": "system",
-                    "content": """You are an advanced Resume Parsing AI that extracts structured data from ANY type of resume:
+    return PHONE_CLEAN_RE.sub('', phone.strip())
+
+
+# Exact-key cache of raw LLM responses keyed by (prompt digest, model).
+# Re-parsing the same resume (or identical section text across resumes) hits
+# here in microseconds instead of a multi-second network round trip. LRU
+# with a fixed cap so a long-running worker can't grow it without bound;
+# like the resume store itself, it is in-process only.
+_LLM_CACHE_MAX_ENTRIES = 1024
+_llm_response_cache: "OrderedDict[Tuple[str, str], str]" = OrderedDict()
+# The section parsers hit the cache from pool threads; move_to_end racing
+# popitem on an unguarded OrderedDict can corrupt it or raise KeyError
+_llm_cache_lock = threading.Lock()
+
+# Shared system message for every parsing call. Module-level so the bytes
+# sent are identical across calls — the provider's prompt-prefix cache keys
+# on exact byte equality, so a stable prefix gets the cached-KV discount.
+_SYSTEM_PROMPT = """You are an advanced Resume Parsing AI that extracts structured data from ANY type of resume:
 - ATS-friendly text resumes
 - Design resumes (tables, columns, icons)
 - Scanned resumes (OCR output)
@@ -173,22 +316,116 @@ RULES:
 - Return ONLY valid JSON (no markdown, no explanations, no comments)
 
 If OCR text contains noise, correct obvious errors logically.
-If multiple resumes appear, extract only the primary one.""",
-                },
+If multiple resumes appear, extract only the primary one."""
+
+# System message sent as a content part with an explicit cache_control
+# breakpoint. OpenAI-routed models cache prefixes implicitly and ignore the
+# marker; Anthropic-routed models only cache what is marked, so this keeps
+# the shared instructions cached (~10x cheaper input tokens) regardless of
+# where OpenRouter routes the call.
+_SYSTEM_MESSAGE = {
+    "role": "system",
+    "content": [
+        {
+            "type": "text",
+            "text": _SYSTEM_PROMPT,
+            "cache_control": {"type": "ephemeral"},
+        }
+    ],
+}
+
+
+def _call_openrouter(
+    prompt: str,
+    model: str = "openai/gpt-4.1-mini",
+    max_tokens: int = 2000,
+    response_format: Optional[dict] = None,
+) -> str:
+    """Call OpenRouter API with the given prompt.
+
+    Responses are cached by prompt hash, so identical prompts are answered
+    locally without an API call. JSON mode is forced by default (callers can
+    pass a json_schema response_format for constrained decoding instead), so
+    the model cannot wrap the payload in markdown fences or prose.
+    """
+    # blake2b is faster than sha256 at prompt sizes and 16 bytes is plenty
+    cache_key = (hashlib.blake2b(prompt.encode(), digest_size=16).hexdigest(), model)
+    with _llm_cache_lock:
+        cached = _llm_response_cache.get(cache_key)
+        if cached is not None:
+            _llm_response_cache.move_to_end(cache_key)
+    if cached is not None:
+        return cached
+    try:
+        response = client.chat.completions.create(
+            model=model,
+            messages=[
+                _SYSTEM_MESSAGE,
                 {"role": "user", "content": prompt},
             ],
             temperature=0.1,
-            max_tokens=2000,  # Limit tokens to avoid 402 Payment Required error
+            max_tokens=max_tokens,  # Limit tokens to avoid 402 Payment Required error
+            response_format=response_format or {"type": "json_object"},
         )
-        return response.choices[0].message.content.strip()
+        result = response.choices[0].message.content.strip()
     except Exception as e:
         raise ValueError(f"Error calling OpenRouter API: {str(e)}")
+    with _llm_cache_lock:
+        _llm_response_cache[cache_key] = result
+        if len(_llm_response_cache) > _LLM_CACHE_MAX_ENTRIES:
+            _llm_response_cache.popitem(last=False)
+    return result
+
+
+def _slice_first_json_object(text: str) -> Optional[str]:
+    """Return the first balanced {...} slice in a single pass.
+
+    Replaces the greedy r'\\{.*\\}' DOTALL rescue, which backtracks over the
+    whole response to maximize its match and breaks on braces inside string
+    values; this walk is O(n) and string-aware.
+    """
+    start = None
+    depth = 0
+    in_string = False
+    escaped = False
+    for i, ch in enumerate(text):
+        if start is None:
+            if ch == '{':
+                start = i
+                depth = 1
+            continue
+        if in_string:
+            if escaped:
+                escaped = False
+            elif ch == '\\':
+                escaped = True
+            elif ch == '"':
+                in_string = False
+            continue
+        if ch == '"':
+            in_string = True
+        elif ch == '{':
+            depth += 1
+        elif ch == '}':
+            depth -= 1
+            if depth == 0:
+                return text[start:i + 1]
+    return None
 
 
 def _extract_json_from_response(response: str) -> dict:
     """Extract JSON from the API response, handling markdown code blocks."""
-    # Remove markdown code blocks if present
     response = response.strip()
+
+    # JSON mode is forced in _call_openrouter, so this parse succeeds on the
+    # primary path; the fence/rescue handling below only runs for models
+    # that ignore response_format
+    try:
+        return orjson.loads(response)
+    except orjson.JSONDecodeError:
+        pass
+
+    # Remove markdown code blocks if present
     if response.startswith("```"):
         # Extract content between code blocks
         parts = response.split("```")
@@ -200,105 +437,93 @@ def _extract_json_from_response(response: str) -> dict:
     
     # Remove any leading/trailing non-JSON text
     response = response.strip()
-    
+
     try:
-        return json.loads(response)
-    except json.JSONDecodeError as e:
+        return orjson.loads(response)
+    except orjson.JSONDecodeError as e:
         # Try to find JSON object in the response
-        json_match = re.search(r'\{.*\}', response, re.DOTALL)
-        if json_match:
+        json_slice = _slice_first_json_object(response)
+        if json_slice:
             try:
-                return json.loads(json_match.group(0))
-            except:
+                return orjson.loads(json_slice)
+            except orjson.JSONDecodeError:
                 pass
         raise ValueError(f"Failed to parse JSON from response: {str(e)}")
 
 
-def _extract_email_fallback(text: str) -> Optional[str]:
-    """Fallback regex-based email extraction from full text (prioritizing header region)."""
-    # First try header region (first 50 lines)
-    header_lines = text.splitlines()[:50]
-    header_text = "\n".join(header_lines)
-    
-    matches = EMAIL_REGEX.findall(header_text)
-    if matches:
-        # Prefer personal emails (gmail, outlook, yahoo, etc.)
-        personal_domains = ['gmail', 'outlook', 'yahoo', 'hotmail', 'icloud', 'protonmail']
-        for email in matches:
-            email_lower = email.lower()
-            if any(domain in email_lower for domain in personal_domains):
-                return email.lower()
-        # Return first match if no personal email found
-        return matches[0].lower()
-    
-    # If not found in header, search full text
-    all_matches = EMAIL_REGEX.findall(text)
-    if all_matches:
-        # Prefer personal emails
-        personal_domains = ['gmail', 'outlook', 'yahoo', 'hotmail', 'icloud', 'protonmail']
-        for email in all_matches:
-            email_lower = email.lower()
-            if any(domain in email_lower for domain in personal_domains):
-                return email.lower()
-        # Return first match if no personal email found
-        return all_matches[0].lower()
-    
-    return None
-
-
-def _extract_phone_fallback(text: str) -> Optional[str]:
-    """Fallback regex-based phone extraction from full text (prioritizing header region)."""
-    # First try header region (first 50 lines)
-    header_lines = text.splitlines()[:50]
-    header_text = "\n".join(header_lines)
-    
-    matches = PHONE_REGEX.findall(header_text)
-    if matches:
-        # Clean and validate first match
-        phone = _clean_phone(matches[0])
-        if _validate_phone(phone):
-            return phone
-    
-    # If not found in header, search full text
-    all_matches = PHONE_REGEX.findall(text)
-    if all_matches:
-        # Try each match until we find a valid phone
-        for match in all_matches:
-            phone = _clean_phone(match)
-            if _validate_phone(phone):
-                return phone
-    
-    return None
-
-
-def _extract_urls_fallback(text: str) -> Dict[str, Optional[str]]:
-    """Fallback regex-based URL extraction from full text.
-    
-    Returns a dict with github_url, leetcode_url, linkedin_url.
+# Every contact pattern in one alternation; the matching named group tells
+# the fallback extractor what was found, so the text is traversed once
+# instead of once per pattern
+_CONTACT_RE = re.compile(
+    r'(?P<email>[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,})'
+    r'|(?P<github>https?://(?:www\.)?github\.com/[^\s\)]+)'
+    r'|(?P<linkedin>https?://(?:www\.)?linkedin\.com/[^\s\)]+)'
+    r'|(?P<leetcode>https?://(?:www\.)?leetcode\.com/[^\s\)]+)'
+    r'|(?P<phone>\+?\d[\d\s().-]{7,}\d)',
+    re.IGNORECASE,
+)
+_URL_GROUP_TO_FIELD = {
+    "github": "github_url",
+    "linkedin": "linkedin_url",
+    "leetcode": "leetcode_url",
+}
+# Character window treated as the header region for match preference
+_HEADER_WINDOW = 4096
+PERSONAL_EMAIL_DOMAINS = frozenset({'gmail', 'outlook', 'yahoo', 'hotmail', 'icloud', 'protonmail'})
+
+
+def _pick_email(candidates: list[str]) -> Optional[str]:
+    """Prefer personal emails (gmail, outlook, yahoo, etc.), else first."""
+    for email in candidates:
+        email_lower = email.lower()
+        # Parse the provider out of the host once and do a hashed lookup
+        # instead of substring-scanning the whole address per domain
+        host_root = email_lower.rsplit('@', 1)[-1].split('.', 1)[0]
+        if host_root in PERSONAL_EMAIL_DOMAINS:
+            return email_lower
+    return candidates[0].lower() if candidates else None
+
+
+def _extract_contact_fallback(text: str) -> Dict[str, Optional[str]]:
+    """Regex fallback extraction of email, phone and profile URLs.
+
+    One traversal of the full text collects everything; email and phone
+    matches inside the header window are preferred over later ones.
+
+    Returns a dict with email, phone, github_url, leetcode_url, linkedin_url.
     """
-    urls = {
+    header_emails: list[str] = []
+    all_emails: list[str] = []
+    header_phone: Optional[str] = None
+    any_phone: Optional[str] = None
+    result: Dict[str, Optional[str]] = {
         "github_url": None,
         "leetcode_url": None,
         "linkedin_url": None,
     }
-    
-    # Search full text for URLs
-    github_pattern = r'https?://(?:www\.)?github\.com/[^\s\)]+'
-    leetcode_pattern = r'https?://(?:www\.)?leetcode\.com/[^\s\)]+'
-    linkedin_pattern = r'https?://(?:www\.)?linkedin\.com/[^\s\)]+'
-    
-    github_matches = re.findall(github_pattern, text, re.IGNORECASE)
-    leetcode_matches = re.findall(leetcode_pattern, text, re.IGNORECASE)
-    linkedin_matches = re.findall(linkedin_pattern, text, re.IGNORECASE)
-    
-    if github_matches:
-        urls["github_url"] = github_matches[0]
-    if leetcode_matches:
-        urls["leetcode_url"] = leetcode_matches[0]
-    if linkedin_matches:
-        urls["linkedin_url"] = linkedin_matches[0]
-    
-    return urls
+
+    for match in _CONTACT_RE.finditer(text):
+        kind = match.lastgroup
+        value = match.group()
+        if kind == "email":
+            all_emails.append(value)
+            if match.start() < _HEADER_WINDOW:
+                header_emails.append(value)
+        elif kind == "phone":
+            phone = _clean_phone(value)
+            if _is_valid_cleaned_phone(phone):
+                if any_phone is None:
+                    any_phone = phone
+                if header_phone is None and match.start() < _HEADER_WINDOW:
+                    header_phone = phone
+        else:
+            field = _URL_GROUP_TO_FIELD[kind]
+            if result[field] is None:
+                result[field] = value
+
+    result["email"] = _pick_email(header_emails) or _pick_email(all_emails)
+    result["phone"] = header_phone or any_phone
+    return result
 
 
 def _parse_personal_details(text: str) -> Contacts:
@@ -313,30 +538,53 @@ def _parse_personal_details(text: str) -> Contacts:
     6. Validation: If confidence < threshold, return null for that field
     """
     # Use first 50 lines for personal details (header region - increased for better coverage)
-    # Also check first 2000 characters to catch contact info that might span multiple lines
-    header_lines = text.splitlines()[:50]
-    header_text = "\n".join(header_lines)
-    
-    # Also get first 2000 characters in case contact info is formatted differently
-    first_chars = text[:2000]
-    
-    # Use the longer of the two for better extraction
-    if len(first_chars) > len(header_text):
-        header_text = first_chars
-    
-    # Limit header text to 3000 characters to avoid token limit issues (increased limit)
-    if len(header_text) > 3000:
-        header_text = header_text[:3000] + "..."
+    # Take at least the first 2000 characters in case contact info is
+    # formatted differently. The 50th line boundary is found by scanning for
+    # newlines directly, so the whole document is never split into a list
+    # just to take its head.
+    header_end = 0
+    for _ in range(50):
+        nxt = text.find('\n', header_end)
+        if nxt == -1:
+            header_end = len(text)
+            break
+        header_end = nxt + 1
+    header_text = text[:max(header_end, 2000)]
+
+    # Cap the header region at ~750 tokens (roughly the old 3000 characters)
+    header_text = _truncate_tokens(header_text, 750)
     
     # Extract email, phone, and URLs using regex as fallback/validation
-    email_fallback = _extract_email_fallback(text)
-    phone_fallback = _extract_phone_fallback(text)
-    urls_fallback = _extract_urls_fallback(text)  # Extract URLs from full text
-    
-    prompt = f"""You are extracting personal contact information from a resume. Follow these STRICT rules:
+    contact_fallback = _extract_contact_fallback(text)
+    email_fallback = contact_fallback["email"]
+    phone_fallback = contact_fallback["phone"]
+    urls_fallback = contact_fallback  # carries github_url/leetcode_url/linkedin_url
+
+    # Every error path below returns the same regex-only Contacts; build it
+    # once instead of re-validating the five fields in each branch
+    fallback_contacts = Contacts(
+        email=email_fallback,
+        phone=phone_fallback,
+        github_url=urls_fallback.get("github_url"),
+        leetcode_url=urls_fallback.get("leetcode_url"),
+        linkedin_url=urls_fallback.get("linkedin_url"),
+    )
+
+    # Fast path for well-formatted ATS resumes: if the header already yields
+    # a clear name line plus an email and a phone (or LinkedIn), the regex
+    # extraction covers every required field and the OpenRouter round trip
+    # is skipped entirely
+    if email_fallback and (phone_fallback or urls_fallback.get("linkedin_url")):
+        name_match = NAME_LINE_RE.search(header_text)
+        if name_match and _is_likely_name(name_match.group(1)):
+            first_name, last_name = _split_name(name_match.group(1))
+            return fallback_contacts.model_copy(
+                update={"first_name": first_name, "last_name": last_name}
+            )
 
-RESUME TEXT (header region):
-{header_text}
+    # Invariant instructions first, variable resume text last: the provider's
+    # prompt-prefix cache can then reuse the shared prefix across documents
+    prompt = f"""You are extracting personal contact information from a resume. Follow these STRICT rules:
 
 EXTRACTION RULES:
 
@@ -417,15 +665,19 @@ Return JSON in this EXACT format (no extra keys, no markdown, no comments):
   "leetcode_url": "string or null"
 }}
 
-CRITICAL: 
+CRITICAL:
 - If you're not confident about a field (confidence < 0.6), use null
 - Never guess personal data
 - Only extract what is clearly present
-- Return ONLY valid JSON"""
+- Return ONLY valid JSON
+
+RESUME TEXT (header region):
+{header_text}"""
     
     try:
         try:
-            response = _call_openrouter(prompt)
+            # Contact payloads are small; a tight decode cap lowers latency
+            response = _call_openrouter(prompt, max_tokens=400)
             data = _extract_json_from_response(response)
         except ValueError as api_error:
             # If API call fails (e.g., 402 Payment Required), use regex fallback
@@ -434,18 +686,13 @@ CRITICAL:
             logger.warning(f"OpenRouter API call failed: {str(api_error)}. Using regex fallback extraction.")
             
             # Return Contacts with regex-extracted data only (including URLs)
-            return Contacts(
-                email=email_fallback,
-                phone=phone_fallback,
-                github_url=urls_fallback.get("github_url"),
-                leetcode_url=urls_fallback.get("leetcode_url"),
-                linkedin_url=urls_fallback.get("linkedin_url"),
-            )
+            return fallback_contacts
         
         # Extract and validate full_name
         full_name = data.get("full_name")
         if full_name:
-            full_name = full_name.strip()
+            # Fix OCR zeros only between letters (e.g. "J0hn" -> "John")
+            full_name = _OCR_ZERO_RE.sub('O', full_name.strip())
             # Try to extract name even if validation is lenient
             # Only reject if it's clearly not a name (contains numbers, job keywords, etc.)
             if _is_likely_name(full_name):
@@ -479,7 +726,7 @@ CRITICAL:
         if post_code:
             post_code_clean = post_code.strip()
             # Check if it matches India (6 digits) or USA (5 digits) format
-            if not (POSTCODE_INDIA.match(post_code_clean) or POSTCODE_USA.match(post_code_clean)):
+            if not POSTCODE_RE.match(post_code_clean):
                 post_code = None
         
         # Extract desired job title
@@ -523,17 +770,8 @@ CRITICAL:
         if email or first_name or phone or desired_job_title or location or city or country:
             return contacts
         
-        # If AI extraction failed completely, try fallback regex extraction
-        # and return minimal Contacts object with whatever we can extract
-        fallback_contacts = Contacts(
-            email=email_fallback,
-            phone=phone_fallback,
-            github_url=urls_fallback.get("github_url"),
-            leetcode_url=urls_fallback.get("leetcode_url"),
-            linkedin_url=urls_fallback.get("linkedin_url"),
-        )
-        
-        # Return fallback if we have at least email or phone
+        # If AI extraction failed completely, fall back to the regex-only
+        # Contacts built above. Return it if we have at least email or phone
         if email_fallback or phone_fallback:
             return fallback_contacts
         
@@ -545,22 +783,18 @@ CRITICAL:
         logger = logging.getLogger(__name__)
         logger.error(f"Error parsing personal details: {str(e)}", exc_info=True)
         
-        # Return Contacts with fallback regex extraction (including URLs)
-        fallback_contacts = Contacts(
-            email=email_fallback,
-            phone=phone_fallback,
-            github_url=urls_fallback.get("github_url"),
-            leetcode_url=urls_fallback.get("leetcode_url"),
-            linkedin_url=urls_fallback.get("linkedin_url"),
-        )
-        
-        # Return fallback if we have any data, otherwise return empty
+        # Return the regex-only fallback if we have any data, otherwise empty
         if email_fallback or phone_fallback:
             return fallback_contacts
         
         return Contacts()
 
 
+# Built once at import: validates a whole experience list in a single
+# pydantic-core call instead of one model construction per entry
+_EXPERIENCE_LIST_ADAPTER = TypeAdapter(list[ExperienceEntry])
+
+
 def _parse_experience_section(section_text: str) -> Optional[list[ExperienceEntry]]:
     """Parse experience section using OpenRouter. Extracts ALL work experience entries including internships, traineeships, apprenticeships, and freelance work.
     
@@ -574,18 +808,20 @@ def _parse_experience_section(section_text: str) -> Optional[list[ExperienceEntr
         return None
     
     normalized_text = _normalize_text(section_text)
-    
-    # Limit text length to avoid token issues
-    if len(normalized_text) > 3000:
-        normalized_text = normalized_text[:3000] + "..."
-    
+
+    if not _has_parseable_content(normalized_text):
+        logger.info("Experience section has no parseable content, skipping LLM call")
+        return None
+
+    # Cap at ~750 tokens (roughly the old 3000 characters)
+    normalized_text = _truncate_tokens(normalized_text, 750)
+
     logger.info(f"Parsing experience section: {len(normalized_text)} characters")
     
+    # Invariant instructions first, variable resume text last: the provider's
+    # prompt-prefix cache can then reuse the shared prefix across documents
     prompt = f"""Extract ALL work experience entries from this resume section. Include full-time, part-time, internships, traineeships, apprenticeships, and freelance work.
 
-RESUME SECTION:
-{normalized_text}
-
 Return JSON in this EXACT format (no markdown, no explanations):
 {{
   "experience": [
@@ -610,15 +846,20 @@ RULES:
 7. Missing fields → use null (do NOT guess)
 8. If no experience found → return {{"experience": null}}
 
-Return ONLY valid JSON."""
+Return ONLY valid JSON.
+
+RESUME SECTION:
+{normalized_text}"""
     
     try:
-        response = _call_openrouter(prompt)
+        # Even long work histories fit well under 1500 tokens; decode time
+        # scales with generated tokens, so cap below the 2000 default
+        response = _call_openrouter(prompt, max_tokens=1500)
         logger.info(f"OpenRouter response received: {len(response)} characters")
-        
+
         data = _extract_json_from_response(response)
         logger.info(f"Parsed JSON data type: {type(data)}")
-        
+
         # Handle both formats: direct array or wrapped in "experience" key
         experience_list = None
         if isinstance(data, list):
@@ -655,83 +896,28 @@ Return ONLY valid JSON."""
             return None
         
         logger.info(f"Processing {len(experience_list)} experience entries")
-        
+
+        # Alias key names (title/company/responsibilities...), field stripping
+        # and Present->null handling all live on ExperienceEntry, so the whole
+        # list validates in one pydantic-core pass instead of a per-entry loop
+        validated = _EXPERIENCE_LIST_ADAPTER.validate_python(
+            [item for item in experience_list if isinstance(item, dict)]
+        )
+
         entries = []
-        for idx, item in enumerate(experience_list):
-            if not isinstance(item, dict):
-                logger.warning(f"Entry {idx} is not a dict, skipping")
+        for idx, entry in enumerate(validated):
+            # Only keep entries with at least job_title or employer
+            if not (entry.job_title or entry.employer):
+                logger.warning("Skipping entry %d: missing both job_title and employer", idx + 1)
                 continue
-            
-            # Extract and clean job_title
-            job_title = item.get("job_title") or item.get("title") or item.get("position")
-            if job_title:
-                job_title = str(job_title).strip()
-                if not job_title:
-                    job_title = None
-            
-            # Extract and clean employer
-            employer = item.get("employer") or item.get("company") or item.get("organization")
-            if employer:
-                employer = str(employer).strip()
-                if not employer:
-                    employer = None
-            
-            # Extract and clean location
-            location = item.get("location") or item.get("city")
-            if location:
-                location = str(location).strip()
-                if not location:
-                    location = None
-            
-            # Extract and clean start_date
-            start_date = item.get("start_date") or item.get("start")
-            if start_date:
-                start_date = str(start_date).strip()
-                if not start_date:
-                    start_date = None
-            
-            # Handle end_date: convert "Present", "Current", etc. to null
-            end_date = item.get("end_date") or item.get("end")
-            if end_date:
-                end_date_str = str(end_date).strip()
-                end_date_lower = end_date_str.lower()
-                if end_date_lower in ["present", "current", "now", "ongoing", "till date", "till now", "till present"]:
-                    end_date = None
-                else:
-                    end_date = end_date_str
-            else:
-                end_date = None
-            
-            # Extract and clean description
-            description = item.get("description") or item.get("responsibilities") or item.get("duties")
-            if description:
-                # Clean description: remove excessive special characters but keep punctuation
-                # Remove emojis and unusual symbols but keep standard punctuation
-                description = re.sub(r'[^\w\s\.,;:!?\-()\[\]{}\n•\*]', '', str(description))
-                # Normalize whitespace
-                description = _normalize_text(description)
-                # Preserve bullet points
-                description = re.sub(r'\n\s*[•\*\-]\s*', '\n• ', description)
-                description = description.strip()
-                if not description:
-                    description = None
-            else:
-                description = None
-            
-            # Only add entry if we have at least job_title or employer
-            if job_title or employer:
-                entries.append(ExperienceEntry(
-                    job_title=job_title,
-                    employer=employer,
-                    location=location,
-                    start_date=start_date,
-                    end_date=end_date,
-                    description=description,
-                ))
-                logger.info(f"Added entry {idx+1}: {job_title} at {employer}")
-            else:
-                logger.warning(f"Skipping entry {idx+1}: missing both job_title and employer")
-        
+            if entry.description:
+                # Remove emojis/unusual symbols, normalize whitespace and
+                # bullet points — single combined pass
+                entry.description = _clean_description(entry.description)
+            entries.append(entry)
+            # Lazy %-formatting so filtered-out records cost nothing to format
+            logger.info("Added entry %d: %s at %s", idx + 1, entry.job_title, entry.employer)
+
         if entries:
             logger.info(f"Successfully parsed {len(entries)} experience entries")
             return entries
@@ -748,6 +934,37 @@ Return ONLY valid JSON."""
         return None
 
 
+# Alternative key names LLM responses use for each education field, tried in
+# order. One table plus a tight helper loop replaces the seven hand-written
+# item.get(...) or item.get(...) chains per entry.
+_EDU_FIELD_ALIASES = {
+    "school_name": ("school_name", "institution", "university", "college",
+                    "school", "institution_name"),
+    "degree": ("degree", "qualification", "program", "course"),
+    "field_of_study": ("field_of_study", "major", "specialization", "branch"),
+    "start_date": ("start_date", "start", "start_year", "from"),
+    "end_date": ("end_date", "end", "graduation_date", "end_year", "to",
+                 "graduated", "completed"),
+    "location": ("location", "city", "address", "city_state", "location_city",
+                 "place", "city_state_country"),
+    "description": ("description", "details", "achievements"),
+}
+
+
+def _first_present(item: dict, keys: Tuple[str, ...]):
+    """Return the first truthy value among the given keys, else None."""
+    for key in keys:
+        value = item.get(key)
+        if value:
+            return value
+    return None
+
+
+def _year_int(value: Optional[str]) -> int:
+    """Parse a YYYY string to int for sorting; 0 for missing/non-numeric."""
+    return int(value) if value and value.isdigit() else 0
+
+
 def _parse_education_section(section_text: str) -> Optional[list[EducationEntry]]:
     """Parse education section using OpenAI GPT-4o-mini. Extracts ALL education details with strict formatting rules.
     
@@ -762,10 +979,13 @@ def _parse_education_section(section_text: str) -> Optional[list[EducationEntry]
         return None
     
     normalized_text = _normalize_text(section_text)
-    
-    # Limit text length to avoid token issues
-    if len(normalized_text) > 4000:
-        normalized_text = normalized_text[:4000] + "..."
+
+    if not _has_parseable_content(normalized_text):
+        logger.info("Education section has no parseable content, skipping LLM call")
+        return None
+
+    # Cap at ~1000 tokens (roughly the old 4000 characters)
+    normalized_text = _truncate_tokens(normalized_text, 1000)
     
     logger.info(f"Parsing education section: {len(normalized_text)} characters")
     
@@ -920,14 +1140,15 @@ Output:
   "description": ""
 }}
 
-RESUME TEXT:
-{normalized_text}
-
 CRITICAL: Extract ALL fields for each education entry. Do NOT return entries with only degree field filled.
-Return ONLY the JSON object with education array (no markdown, no explanations)."""
+Return ONLY the JSON object with education array (no markdown, no explanations).
+
+RESUME TEXT:
+{normalized_text}"""
     
     try:
-        response = _call_openrouter(prompt, model="openai/gpt-4o-mini")
+        # Education lists are short; same decode-cap reasoning as experience
+        response = _call_openrouter(prompt, model="openai/gpt-4o-mini", max_tokens=1500)
         logger.info(f"OpenRouter response received: {len(response)} characters")
         
         data = _extract_json_from_response(response)
@@ -953,13 +1174,15 @@ Return ONLY the JSON object with education array (no markdown, no explanations).
         
         if education_list is None:
             logger.warning("No education list found in response")
-            logger.warning(f"Response data: {data}")
-            logger.warning(f"Response preview: {response[:500] if 'response' in locals() else 'N/A'}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Response data: %r", data)
+            logger.warning("Response preview: %.500s", response)
             return None
-        
+
         if not isinstance(education_list, list):
-            logger.warning(f"Education list is not a list, got: {type(education_list)}")
-            logger.warning(f"Education list value: {education_list}")
+            logger.warning("Education list is not a list, got: %s", type(education_list))
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Education list value: %r", education_list)
             return None
         
         if len(education_list) == 0:
@@ -969,9 +1192,10 @@ Return ONLY the JSON object with education array (no markdown, no explanations).
         logger.info(f"Processing {len(education_list)} education entries")
         
         entries = []
+        sort_keys = []  # (end_year, start_year) per entry, built alongside it
         for idx, item in enumerate(education_list):
             if not isinstance(item, dict):
-                logger.warning(f"Entry {idx} is not a dict, skipping")
+                logger.warning("Entry %d is not a dict, skipping", idx)
                 continue
             
             # Initialize all variables at the top (defensive coding - prevents UnboundLocalError)
@@ -984,29 +1208,17 @@ Return ONLY the JSON object with education array (no markdown, no explanations).
             description = ""
             
             # Extract and clean school_name (try multiple field names)
-            school_name = (
-                item.get("school_name") or 
-                item.get("institution") or 
-                item.get("university") or 
-                item.get("college") or
-                item.get("school") or
-                item.get("institution_name")
-            )
+            school_name = _first_present(item, _EDU_FIELD_ALIASES["school_name"])
             if school_name:
                 school_name = str(school_name).strip()
                 # Remove common prefixes/suffixes
-                school_name = re.sub(r'^(university|college|school|institute)[:\s]*', '', school_name, flags=re.IGNORECASE)
+                school_name = SCHOOL_PREFIX_RE.sub('', school_name)
                 school_name = school_name.strip()
                 if not school_name or len(school_name) < 2:
                     school_name = None
             
             # Extract and clean degree (preserve original wording)
-            degree = (
-                item.get("degree") or 
-                item.get("qualification") or
-                item.get("program") or
-                item.get("course")
-            )
+            degree = _first_present(item, _EDU_FIELD_ALIASES["degree"])
             if degree:
                 degree = str(degree).strip()
                 # Prevent garbage values like "Degree", "Qualification", "Program" (common LLM mistake)
@@ -1027,7 +1239,7 @@ Return ONLY the JSON object with education array (no markdown, no explanations).
             
             # Extract field_of_study (may be in degree or separate)
             # If degree already contains specialization, don't duplicate
-            field_of_study = item.get("field_of_study") or item.get("major") or item.get("specialization") or item.get("branch")
+            field_of_study = _first_present(item, _EDU_FIELD_ALIASES["field_of_study"])
             if field_of_study:
                 field_of_study = str(field_of_study).strip()
                 # If degree already contains the field of study, don't duplicate
@@ -1039,18 +1251,13 @@ Return ONLY the JSON object with education array (no markdown, no explanations).
                 field_of_study = None
             
             # Extract and normalize start_date to YYYY format
-            start_date = (
-                item.get("start_date") or 
-                item.get("start") or
-                item.get("start_year") or
-                item.get("from")
-            )
+            start_date = _first_present(item, _EDU_FIELD_ALIASES["start_date"])
             if start_date:
                 start_date_str = str(start_date).strip()
                 # Remove common prefixes
-                start_date_str = re.sub(r'^(from|start|since)[:\s]*', '', start_date_str, flags=re.IGNORECASE)
+                start_date_str = START_DATE_PREFIX_RE.sub('', start_date_str)
                 # Extract year from various formats (YYYY, MM/YYYY, Month YYYY, etc.)
-                year_match = re.search(r'\b(19|20)\d{2}\b', start_date_str)
+                year_match = YEAR_RE.search(start_date_str)
                 if year_match:
                     start_date = year_match.group(0)
                 else:
@@ -1059,15 +1266,7 @@ Return ONLY the JSON object with education array (no markdown, no explanations).
                 start_date = ""  # Empty string for missing dates
             
             # Extract and normalize end_date to YYYY format
-            end_date = (
-                item.get("end_date") or 
-                item.get("end") or 
-                item.get("graduation_date") or
-                item.get("end_year") or
-                item.get("to") or
-                item.get("graduated") or
-                item.get("completed")
-            )
+            end_date = _first_present(item, _EDU_FIELD_ALIASES["end_date"])
             if end_date:
                 end_date_str = str(end_date).strip()
                 # Handle "Present", "Current", "Ongoing"
@@ -1077,9 +1276,9 @@ Return ONLY the JSON object with education array (no markdown, no explanations).
                     end_date = ""
                 else:
                     # Remove common prefixes
-                    end_date_str = re.sub(r'^(to|end|until|graduated|completed)[:\s]*', '', end_date_str, flags=re.IGNORECASE)
+                    end_date_str = END_DATE_PREFIX_RE.sub('', end_date_str)
                     # Extract year from various formats
-                    year_match = re.search(r'\b(19|20)\d{2}\b', end_date_str)
+                    year_match = YEAR_RE.search(end_date_str)
                     if year_match:
                         end_date = year_match.group(0)
                     else:
@@ -1088,15 +1287,7 @@ Return ONLY the JSON object with education array (no markdown, no explanations).
                 end_date = ""  # Empty string for missing dates
             
             # Extract location (try multiple field names and variations)
-            location = (
-                item.get("location") or 
-                item.get("city") or 
-                item.get("address") or
-                item.get("city_state") or
-                item.get("location_city") or
-                item.get("place") or
-                item.get("city_state_country")
-            )
+            location = _first_present(item, _EDU_FIELD_ALIASES["location"])
             if location:
                 location = str(location).strip()
                 if not location or len(location) < 1:
@@ -1105,7 +1296,7 @@ Return ONLY the JSON object with education array (no markdown, no explanations).
                 location = ""  # Empty string if not mentioned
             
             # Extract and clean description FIRST (before logging - prevents UnboundLocalError)
-            description = item.get("description") or item.get("details") or item.get("achievements")
+            description = _first_present(item, _EDU_FIELD_ALIASES["description"])
             if description:
                 description = _normalize_text(str(description))
                 description = description.strip()
@@ -1127,8 +1318,9 @@ Return ONLY the JSON object with education array (no markdown, no explanations).
             
             # Only add entry if we have at least school_name or degree
             if school_name or degree:
-                # Convert empty strings to None for optional fields (except location, start_date, end_date, description which can be empty strings)
-                entry = EducationEntry(
+                # Convert empty strings to None for optional fields (except location, start_date, end_date, description which can be empty strings).
+                # Every field was cleaned above, so skip pydantic validation
+                entry = EducationEntry.model_construct(
                     school_name=school_name if school_name else None,
                     degree=degree if degree else None,
                     field_of_study=field_of_study,
@@ -1138,20 +1330,25 @@ Return ONLY the JSON object with education array (no markdown, no explanations).
                     description=description if description else None,  # None if empty string
                 )
                 entries.append(entry)
-                logger.info(f"Added entry {idx+1}: {degree} from {school_name} (location: {location or 'N/A'}, dates: {start_date or 'N/A'}-{end_date or 'N/A'})")
+                # The cleaned date strings are in hand here, so the sort key
+                # costs two isdigit/int calls now instead of attribute walks
+                # over every entry again at sort time
+                sort_keys.append((_year_int(end_date), _year_int(start_date)))
+                # Lazy %-formatting: the string is only built if a handler
+                # actually emits the record, unlike an eagerly-built f-string
+                logger.info("Added entry %d: %s from %s (location: %s, dates: %s-%s)",
+                            idx + 1, degree, school_name, location or 'N/A',
+                            start_date or 'N/A', end_date or 'N/A')
             else:
-                logger.warning(f"Skipping entry {idx+1}: missing both school_name and degree. Item keys: {list(item.keys()) if isinstance(item, dict) else 'N/A'}")
+                logger.warning("Skipping entry %d: missing both school_name and degree. Item keys: %s",
+                               idx + 1, list(item.keys()))
         
-        # Sort entries from most recent to oldest (by end_date, then start_date)
+        # Sort entries from most recent to oldest (by end_date, then start_date).
+        # Indirect sort over the precomputed keys: sort index positions by
+        # sort_keys, then reorder entries once by the resulting permutation
         if entries:
-            def sort_key(entry):
-                # Use end_date first, then start_date for sorting
-                end_year = entry.end_date if entry.end_date and entry.end_date.isdigit() else "0"
-                start_year = entry.start_date if entry.start_date and entry.start_date.isdigit() else "0"
-                # Sort descending (most recent first)
-                return (int(end_year) if end_year.isdigit() else 0, int(start_year) if start_year.isdigit() else 0)
-            
-            entries.sort(key=sort_key, reverse=True)
+            order = sorted(range(len(entries)), key=sort_keys.__getitem__, reverse=True)
+            entries = [entries[i] for i in order]
             logger.info(f"Successfully parsed {len(entries)} education entries (sorted from most recent to oldest)")
             return entries
         else:
@@ -1167,13 +1364,39 @@ Return ONLY the JSON object with education array (no markdown, no explanations).
         return None
 
 
+# Constrained-decoding schema for the skills parse: the server-side grammar
+# guarantees a valid object with exactly these four string arrays, so the
+# response can be loaded directly without the defensive fence/rescue parsing
+_SKILLS_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "skills",
+        "strict": True,
+        "schema": {
+            "type": "object",
+            "properties": {
+                "technical": {"type": "array", "items": {"type": "string"}},
+                "soft": {"type": "array", "items": {"type": "string"}},
+                "tools": {"type": "array", "items": {"type": "string"}},
+                "languages": {"type": "array", "items": {"type": "string"}},
+            },
+            "required": ["technical", "soft", "tools", "languages"],
+            "additionalProperties": False,
+        },
+    },
+}
+
+
 def _parse_skills_section(section_text: str) -> Optional[Skills]:
     """Parse skills section using OpenRouter. Categorizes into technical, soft, tools, languages."""
     if not section_text or not section_text.strip():
         return None
-    
+
     normalized_text = _normalize_text(section_text)
-    
+
+    if not _has_parseable_content(normalized_text):
+        return None
+
     prompt = f"""Extract and categorize skills from the following resume section. Categorize into technical, soft, tools, and languages.
 
 Section text:
@@ -1197,9 +1420,10 @@ If a category has no skills, use empty array [].
 Do NOT invent skills. Only extract what is explicitly present."""
     
     try:
-        response = _call_openrouter(prompt)
-        data = _extract_json_from_response(response)
-        
+        response = _call_openrouter(prompt, response_format=_SKILLS_RESPONSE_FORMAT)
+        # Constrained decoding guarantees schema-valid JSON
+        data = orjson.loads(response)
+
         return Skills(
             technical=data.get("technical", []),
             soft=data.get("soft", []),
@@ -1214,35 +1438,44 @@ def _parse_projects_section(section_text: str) -> Optional[list[ProjectEntry]]:
     """Parse projects section using OpenRouter."""
     if not section_text or not section_text.strip():
         return None
-    
+
     normalized_text = _normalize_text(section_text)
-    
+
+    if not _has_parseable_content(normalized_text):
+        return None
+
     prompt = f"""Extract project entries from the following resume section.
 
 Section text:
 {normalized_text}
 
-Return JSON as an array (empty array [] if no projects found):
-[
-  {{
-    "project_name": "string",
-    "description": "string",
-    "technologies": [],
-    "link": "string or null"
-  }}
-]
+Return JSON as an object (empty array if no projects found):
+{{
+  "projects": [
+    {{
+      "project_name": "string",
+      "description": "string",
+      "technologies": [],
+      "link": "string or null"
+    }}
+  ]
+}}
 
 Rules:
 - Combine multiline descriptions into a single clean paragraph
 - Extract technologies as an array of strings
 - Extract links even if shown as icons or short URLs
-- If no projects found, return empty array []
+- If no projects found, return {{"projects": []}}
 - Do NOT invent information"""
-    
+
     try:
         response = _call_openrouter(prompt)
         data = _extract_json_from_response(response)
-        
+
+        # JSON mode yields the wrapped object; tolerate a bare array from
+        # models that ignore response_format
+        if isinstance(data, dict):
+            data = data.get("projects")
         if not isinstance(data, list):
             return None
         
@@ -1264,83 +1497,129 @@ Rules:
         return None
 
 
+# Leading bullet/whitespace markers stripped from locally-sliced achievement lines
+_ACHIEVEMENT_BULLET_RE = re.compile(r'^[\s•\*\-]+')
+
+
 def _parse_achievements_section(section_text: str) -> Optional[list[str]]:
-    """Parse achievements section. Returns array of strings."""
+    """Parse achievements section. Returns array of strings.
+
+    The model returns line-number ranges instead of regenerating the
+    achievement text verbatim: the section is sent with numbered lines and
+    each achievement comes back as [start_line, end_line]. Slicing locally
+    means output tokens stay in the tens regardless of how long the bullet
+    list is, and the text cannot be paraphrased or hallucinated.
+    """
     if not section_text or not section_text.strip():
         return None
-    
+
     normalized_text = _normalize_text(section_text)
-    
-    prompt = f"""Extract achievements from the following resume section. Return as a simple array of achievement descriptions.
 
-Section text:
-{normalized_text}
+    if not _has_parseable_content(normalized_text):
+        return None
+
+    lines = normalized_text.split('\n')
+    indexed_text = "\n".join(f"[{i}] {line}" for i, line in enumerate(lines))
 
-Return JSON as an array of strings (empty array [] if no achievements found):
-["Achievement 1", "Achievement 2"]
+    prompt = f"""Identify the achievements in the following resume section. Each line is prefixed with its line number in brackets.
+
+Return JSON in this EXACT format (empty array if no achievements found):
+{{"achievements": [[start_line, end_line], [start_line, end_line]]}}
 
 Rules:
-- Each achievement should be a clean, readable string
-- Combine multiline achievements into single strings
-- If no achievements found, return empty array []
-- Do NOT invent achievements"""
-    
+- Each [start_line, end_line] is an INCLUSIVE line-number range covering exactly one achievement
+- A single-line achievement uses the same number twice, e.g. [3, 3]
+- Do NOT return the achievement text itself, only the line ranges
+- Do NOT include heading lines or blank lines in any range
+
+Section text (line-numbered):
+{indexed_text}"""
+
     try:
-        response = _call_openrouter(prompt)
+        # Ranges are a few tokens each; a tight decode cap keeps this cheap
+        response = _call_openrouter(prompt, max_tokens=300)
         data = _extract_json_from_response(response)
-        
-        if not isinstance(data, list):
+
+        ranges = data.get("achievements") if isinstance(data, dict) else data
+        if not isinstance(ranges, list):
             return None
-        
-        # Normalize each achievement
-        achievements = [_normalize_text(str(item)) for item in data if item and str(item).strip()]
-        
+
+        achievements = []
+        for rng in ranges:
+            if not (isinstance(rng, list) and len(rng) == 2
+                    and all(isinstance(v, int) for v in rng)):
+                continue
+            start, end = rng
+            if not (0 <= start <= end < len(lines)):
+                continue
+            text = " ".join(
+                _ACHIEVEMENT_BULLET_RE.sub('', line).strip()
+                for line in lines[start:end + 1]
+            ).strip()
+            if text:
+                achievements.append(text)
+
         return achievements if achievements else None
     except Exception:
         return None
 
 
-def _remove_header_content(text: str) -> str:
-    """Remove header-like content from text (name, contact info, URLs that appear at the start).
-    
-    This helps ensure summary sections don't include header information.
-    """
-    if not text:
-        return text
-    
-    lines = text.split('\n')
-    cleaned_lines = []
-    
-    # Skip first few lines if they look like header content
-    # Header typically contains: name, contact info, URLs, separators
-    skip_count = 0
-    for i, line in enumerate(lines[:5]):  # Check first 5 lines
-        line_stripped = line.strip()
-        if not line_stripped:
-            continue
-        
-        # Check if line looks like header content
-        has_url = bool(re.search(r'https?://|www\.|github\.com|leetcode\.com|linkedin\.com', line_stripped, re.IGNORECASE))
-        has_email = bool(re.search(r'@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}', line_stripped))
-        has_phone = bool(re.search(r'\+?\d[\d\s().-]{7,}\d', line_stripped))
-        has_separator = bool(re.search(r'[◇•|]', line_stripped))
-        is_short_capitalized = len(line_stripped.split()) <= 4 and line_stripped.isupper()
-        
-        # If line has multiple header indicators, it's likely header content
-        header_indicators = sum([has_url, has_email, has_phone, has_separator, is_short_capitalized])
-        if header_indicators >= 2:
-            skip_count = i + 1
-        elif header_indicators == 1 and (has_url or has_email or has_phone):
-            # Single URL/email/phone in first lines is likely header
-            skip_count = i + 1
-    
-    # Return text without header lines
-    return '\n'.join(lines[skip_count:]).strip()
+# Header indicators fused into one alternation: one finditer pass per line
+# yields the set of matched categories (via lastgroup) instead of four
+# separate re.search calls with patterns recompiled from strings each time
+_HEADER_INDICATOR_RE = re.compile(
+    r'(?P<url>https?://|www\.|github\.com|leetcode\.com|linkedin\.com)'
+    r'|(?P<email>@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,})'
+    r'|(?P<phone>\+?\d[\d\s().-]{7,}\d)'
+    r'|(?P<sep>[◇•|])',
+    re.IGNORECASE,
+)
 
+# Categories where a single hit already marks the line as header content
+_STRONG_HEADER_GROUPS = frozenset({'url', 'email', 'phone'})
+
+
+# Building blocks for the summary PII scrub. Compiled once at import into a
+# single alternation: each category is a named group and one lambda
+# dispatches on which group matched, so the text is traversed (and copied)
+# once instead of once per category.
+_LOCATION_KEYWORDS = r'(?:near|at|in|from|to|address|location|city|state|country|postal|zip|pin)'
+_INDIAN_STATES = r'(?:TAMILNADU|KARNATAKA|MAHARASHTRA|DELHI|GUJARAT|RAJASTHAN|PUNJAB|WEST BENGAL|BIHAR|ODISHA|ANDHRA PRADESH|TELANGANA|KERALA|HARYANA|UTTAR PRADESH|MADHYA PRADESH|ASSAM|JHARKHAND|CHHATTISGARH|HIMACHAL PRADESH|UTTARAKHAND|TRIPURA|MEGHALAYA|MANIPUR|MIZORAM|NAGALAND|SIKKIM|ARUNACHAL PRADESH|GOA|PUDUCHERRY|DAMAN|DIU|DADRA|NAGAR HAVELI|LAKSHADWEEP|ANDAMAN|NICOBAR)'
+_INDIAN_CITIES = r'(?:COIMBATORE|CHENNAI|BANGALORE|MUMBAI|DELHI|HYDERABAD|PUNE|KOLKATA|AHMEDABAD|JAIPUR|LUCKNOW|KANPUR|NAGPUR|INDORE|THANE|BHOPAL|VISAKHAPATNAM|PATNA|VADODARA|GHAZIABAD|LUDHIANA|AGRA|NASHIK|FARIDABAD|MEERUT|RAJKOT|VARANASI|SRINAGAR|AMRITSAR|ALLAHABAD|RANCHI|GWALIOR|CHANDIGARH|JODHPUR|RAIPUR|KOTA|GUWAHATI|MYSORE|BHUBANESWAR|COCHIN|TRIVANDRUM|MADURAI|SURAT|JAMSHEDPUR|JABALPUR|ASANSOL|DHANBAD|AURANGABAD|JALANDHAR|GUNTUR|WARANGAL|BAREILLY|MORADABAD|DHARWAD|KARNAL|ROHTAK|BHAGALPUR|MUZAFFARPUR|BOKARO|GULBARGA|BELLARY|MUZAFFARNAGAR|BHIWANDI|SAHARANPUR|GORAKHPUR|BHIWANI|PANIPAT|BATHINDA|HISAR|SONIPAT|PANCHKULA|AMBALA|YAMUNANAGAR|KURUKSHETRA|KAITHAL|JIND|FATEHABAD|SIRSA|REWARI|MAHENDRAGARH|CHARKHI DADRI|JHAJJAR|PALWAL|MEWAT|GURGAON)'
+
+_PII_RE = re.compile(
+    # Phone numbers: +91 1234567890, (123) 456-7890, 123-456-7890, etc.
+    r'(?P<phone>\+?\d[\d\s().-]{7,}\d)'
+    # Email addresses
+    r'|(?P<email>[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,})'
+    # http(s)/www URLs plus bare github/leetcode/linkedin/other domain paths
+    r'|(?P<url>https?://[^\s]+'
+    r'|www\.[^\s]+'
+    r'|github\.com/[^\s]+'
+    r'|leetcode\.com/[^\s]+'
+    r'|linkedin\.com/[^\s]+'
+    r'|[a-zA-Z0-9-]+\.[a-zA-Z]{2,}/[^\s]+)'
+    # Header separator characters (◇, •, |) with surrounding whitespace;
+    # replaced with a space rather than dropped
+    r'|(?P<sep>\s*[◇•|]\s*)'
+    # Street/road/avenue address fragments
+    r'|(?P<addr>\d+\s+[A-Za-z\s]+(?:Street|St|Road|Rd|Avenue|Ave|Lane|Ln|Drive|Dr|Boulevard|Blvd|Nagar|Colony|Area)'
+    r'|[A-Za-z\s]+(?:Street|St|Road|Rd|Avenue|Ave|Lane|Ln|Drive|Dr|Boulevard|Blvd|Nagar|Colony|Area)[\s,]+[A-Za-z\s]+)'
+    # Postcodes/zip codes (6 digits India, 5 digits USA) adjacent to a
+    # location-related keyword on either side
+    rf'|(?P<postcode>{_LOCATION_KEYWORDS}\s*\d{{5,6}}\b|\b\d{{5,6}}\s*{_LOCATION_KEYWORDS})'
+    # Common location patterns (City, State, Country format)
+    rf'|(?P<loc>\b{_INDIAN_CITIES}\s+{_INDIAN_STATES}\s+INDIA\b'
+    rf'|\b{_INDIAN_CITIES}\s+{_INDIAN_STATES}\b'
+    rf'|\b[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*,\s*{_INDIAN_STATES}\s+INDIA\b'
+    rf'|\b[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*,\s*[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*,\s*INDIA\b)',
+    re.IGNORECASE,
+)
 
+@lru_cache(maxsize=256)
 def _remove_personal_info(text: str) -> str:
     """Remove personal information (phone numbers, emails, addresses, names, locations, URLs) from text.
-    
+
     This function filters out:
     - Phone numbers (various formats)
     - Email addresses
@@ -1352,60 +1631,11 @@ def _remove_personal_info(text: str) -> str:
     """
     if not text:
         return text
-    
-    # Remove phone numbers (various formats)
-    # Matches: +91 1234567890, (123) 456-7890, 123-456-7890, etc.
-    text = re.sub(r'\+?\d[\d\s().-]{7,}\d', '', text)
-    
-    # Remove email addresses
-    text = re.sub(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}', '', text)
-    
-    # Remove URLs (GitHub, LeetCode, LinkedIn, portfolio, etc.)
-    # Matches: http://, https://, www., and common domain patterns
-    url_patterns = [
-        r'https?://[^\s]+',  # http:// or https:// URLs
-        r'www\.[^\s]+',  # www. URLs
-        r'github\.com/[^\s]+',  # GitHub URLs (with or without protocol)
-        r'leetcode\.com/[^\s]+',  # LeetCode URLs
-        r'linkedin\.com/[^\s]+',  # LinkedIn URLs
-        r'[a-zA-Z0-9-]+\.[a-zA-Z]{2,}/[^\s]+',  # Other domain URLs
-    ]
-    for pattern in url_patterns:
-        text = re.sub(pattern, '', text, flags=re.IGNORECASE)
-    
-    # Remove special separator characters commonly used in headers (◇, |, •, etc.)
-    text = re.sub(r'[◇•|]\s*', ' ', text)  # Remove separator chars with optional space
-    text = re.sub(r'\s+[◇•|]\s*', ' ', text)  # Remove separator chars with spaces around
-    
-    # Remove common address patterns (street, road, avenue, etc.)
-    address_patterns = [
-        r'\d+\s+[A-Za-z\s]+(?:Street|St|Road|Rd|Avenue|Ave|Lane|Ln|Drive|Dr|Boulevard|Blvd|Nagar|Colony|Area)',
-        r'[A-Za-z\s]+(?:Street|St|Road|Rd|Avenue|Ave|Lane|Ln|Drive|Dr|Boulevard|Blvd|Nagar|Colony|Area)[\s,]+[A-Za-z\s]+',
-    ]
-    for pattern in address_patterns:
-        text = re.sub(pattern, '', text, flags=re.IGNORECASE)
-    
-    # Remove postcodes/zip codes (6 digits for India, 5 digits for USA) when near location keywords
-    # Only remove if they appear near location-related words
-    location_keywords = r'(?:near|at|in|from|to|address|location|city|state|country|postal|zip|pin)'
-    text = re.sub(rf'{location_keywords}\s*\d{{5,6}}\b', '', text, flags=re.IGNORECASE)
-    text = re.sub(rf'\b\d{{5,6}}\s*{location_keywords}', '', text, flags=re.IGNORECASE)
-    
-    # Remove common location patterns (City, State, Country format)
-    # Pattern: "CITY STATENAME" or "CITY, STATENAME" or "CITY STATENAME COUNTRY"
-    # Match common Indian states and cities
-    indian_states = r'(?:TAMILNADU|KARNATAKA|MAHARASHTRA|DELHI|GUJARAT|RAJASTHAN|PUNJAB|WEST BENGAL|BIHAR|ODISHA|ANDHRA PRADESH|TELANGANA|KERALA|HARYANA|UTTAR PRADESH|MADHYA PRADESH|ASSAM|JHARKHAND|CHHATTISGARH|HIMACHAL PRADESH|UTTARAKHAND|TRIPURA|MEGHALAYA|MANIPUR|MIZORAM|NAGALAND|SIKKIM|ARUNACHAL PRADESH|GOA|PUDUCHERRY|DAMAN|DIU|DADRA|NAGAR HAVELI|LAKSHADWEEP|ANDAMAN|NICOBAR)'
-    indian_cities = r'(?:COIMBATORE|CHENNAI|BANGALORE|MUMBAI|DELHI|HYDERABAD|PUNE|KOLKATA|AHMEDABAD|JAIPUR|LUCKNOW|KANPUR|NAGPUR|INDORE|THANE|BHOPAL|VISAKHAPATNAM|PATNA|VADODARA|GHAZIABAD|LUDHIANA|AGRA|NASHIK|FARIDABAD|MEERUT|RAJKOT|VARANASI|SRINAGAR|AMRITSAR|ALLAHABAD|RANCHI|GWALIOR|CHANDIGARH|JODHPUR|RAIPUR|KOTA|GUWAHATI|MYSORE|BHUBANESWAR|COCHIN|TRIVANDRUM|MADURAI|SURAT|JAMSHEDPUR|JABALPUR|ASANSOL|DHANBAD|AURANGABAD|JALANDHAR|GUNTUR|WARANGAL|BAREILLY|MORADABAD|DHARWAD|KARNAL|ROHTAK|BHAGALPUR|MUZAFFARPUR|BOKARO|GULBARGA|BELLARY|MUZAFFARNAGAR|BHIWANDI|SAHARANPUR|GORAKHPUR|BHIWANI|PANIPAT|BATHINDA|HISAR|SONIPAT|PANCHKULA|AMBALA|YAMUNANAGAR|KURUKSHETRA|KAITHAL|JIND|FATEHABAD|SIRSA|REWARI|MAHENDRAGARH|CHARKHI DADRI|JHAJJAR|PALWAL|MEWAT|GURGAON)'
-    
-    location_patterns = [
-        rf'\b{indian_cities}\s+{indian_states}\s+INDIA\b',
-        rf'\b{indian_cities}\s+{indian_states}\b',
-        rf'\b[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*,\s*{indian_states}\s+INDIA\b',
-        rf'\b[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*,\s*[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*,\s*INDIA\b',
-    ]
-    for pattern in location_patterns:
-        text = re.sub(pattern, '', text, flags=re.IGNORECASE)
-    
+
+    # All PII categories are scrubbed in one traversal; separators become a
+    # space, everything else is dropped
+    text = _PII_RE.sub(lambda m: ' ' if m.lastgroup == 'sep' else '', text)
+
     # Remove lines that are likely names (standalone capitalized words, 2-4 words)
     # But be careful not to remove job titles or common words
     lines = text.split('\n')
@@ -1416,20 +1646,72 @@ def _remove_personal_info(text: str) -> str:
         if 2 <= len(words) <= 4:
             if all(word and word[0].isupper() for word in words):
                 # Check if it contains common non-name words or job-related words
-                common_words = ['the', 'and', 'or', 'of', 'in', 'at', 'to', 'for', 'with', 'on', 'is', 'are', 'was', 'were', 'be', 'been', 'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would', 'should', 'could', 'may', 'might', 'must', 'can']
-                job_words = ['engineer', 'developer', 'manager', 'analyst', 'designer', 'specialist', 'consultant', 'director', 'lead', 'senior', 'junior', 'associate', 'architect', 'scientist', 'researcher', 'coordinator', 'executive']
-                line_lower = line.lower()
-                if not any(word.lower() in common_words for word in words) and not any(job_word in line_lower for job_word in job_words):
+                if (not any(word.lower() in COMMON_WORDS for word in words)
+                        and not JOB_WORDS_RE.search(line.lower())):
                     # Likely a name line, skip it
                     continue
         cleaned_lines.append(line)
     text = '\n'.join(cleaned_lines)
     
-    # Clean up multiple spaces and normalize
-    text = re.sub(r'\s+', ' ', text)
-    text = re.sub(r'\n\s*\n', '\n', text)
-    
-    return text.strip()
+    # Collapse whitespace runs in C via split/join instead of a regex pass
+    # (split() with no args splits on any whitespace, which also strips)
+    return ' '.join(text.split())
+
+
+@lru_cache(maxsize=256)
+def _clean_summary_text(text: str) -> str:
+    """Strip header lines and personal info from summary text in one fused pass.
+
+    Combines the old header-removal and PII-scrub steps: the text is split
+    into lines once, the header heuristic runs over the first 5 lines, and
+    the remainder gets a single PII sweep plus the name-line filter — instead
+    of two functions that each re-split and re-walk the whole string.
+    """
+    if not text:
+        return text
+
+    lines = text.split('\n')
+
+    # Skip first few lines if they look like header content
+    # Header typically contains: name, contact info, URLs, separators
+    skip_count = 0
+    for i, line in enumerate(lines[:5]):  # Check first 5 lines
+        line_stripped = line.strip()
+        if not line_stripped:
+            continue
+
+        # Which header categories does this line hit? One pass over the line
+        hits = {m.lastgroup for m in _HEADER_INDICATOR_RE.finditer(line_stripped)}
+        is_short_capitalized = len(line_stripped.split()) <= 4 and line_stripped.isupper()
+
+        # If line has multiple header indicators, it's likely header content
+        header_indicators = len(hits) + is_short_capitalized
+        if header_indicators >= 2:
+            skip_count = i + 1
+        elif header_indicators == 1 and hits & _STRONG_HEADER_GROUPS:
+            # Single URL/email/phone in first lines is likely header
+            skip_count = i + 1
+
+    # PII scrub on the surviving text in one traversal (phone/addr patterns
+    # can span line breaks, so this runs on the joined remainder, not per line)
+    remainder = _PII_RE.sub(
+        lambda m: ' ' if m.lastgroup == 'sep' else '',
+        '\n'.join(lines[skip_count:]),
+    )
+
+    # Name-line filter and whitespace collapse share one loop: each kept
+    # line contributes its words straight to the output
+    words_out = []
+    for line in remainder.split('\n'):
+        words = line.split()
+        # Skip lines that are likely names (all words capitalized, 2-4 words, no common words)
+        if 2 <= len(words) <= 4 and all(word[0].isupper() for word in words):
+            if (not any(word.lower() in COMMON_WORDS for word in words)
+                    and not JOB_WORDS_RE.search(line.lower())):
+                # Likely a name line, skip it
+                continue
+        words_out.extend(words)
+    return ' '.join(words_out)
 
 
 def _parse_summary_section(section_text: str) -> Optional[str]:
@@ -1449,16 +1731,17 @@ def _parse_summary_section(section_text: str) -> Optional[str]:
         return None
     
     normalized_text = _normalize_text(section_text)
-    
-    # Remove header content first (name, contact info, URLs at the start)
-    normalized_text = _remove_header_content(normalized_text)
-    
-    # Remove personal information before processing
-    normalized_text = _remove_personal_info(normalized_text)
-    
-    # Limit text length to avoid token issues
-    if len(normalized_text) > 1500:
-        normalized_text = normalized_text[:1500] + "..."
+
+    # Remove header content and personal information in one fused pass
+    normalized_text = _clean_summary_text(normalized_text)
+
+    # A summary that is empty (or pure noise) after scrubbing has nothing
+    # left for the LLM to extract
+    if not _has_parseable_content(normalized_text):
+        return None
+
+    # Cap at ~375 tokens (roughly the old 1500 characters)
+    normalized_text = _truncate_tokens(normalized_text, 375)
     
     # Define the exact headings we accept
     valid_headings = [
@@ -1517,9 +1800,9 @@ VALIDATION:
                 # Clean and normalize the summary text
                 summary = _normalize_text(str(summary))
                 # Remove personal information again as a safety measure
+                # (this also collapses all whitespace, so no newline cleanup
+                # is needed afterwards)
                 summary = _remove_personal_info(summary)
-                # Remove excessive newlines but preserve paragraph structure
-                summary = re.sub(r'\n{3,}', '\n\n', summary)
                 summary_cleaned = summary.strip() if summary.strip() else None
                 if summary_cleaned:
                     return summary_cleaned
@@ -1541,6 +1824,42 @@ VALIDATION:
         return None
 
 
+# Keywords gating the full-text fallback parses in parse_resume. One
+# combined finditer pass reports which are present, instead of a separate
+# whole-text substring scan per keyword.
+_EXPERIENCE_FALLBACK_KWS = frozenset({"experience", "work", "employment"})
+_EDUCATION_FALLBACK_KWS = frozenset({"education", "university", "college", "degree"})
+_PROJECTS_FALLBACK_KWS = frozenset({"project", "portfolio", "github"})
+_CERTIFICATIONS_FALLBACK_KWS = frozenset({"certificate", "certification", "license", "credential"})
+_FALLBACK_KEYWORDS_RE = re.compile('|'.join(sorted(
+    _EXPERIENCE_FALLBACK_KWS | _EDUCATION_FALLBACK_KWS
+    | _PROJECTS_FALLBACK_KWS | _CERTIFICATIONS_FALLBACK_KWS,
+    key=len, reverse=True,
+)))
+
+# Drives the per-section input selection and dispatch in parse_resume:
+# (section key, keyword gate for the full-text fallback or None, log a
+# content preview?). Contacts and summary stay outside the table — contacts
+# always parses the header window and summary has its own error fallback.
+_SECTION_INPUT_TABLE = (
+    ("experience", _EXPERIENCE_FALLBACK_KWS, True),
+    ("education", _EDUCATION_FALLBACK_KWS, True),
+    ("skills", None, False),
+    ("projects", _PROJECTS_FALLBACK_KWS, False),
+    ("certifications", _CERTIFICATIONS_FALLBACK_KWS, False),
+    ("achievements", None, False),
+)
+
+_SECTION_PARSERS = {
+    "experience": _parse_experience_section,
+    "education": _parse_education_section,
+    "skills": _parse_skills_section,
+    "projects": _parse_projects_section,
+    "certifications": certification_extraction_service.extract_certifications,
+    "achievements": _parse_achievements_section,
+}
+
+
 def parse_resume(text: str) -> ResumeData:
     """High-level parsing pipeline that extracts structured resume data from ANY type of resume.
     
@@ -1557,176 +1876,174 @@ def parse_resume(text: str) -> ResumeData:
     - Do not invent content
     - Normalize and clean text while preserving meaning
     """
-    import logging
-    logging.basicConfig(level=logging.INFO)
-    logger = logging.getLogger(__name__)
-    
     try:
         # Normalize the input text first
         normalized_text = _normalize_text(text)
-        
+
         if not normalized_text or len(normalized_text.strip()) < 10:
             logger.warning("Input text is too short or empty")
             return ResumeData(contacts=Contacts())
-        
-        logger.info(f"Parsing resume with {len(normalized_text)} characters")
-        
+
+        logger.info("Parsing resume with %d characters", len(normalized_text))
+
         # Detect sections first
         sections = section_detection_service.detect_sections(normalized_text)
-        logger.info(f"Detected sections: {list(sections.keys())}")
-        # Log section lengths for debugging
+        # Log section lengths for debugging; lazy %-formatting throughout the
+        # pipeline so filtered-out records cost nothing to build
+        logger.info("Detected sections: %s", list(sections.keys()))
         for section_key, section_content in sections.items():
             if section_content:
-                logger.info(f"Section '{section_key}': {len(section_content)} characters")
+                logger.info("Section '%s': %d characters", section_key, len(section_content))
             else:
-                logger.info(f"Section '{section_key}': EMPTY")
-        
+                logger.info("Section '%s': EMPTY", section_key)
+
+        # Cheap structural screen before any LLM call: text with no detected
+        # section, no contact signal, and little alphabetic content is junk
+        # (OCR noise, the wrong file) — bail out before paying up to eight
+        # OpenRouter round trips on it
+        if not any(sections.values()) and not (
+            EMAIL_REGEX.search(normalized_text) or PHONE_REGEX.search(normalized_text)
+        ):
+            alpha_count = sum(c.isalpha() for c in normalized_text)
+            if (len(normalized_text) < 200
+                    or alpha_count / len(normalized_text) < 0.3):
+                logger.warning(
+                    "Input has no sections, no contact info and %.0f%% alphabetic "
+                    "content - skipping parsing", 100 * alpha_count / len(normalized_text))
+                return ResumeData(contacts=Contacts())
+
         # Log summary section detection details
         summary_section = sections.get("summary", "")
         if summary_section:
-            logger.info(f"Summary section detected: {len(summary_section)} characters")
+            logger.info("Summary section detected: %d characters", len(summary_section))
         else:
             logger.info("No summary section detected by section detection")
         
-        # Parse contacts (always attempt from header)
-        # This is critical - always try to extract contact info
+        # Decide every LLM-bound section's input up front, driven by the
+        # table, so the parses can all be dispatched at once below. One pass
+        # of the combined keyword pattern answers every fallback gate.
+        found_keywords = {
+            m.group(0) for m in _FALLBACK_KEYWORDS_RE.finditer(normalized_text.lower())
+        }
+        section_inputs: Dict[str, Optional[str]] = {}
+        for key, fallback_kws, log_preview in _SECTION_INPUT_TABLE:
+            section_text = sections.get(key, "")
+            if section_text and section_text.strip():
+                logger.info("%s section detected: %d characters", key.capitalize(), len(section_text))
+                if log_preview:
+                    logger.info("%s section preview: %.200s...", key.capitalize(), section_text)
+                section_inputs[key] = section_text
+                continue
+            section_inputs[key] = None
+            if fallback_kws is not None:
+                logger.warning("No %s section detected or section is empty", key)
+                # Fallback: try the full text if section detection failed
+                if found_keywords & fallback_kws:
+                    logger.info("Attempting fallback: parsing %s from full text", key)
+                    section_inputs[key] = normalized_text
+
+        # Kept for the post-parse checks below (identity comparison decides
+        # whether the education full-text retry applies)
+        experience_input = section_inputs["experience"]
+        education_input = section_inputs["education"]
+        education_section = sections.get("education", "")
+        projects_input = section_inputs["projects"]
+        certifications_input = section_inputs["certifications"]
+
+        # Summary is parsed ONLY from sections with SUMMARY_HEADINGS (no fallback)
+        summary_input = summary_section.strip() or None
+
+        # Every section parse is independent and each is dominated by an
+        # OpenRouter round trip, so dispatch them all together: wall time
+        # becomes roughly the slowest call instead of the sum
         logger.info("Extracting contacts...")
-        contacts = _parse_personal_details(normalized_text)
-        
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            contacts_future = pool.submit(_parse_personal_details, normalized_text)
+            section_futures = {
+                key: pool.submit(_SECTION_PARSERS[key], section_input)
+                for key, section_input in section_inputs.items()
+                if section_input
+            }
+            summary_future = (
+                pool.submit(_parse_summary_section, summary_input)
+                if summary_input else None
+            )
+
+            contacts = contacts_future.result()
+            results = {key: future.result() for key, future in section_futures.items()}
+            experience = results.get("experience")
+            education = results.get("education")
+            skills = results.get("skills")
+            projects = results.get("projects")
+            certifications = results.get("certifications")
+            achievements = results.get("achievements")
+
+            summary = None
+            if summary_future:
+                logger.info("Extracting summary from section (%d chars)...", len(summary_input))
+                try:
+                    summary = summary_future.result()
+                    logger.info("Summary extracted: %s, length: %d",
+                                summary is not None, len(summary) if summary else 0)
+                    if summary:
+                        logger.info("Summary preview: %.100s...", summary)
+                except Exception as e:
+                    logger.error("Error extracting summary: %s", e, exc_info=True)
+                    # Only use cleaned section text if it's from a valid summary section
+                    # Remove header content and all personal info as safety measure
+                    summary = _clean_summary_text(_normalize_text(summary_input))
+                    # If after cleaning there's no meaningful content, set to None
+                    if not summary or len(summary.strip()) < 10:
+                        summary = None
+            else:
+                logger.info("No summary section detected with valid SUMMARY_HEADINGS - skipping summary extraction")
+
         # Ensure we always have a Contacts object (even if empty)
         if contacts is None:
             logger.warning("Contacts extraction returned None, creating empty object")
             contacts = Contacts()
-        
-        # Log detailed contact extraction results
-        logger.info(f"Contacts extracted: email={contacts.email is not None} ({contacts.email}), "
-                   f"phone={contacts.phone is not None} ({contacts.phone}), "
-                   f"first_name={contacts.first_name is not None} ({contacts.first_name}), "
-                   f"last_name={contacts.last_name is not None} ({contacts.last_name}), "
-                   f"job_title={contacts.desired_job_title is not None} ({contacts.desired_job_title}), "
-                   f"location={contacts.location is not None} ({contacts.location}), "
-                   f"city={contacts.city is not None} ({contacts.city}), "
-                   f"country={contacts.country is not None} ({contacts.country})")
-        
-        # Parse experience (only if section exists)
-        experience = None
-        experience_section = sections.get("experience", "")
-        if experience_section and experience_section.strip():
-            logger.info(f"Experience section detected: {len(experience_section)} characters")
-            logger.info(f"Experience section preview: {experience_section[:200]}...")
-            experience = _parse_experience_section(experience_section)
-            if experience:
-                logger.info(f"Successfully parsed {len(experience)} experience entries")
-            else:
-                logger.warning("Experience parsing returned None or empty")
-        else:
-            logger.warning("No experience section detected or section is empty")
-            # Fallback: try to find experience in the full text if section detection failed
-            if "experience" in normalized_text.lower() or "work" in normalized_text.lower() or "employment" in normalized_text.lower():
-                logger.info("Attempting fallback: parsing experience from full text")
-                experience = _parse_experience_section(normalized_text)
-                if experience:
-                    logger.info(f"Fallback parsing succeeded: {len(experience)} entries")
-        
-        # Parse education (only if section exists)
-        education = None
-        education_section = sections.get("education", "")
-        if education_section and education_section.strip():
-            logger.info(f"Education section detected: {len(education_section)} characters")
-            logger.info(f"Education section preview: {education_section[:200]}...")
-            education = _parse_education_section(education_section)
+
+        # Log detailed contact extraction results (built only if INFO is on)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Contacts extracted: email=%s (%s), phone=%s (%s), first_name=%s (%s), "
+                "last_name=%s (%s), job_title=%s (%s), location=%s (%s), city=%s (%s), "
+                "country=%s (%s)",
+                contacts.email is not None, contacts.email,
+                contacts.phone is not None, contacts.phone,
+                contacts.first_name is not None, contacts.first_name,
+                contacts.last_name is not None, contacts.last_name,
+                contacts.desired_job_title is not None, contacts.desired_job_title,
+                contacts.location is not None, contacts.location,
+                contacts.city is not None, contacts.city,
+                contacts.country is not None, contacts.country,
+            )
+
+        if experience:
+            logger.info("Successfully parsed %d experience entries", len(experience))
+        elif experience_input is not None:
+            logger.warning("Experience parsing returned None or empty")
+
+        if education:
+            logger.info("Successfully parsed %d education entries", len(education))
+        elif education_input is education_section:
+            logger.warning("Education parsing returned None or empty")
+            # Fallback: retry with the full text when the section parse failed
+            logger.info("Attempting fallback: parsing education from full text")
+            education = _parse_education_section(normalized_text)
             if education:
-                logger.info(f"Successfully parsed {len(education)} education entries")
-            else:
-                logger.warning("Education parsing returned None or empty")
-                # Fallback: try parsing from full text
-                logger.info("Attempting fallback: parsing education from full text")
-                education = _parse_education_section(normalized_text)
-                if education:
-                    logger.info(f"Fallback parsing succeeded: {len(education)} entries")
-        else:
-            logger.warning("No education section detected or section is empty")
-            # Fallback: try to find education in the full text if section detection failed
-            if "education" in normalized_text.lower() or "university" in normalized_text.lower() or "college" in normalized_text.lower() or "degree" in normalized_text.lower():
-                logger.info("Attempting fallback: parsing education from full text")
-                education = _parse_education_section(normalized_text)
-                if education:
-                    logger.info(f"Fallback parsing succeeded: {len(education)} entries")
-        
-        # Parse skills (only if section exists)
-        skills = None
-        if sections.get("skills") and sections["skills"].strip():
-            skills = _parse_skills_section(sections["skills"])
-        
-        # Parse projects (only if section exists)
-        projects = None
-        if sections.get("projects") and sections["projects"].strip():
-            logger.info(f"Projects section detected: {len(sections['projects'])} characters")
-            projects = _parse_projects_section(sections["projects"])
-            if projects:
-                logger.info(f"Successfully parsed {len(projects)} projects")
-            else:
-                logger.warning("Project parsing returned None or empty")
-        else:
-            logger.warning("No projects section detected or section is empty")
-            # Fallback: try to find projects in the full text if section detection failed
-            if any(keyword in normalized_text.lower() for keyword in ["project", "portfolio", "github"]):
-                logger.info("Attempting fallback: parsing projects from full text")
-                projects = _parse_projects_section(normalized_text)
-                if projects:
-                    logger.info(f"Fallback parsing succeeded: {len(projects)} entries")
-        
-        # Parse certifications using detailed extraction service (only if section exists)
-        certifications = None
-        certifications_section = sections.get("certifications", "").strip()
-        if certifications_section:
-            logger.info(f"Certifications section detected: {len(certifications_section)} characters")
-            certifications = certification_extraction_service.extract_certifications(certifications_section)
-            if certifications:
-                logger.info(f"Successfully extracted {len(certifications)} certifications")
-            else:
-                logger.warning("Certification extraction returned None or empty")
-        else:
-            # Fallback: try to extract from full text if section detection failed
-            if any(keyword in normalized_text.lower() for keyword in ["certificate", "certification", "license", "credential"]):
-                logger.info("Attempting fallback: extracting certifications from full text")
-                certifications = certification_extraction_service.extract_certifications(normalized_text)
-                if certifications:
-                    logger.info(f"Fallback extraction succeeded: {len(certifications)} entries")
-        
-        # Parse achievements (only if section exists)
-        achievements = None
-        if sections.get("achievements") and sections["achievements"].strip():
-            achievements = _parse_achievements_section(sections["achievements"])
-        
-        # Parse summary (ONLY from sections with SUMMARY_HEADINGS - no fallback)
-        summary = None
-        summary_section_text = sections.get("summary", "").strip()
-        if summary_section_text:
-            logger.info(f"Extracting summary from section ({len(summary_section_text)} chars)...")
-            try:
-                summary = _parse_summary_section(summary_section_text)
-                logger.info(f"Summary extracted: {summary is not None}, length: {len(summary) if summary else 0}")
-                if summary:
-                    logger.info(f"Summary preview: {summary[:100]}...")
-            except Exception as e:
-                logger.error(f"Error extracting summary: {str(e)}", exc_info=True)
-                # Only use cleaned section text if it's from a valid summary section
-                # Remove all personal info as safety measure
-                if summary_section_text:
-                    summary = _normalize_text(summary_section_text)
-                    summary = _remove_header_content(summary)
-                    summary = _remove_personal_info(summary).strip()
-                    # If after cleaning there's no meaningful content, set to None
-                    if not summary or len(summary.strip()) < 10:
-                        summary = None
-                else:
-                    summary = None
-        else:
-            logger.info("No summary section detected with valid SUMMARY_HEADINGS - skipping summary extraction")
-            # No fallback - only extract from sections with valid headings
-            summary = None
-        
+                logger.info("Fallback parsing succeeded: %d entries", len(education))
+
+        if projects:
+            logger.info("Successfully parsed %d projects", len(projects))
+        elif projects_input is not None:
+            logger.warning("Project parsing returned None or empty")
+
+        if certifications:
+            logger.info("Successfully extracted %d certifications", len(certifications))
+        elif certifications_input is not None:
+            logger.warning("Certification extraction returned None or empty")
+
         # Always return ResumeData with at least contacts
         result = ResumeData(
             contacts=contacts,
@@ -1739,10 +2056,24 @@ def parse_resume(text: str) -> ResumeData:
             summary=summary,
         )
         
-        logger.info(f"Resume parsing complete. Contacts: {contacts.email is not None or contacts.first_name is not None}")
+        logger.info("Resume parsing complete. Contacts: %s",
+                    contacts.email is not None or contacts.first_name is not None)
         return result
-        
+
     except Exception as e:
-        logger.error(f"Error in parse_resume: {str(e)}", exc_info=True)
+        logger.error("Error in parse_resume: %s", e, exc_info=True)
         # Always return ResumeData with at least empty contacts
         return ResumeData(contacts=Contacts())
+
+
+def parse_resumes_batch(texts: list[str], max_concurrency: int = 4) -> list[ResumeData]:
+    """Parse several resumes concurrently, preserving input order.
+
+    Each resume's section parses already fan out internally; this bounds how
+    many resumes are in flight at once so a batch caller shares the pooled
+    HTTP connections instead of issuing N serial parse_resume chains.
+    """
+    if not texts:
+        return []
+    with ThreadPoolExecutor(max_workers=max_concurrency) as pool:
+        return list(pool.map(parse_resume, texts))
@@ -115,19 +115,109 @@ SECTION_HEADERS = {
 }
 
 
+def _compile_section_header_patterns() -> Dict[str, "re.Pattern[str]"]:
+    """Compile each section's heading variants into one alternation regex.
+
+    Each variant becomes two branches matching the old string predicates
+    exactly: space-bounded anywhere in the line (covers exact match,
+    prefix + space, suffix, and whole-word containment) or at line start
+    followed by ':'/'-'. Lines are matched already stripped and lowercased,
+    so the patterns are lowercase and need no IGNORECASE.
+    """
+    compiled = {}
+    for key, variants in SECTION_HEADERS.items():
+        branches = []
+        # dict.fromkeys dedupes case-only duplicates while keeping order
+        for variant in dict.fromkeys(v.lower().strip() for v in variants):
+            escaped = re.escape(variant)
+            branches.append(rf'(?:^|(?<=\s)){escaped}(?=\s|$)')
+            branches.append(rf'^{escaped}[:\-]')
+        compiled[key] = re.compile('|'.join(branches))
+    return compiled
+
+
+# One compiled pattern per section key (not one global alternation: a line
+# like "achievements" is a heading variant of two sections, and both must
+# register). 7 C-level searches per line replace ~70 variants x 5 Python
+# string predicates.
+_SECTION_HEADER_RES = _compile_section_header_patterns()
+
+
+def _build_exact_header_lookup() -> Dict[str, Tuple[str, ...]]:
+    """Map each exact heading spelling to its full section-key tuple.
+
+    Covers every variant plus its ':' / '-' suffixed forms. Key sets are
+    computed by running the compiled patterns, so a dict hit returns exactly
+    what the regex loop would (including multi-section lines like
+    "awards & achievements", which registers for achievements and
+    certifications alike).
+    """
+    forms = set()
+    for variants in SECTION_HEADERS.values():
+        for variant in variants:
+            variant = variant.lower().strip()
+            forms.update((variant, variant + ':', variant + '-'))
+    return {
+        form: tuple(key for key, pattern in _SECTION_HEADER_RES.items()
+                    if pattern.search(form))
+        for form in forms
+    }
+
+
+# Most header lines are an exact heading ("Skills", "EDUCATION:"), so an
+# O(1) dict hit resolves them; only noisy lines fall through to the regexes
+_HEADER_EXACT_KEYS = _build_exact_header_lookup()
+
+# Used to build the line-offset table in detect_sections in one C-level pass
+_NEWLINE_RE = re.compile(r'\n')
+
+
+# Skills worth flagging even outside an explicit skills section.
+# This is a simple approach - in a real implementation, you might want to use NER or a skills database
+COMMON_SKILLS = [
+    'python', 'javascript', 'java', 'c++', 'c#', 'ruby', 'php', 'swift', 'kotlin', 'go', 'rust',
+    'django', 'flask', 'react', 'angular', 'vue', 'node.js', 'spring', 'laravel', 'rails',
+    'sql', 'mongodb', 'postgresql', 'mysql', 'oracle', 'sql server', 'sqlite',
+    'docker', 'kubernetes', 'aws', 'azure', 'google cloud', 'git', 'jenkins', 'ansible',
+    'machine learning', 'ai', 'data science', 'big data', 'deep learning', 'nlp', 'computer vision'
+]
+
+# One alternation (longest-first so multi-word skills win at a shared start)
+# scans the text once for every common skill, instead of one full-text regex
+# pass per skill
+_COMMON_SKILLS_RE = re.compile(
+    '|'.join(re.escape(s) for s in sorted(COMMON_SKILLS, key=len, reverse=True))
+    .join((r'\b(?:', r')\b'))
+)
+
+# A matched skill also implies any shorter skill word-bounded inside it
+# ("sql server" contains "sql"), which the old per-skill scans reported too
+_SKILL_IMPLIES: Dict[str, List[str]] = {
+    skill: [
+        other for other in COMMON_SKILLS
+        if re.search(r'\b' + re.escape(other) + r'\b', skill)
+    ]
+    for skill in COMMON_SKILLS
+}
+
+
+# Skill-list cleanup patterns hoisted to module scope so the section loop
+# never pays the re-module cache lookup per call
+_BULLET_STRIP_RE = re.compile(r'[•\-*]\s*')
+_NUMBERED_LIST_RE = re.compile(r'\d+[.)]\s*')
+_SKILL_DELIM_RE = re.compile(r'[,;|]')
+
+
 def extract_skills_from_text(text: str, skill_headers: List[str]) -> List[str]:
     """Extract skills from resume text using provided section headers.
-    
+
     Args:
         text: The resume text to extract skills from
         skill_headers: List of regex patterns to identify skill sections
-        
+
     Returns:
         List of extracted skills
     """
-    import re
-    from typing import List, Set
-    
     if not text or not skill_headers:
         return []
     
@@ -146,8 +236,8 @@ def extract_skills_from_text(text: str, skill_headers: List[str]) -> List[str]:
             if section_content:
                 # Clean and split the content into individual skills
                 # Remove bullet points, numbers, and other common formatting
-                cleaned = re.sub(r'[•\-*]\s*', '', section_content)  # Remove bullet points
-                cleaned = re.sub(r'\d+[.)]\s*', '', cleaned)  # Remove numbered lists
+                cleaned = _BULLET_STRIP_RE.sub('', section_content)  # Remove bullet points
+                cleaned = _NUMBERED_LIST_RE.sub('', cleaned)  # Remove numbered lists
                 
                 # Split by common delimiters and clean up
                 for line in cleaned.split('\n'):
@@ -156,26 +246,16 @@ def extract_skills_from_text(text: str, skill_headers: List[str]) -> List[str]:
                         continue
                         
                     # Handle comma/semicolon/pipe separated skills
-                    for skill in re.split(r'[,;|]', line):
+                    for skill in _SKILL_DELIM_RE.split(line):
                         skill = skill.strip()
                         if skill and len(skill) > 1:  # Skip empty or single-character "skills"
                             skills.add(skill)
     
-    # Also look for skills mentioned in other contexts
-    # This is a simple approach - in a real implementation, you might want to use NER or a skills database
-    common_skills = [
-        'python', 'javascript', 'java', 'c++', 'c#', 'ruby', 'php', 'swift', 'kotlin', 'go', 'rust',
-        'django', 'flask', 'react', 'angular', 'vue', 'node.js', 'spring', 'laravel', 'rails',
-        'sql', 'mongodb', 'postgresql', 'mysql', 'oracle', 'sql server', 'sqlite',
-        'docker', 'kubernetes', 'aws', 'azure', 'google cloud', 'git', 'jenkins', 'ansible',
-        'machine learning', 'ai', 'data science', 'big data', 'deep learning', 'nlp', 'computer vision'
-    ]
-    
-    # Check for these skills in the text (case insensitive)
-    for skill in common_skills:
-        if re.search(r'\b' + re.escape(skill) + r'\b', normalized_text, re.IGNORECASE):
-            skills.add(skill)
-    
+    # Also look for common skills mentioned in other contexts: one pass of
+    # the combined alternation over the (already lowercased) text
+    for match in _COMMON_SKILLS_RE.finditer(normalized_text):
+        skills.update(_SKILL_IMPLIES[match.group(0)])
+
     return sorted(list(skills), key=lambda x: x.lower())
 
 
@@ -190,9 +270,16 @@ def detect_sections(text: str) -> Dict[str, str]:
     Returns a dict with section keys and their content. Empty sections are returned as empty strings.
     """
 
-    lines = text.splitlines()
+    lines = text.split('\n')
     sections: Dict[str, str] = {k: "" for k in SECTION_HEADERS.keys()}
 
+    # Start offset of every line, computed in one C-level regex pass.
+    # Section bodies below become single zero-copy slices of `text`
+    # instead of list slices re-joined into fresh strings per section.
+    line_starts = [0]
+    line_starts.extend(m.end() for m in _NEWLINE_RE.finditer(text))
+    text_len = len(text)
+
     # For each line, see if it looks like a section header
     header_spans: List[Tuple[str, int]] = []  # (section_key, line_index)
     for i, line in enumerate(lines):
@@ -200,22 +287,16 @@ def detect_sections(text: str) -> Dict[str, str]:
         if not normalized:
             continue
 
-        for key, variants in SECTION_HEADERS.items():
-            for variant in variants:
-                v_norm = variant.lower().strip()
-                # Treat a line as a header if it matches the heading (case-insensitive)
-                # Check for exact match, starts with, ends with, or contains the variant
-                # Also check if the line contains the variant as a whole word
-                if (normalized == v_norm or 
-                    normalized.startswith(v_norm + " ") or 
-                    normalized.endswith(" " + v_norm) or
-                    f" {v_norm} " in f" {normalized} " or
-                    normalized.startswith(v_norm + ":") or
-                    normalized.startswith(v_norm + "-")):
-                    # Avoid duplicates
-                    if (key, i) not in header_spans:
-                        header_spans.append((key, i))
-                    break
+        # Treat a line as a header if it matches any heading variant
+        # (case-insensitive). Exact heading spellings resolve via one dict
+        # lookup; otherwise the per-section patterns encode exact match,
+        # starts with, ends with, whole-word containment, and ':'/'-' suffix
+        keys = _HEADER_EXACT_KEYS.get(normalized)
+        if keys is None:
+            keys = [key for key, pattern in _SECTION_HEADER_RES.items()
+                    if pattern.search(normalized)]
+        for key in keys:
+            header_spans.append((key, i))
 
     if not header_spans:
         # No explicit headers found
@@ -228,8 +309,11 @@ def detect_sections(text: str) -> Dict[str, str]:
     for idx, (key, line_idx) in enumerate(header_spans):
         start_line = line_idx + 1  # content starts after header line
         end_line = header_spans[idx + 1][1] if idx + 1 < len(header_spans) else len(lines)
-        body = "\n".join(lines[start_line:end_line]).strip()
-        
+        start = line_starts[start_line] if start_line < len(lines) else text_len
+        end = line_starts[end_line] if end_line < len(lines) else text_len
+        body = text[start:end].strip()
+
+
         # Merge content if section key already exists (e.g., "Experience" and "Internships" both map to "experience")
         if sections[key]:
             sections[key] = sections[key] + "\n\n" + body
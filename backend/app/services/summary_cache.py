@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import logging
+import os
+import threading
+from functools import lru_cache
+from typing import List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Similarity above the threshold counts as "the same request phrased
+# differently"; the entry cap bounds memory like the other in-process caches
+SIMILARITY_THRESHOLD = 0.92
+_MAX_ENTRIES = 256
+
+# Opt-out switch: the embedding model costs ~90MB of RAM once loaded
+_ENABLED = os.getenv("SUMMARY_SEMANTIC_CACHE", "1").lower() not in ("0", "false")
+
+_EMBED_MODEL_NAME = "sentence-transformers/all-MiniLM-L6-v2"
+
+_lock = threading.Lock()
+_model = None
+_model_failed = False
+# (L2-normalized embedding, summary), oldest first
+_entries: List[Tuple[object, str]] = []
+
+
+def _get_model():
+    """Load the embedding model on first use; importing it eagerly would slow
+    startup and cost memory even when the cache never sees traffic."""
+    global _model, _model_failed
+    if _model is None and not _model_failed:
+        try:
+            from sentence_transformers import SentenceTransformer
+            _model = SentenceTransformer(_EMBED_MODEL_NAME)
+        except Exception as e:
+            # Missing/broken optional model install shouldn't break summaries
+            _model_failed = True
+            logger.warning("Semantic summary cache disabled: %s", e)
+    return _model
+
+
+@lru_cache(maxsize=4096)
+def _embed(text: str):
+    """Encode text to a normalized embedding, memoizing per unique input.
+
+    Retries and UI refreshes re-submit identical text; the LRU turns those
+    repeat encodes into dict hits instead of a fresh MiniLM forward pass.
+    (If the model failed to load the sticky None result is cached too,
+    which matches _model_failed being permanent.)
+    """
+    model = _get_model()
+    if model is None:
+        return None
+    # normalize_embeddings=True makes the dot product below equal cosine
+    # similarity, so no per-comparison normalization is needed
+    return model.encode(text, normalize_embeddings=True)
+
+
+def get(text: str) -> Optional[str]:
+    """Return the cached summary for a semantically equivalent request, if any."""
+    if not _ENABLED or not _entries:
+        return None
+    vec = _embed(text)
+    if vec is None:
+        return None
+    with _lock:
+        best_score = 0.0
+        best_summary = None
+        for entry_vec, summary in _entries:
+            score = float(entry_vec @ vec)
+            if score > best_score:
+                best_score = score
+                best_summary = summary
+    if best_score >= SIMILARITY_THRESHOLD:
+        logger.info("Semantic summary cache hit (similarity %.3f)", best_score)
+        return best_summary
+    return None
+
+
+def put(text: str, summary: str) -> None:
+    """Store a freshly generated summary under the request's embedding."""
+    if not _ENABLED or not summary:
+        return
+    vec = _embed(text)
+    if vec is None:
+        return
+    with _lock:
+        _entries.append((vec, summary))
+        if len(_entries) > _MAX_ENTRIES:
+            del _entries[0]
@@ -1,42 +1,324 @@
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import os
-import json
-from typing import Optional
+import random
+import re
+import statistics
+import time
+from collections import OrderedDict, deque
+from functools import cache
+from typing import AsyncIterator, Optional
 
 import httpx
+import orjson
 from dotenv import load_dotenv
-from openai import OpenAI
+from openai import AsyncOpenAI
 
-# Load environment variables
-load_dotenv()
+from . import summary_cache
 
-# Hugging Face API configuration
-HUGGINGFACE_API_KEY = os.getenv("HUGGINGFACE_API_KEY", "")
+# Client construction and env loading are deferred to first use: importing
+# this module (tests, template-only flows) shouldn't read .env off disk or
+# pay TLS context setup for clients that may never see a request.
 
-# OpenRouter configuration (primary method since HF API has issues)
-OPENROUTER_API_KEY = os.getenv("OPENROUTER_API_KEY")
-if OPENROUTER_API_KEY:
-    openrouter_client = OpenAI(
+
+@cache
+def _get_hf_key() -> str:
+    """Hugging Face API key, loading .env on first access."""
+    load_dotenv()
+    return os.getenv("HUGGINGFACE_API_KEY", "")
+
+
+@cache
+def _get_hf_headers() -> dict:
+    """HF request headers, built once and reused across every call."""
+    headers = {"Content-Type": "application/json"}
+    api_key = _get_hf_key()
+    if api_key:
+        headers["Authorization"] = f"Bearer {api_key}"
+    return headers
+
+
+@cache
+def _get_hf_client() -> httpx.AsyncClient:
+    """Shared HF inference client: keep-alive pooling plus HTTP/2 so repeat
+    summary requests reuse a warm connection instead of paying a TCP+TLS
+    handshake per call. Closed on app shutdown (see main.py)."""
+    return httpx.AsyncClient(
+        base_url="https://api-inference.huggingface.co",
+        http2=True,
+        timeout=httpx.Timeout(30.0, connect=5.0),
+        limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+    )
+
+
+@cache
+def _get_openrouter_client() -> Optional[AsyncOpenAI]:
+    """OpenRouter client (primary method since HF API has issues), or None
+    when no key is configured. AsyncOpenAI so the completion await yields
+    the event loop for the whole LLM generation instead of blocking every
+    other request on it; the pooled transport keeps connections warm."""
+    load_dotenv()
+    api_key = os.getenv("OPENROUTER_API_KEY")
+    if not api_key:
+        return None
+    return AsyncOpenAI(
         base_url="https://openrouter.ai/api/v1",
-        api_key=OPENROUTER_API_KEY,
+        api_key=api_key,
+        http_client=httpx.AsyncClient(
+            http2=True,
+            timeout=60.0,
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+        ),
     )
-else:
-    openrouter_client = None
+
+
+@cache
+def _get_local_client() -> Optional[AsyncOpenAI]:
+    """Client for a local OpenAI-compatible server, or None if not configured.
+
+    Set LOCAL_LLM_URL (e.g. http://localhost:8000/v1) to add a local
+    vLLM / llama.cpp server as a provider: no per-call API cost, no
+    network RTT, and vLLM's continuous batching amortizes concurrent
+    summary requests. The GGUF fetched by scripts/download_model.py works
+    with `llama-server -m backend/models/<file>.gguf`; for vLLM:
+    `python -m vllm.entrypoints.openai.api_server
+    --model mistralai/Mistral-7B-Instruct-v0.1`.
+    """
+    load_dotenv()
+    base_url = os.getenv("LOCAL_LLM_URL")
+    if not base_url:
+        return None
+    return AsyncOpenAI(
+        base_url=base_url,
+        api_key=os.getenv("LOCAL_LLM_API_KEY", "not-needed"),
+        http_client=httpx.AsyncClient(
+            timeout=60.0,
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+        ),
+    )
+
+
+@cache
+def _get_openrouter_params() -> "tuple[str, int]":
+    """(model, max_tokens) for OpenRouter, overridable via env.
+
+    gpt-4o-mini is markedly faster and cheaper than gpt-3.5-turbo at
+    comparable quality for short copywriting, and summaries target 2-3
+    sentences (~60 tokens), so decode is capped at 80: output length
+    drives completion latency linearly. Set OPENROUTER_MODEL /
+    OPENROUTER_MAX_TOKENS to trade speed back for length or quality.
+    """
+    load_dotenv()
+    return (
+        os.getenv("OPENROUTER_MODEL", "openai/gpt-4o-mini"),
+        int(os.getenv("OPENROUTER_MAX_TOKENS", "80")),
+    )
+
+
+async def close_clients() -> None:
+    """Close pooled clients on app shutdown, skipping ones never created."""
+    if _get_hf_client.cache_info().currsize:
+        await _get_hf_client().aclose()
+    for getter in (_get_openrouter_client, _get_local_client):
+        if getter.cache_info().currsize:
+            client = getter()
+            if client is not None:
+                await client.close()
+
+
+# Exact-match summary cache checked before the (more expensive) semantic
+# lookup: a byte-identical request resolves with one hash and a dict hit.
+# Bounded LRU keyed on a blake2b digest, same shape as the parser-side
+# response cache.
+_SUMMARY_CACHE_MAX_ENTRIES = 256
+_summary_exact_cache: "OrderedDict[str, str]" = OrderedDict()
+
+# In-flight dedupe: concurrent requests with the same cache key await the
+# first caller's Future instead of each launching their own provider race
+_inflight: "dict[str, asyncio.Future[str]]" = {}
+
+
+async def _remember_summary(cache_key: str, cache_text: str, summary: str) -> None:
+    """Store a generated summary in both the exact and semantic caches.
+
+    The semantic put runs an embedding encode (and on first use the model
+    load), so it goes through a worker thread instead of the event loop.
+    """
+    _summary_exact_cache[cache_key] = summary
+    _summary_exact_cache.move_to_end(cache_key)
+    if len(_summary_exact_cache) > _SUMMARY_CACHE_MAX_ENTRIES:
+        _summary_exact_cache.popitem(last=False)
+    await asyncio.to_thread(summary_cache.put, cache_text, summary)
+
+
+class CircuitBreaker:
+    """Stop hammering an endpoint that keeps failing.
+
+    After `threshold` consecutive failures the breaker opens and `allow()`
+    refuses calls for `cooldown` seconds; the first call after the cooldown
+    is a half-open probe, and its outcome either closes the breaker or
+    re-opens it for another cooldown.
+    """
+
+    def __init__(self, threshold: int = 5, cooldown: float = 30.0):
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self._probing = False
+
+    def allow(self) -> bool:
+        if self.opened_at is None:
+            return True
+        if time.monotonic() - self.opened_at < self.cooldown:
+            return False
+        # Cooldown elapsed: let a single probe through at a time
+        if self._probing:
+            return False
+        self._probing = True
+        return True
+
+    def record_success(self) -> None:
+        self.failures = 0
+        self.opened_at = None
+        self._probing = False
+
+    def record_failure(self) -> None:
+        self.failures += 1
+        self._probing = False
+        if self.failures >= self.threshold:
+            self.opened_at = time.monotonic()
+
+
+# Trips after repeated HF failures so a dead endpoint costs nothing (no
+# connection, no 503 backoff loop) until the cooldown's half-open probe
+# shows it recovered. OpenRouter still runs, so summaries keep flowing.
+_hf_breaker = CircuitBreaker(threshold=5, cooldown=30.0)
+
+
+class ProviderStats:
+    """Rolling latency window for one provider (successful calls only)."""
+
+    def __init__(self):
+        self.samples: "deque[float]" = deque(maxlen=200)
+
+    def record(self, ms: float) -> None:
+        self.samples.append(ms)
+
+    def p95(self) -> float:
+        # inf until we have enough samples for a meaningful quantile, which
+        # also means unknown providers launch without a handicap
+        if len(self.samples) < 20:
+            return float("inf")
+        return statistics.quantiles(self.samples, n=20)[18]
+
+
+_stats = {"hf": ProviderStats(), "openrouter": ProviderStats(), "local": ProviderStats()}
+
+
+async def _timed(name: str, coro) -> Optional[str]:
+    """Run one provider attempt, recording latency when it succeeds.
+
+    Failures aren't recorded: a dead endpoint returns None quickly and
+    would otherwise rank as the fastest provider.
+    """
+    start = time.monotonic()
+    result = await coro
+    if result:
+        _stats[name].record((time.monotonic() - start) * 1000.0)
+    return result
+
+
+async def _delayed(delay: float, name: str, coro) -> Optional[str]:
+    if delay > 0:
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            # Another provider already won; release the never-started coroutine
+            coro.close()
+            raise
+    return await _timed(name, coro)
+
+
+# Common job-related keywords for the template fallback, compiled once into
+# a single word-bounded alternation
+TECH_KEYWORDS = ["java", "python", "javascript", "react", "node", "sql", "aws", "docker", "kubernetes"]
+_TECH_RE = re.compile(
+    r"\b(" + "|".join(map(re.escape, TECH_KEYWORDS)) + r")\b",
+    re.IGNORECASE,
+)
+
+# Role nouns to surface in the distilled prompt fed to the small HF model
+_ROLE_RE = re.compile(
+    r"\b(developer|engineer|analyst|designer|architect|scientist|manager|"
+    r"consultant|administrator|intern)\b",
+    re.IGNORECASE,
+)
+
+# Splits on sentence-ending punctuation followed by whitespace
+_SENTENCE_SPLIT_RE = re.compile(r"(?<=[.!?])\s")
+
+
+def _distill_jd(job_description: str) -> str:
+    """Condense a job description to the features the summary needs.
+
+    flan-t5-base is small enough that prompt tokens directly drive encoder
+    latency, so instead of pasting up to 800 raw characters we send the
+    first sentence, the role noun, and the top tech keywords.
+    """
+    parts = []
+    first_sentence = _SENTENCE_SPLIT_RE.split(job_description.strip(), maxsplit=1)[0][:200]
+    if first_sentence:
+        parts.append(first_sentence)
+    role = _ROLE_RE.search(job_description)
+    if role:
+        parts.append(f"Role: {role.group(0).lower()}.")
+    keywords = list(dict.fromkeys(m.title() for m in _TECH_RE.findall(job_description)))
+    if keywords:
+        parts.append("Key technologies: " + ", ".join(keywords[:5]) + ".")
+    return " ".join(parts)
+
+
+def _build_context(resume_data: Optional[dict]) -> str:
+    """Build the resume-context string (role + key skills) for the prompts."""
+    context_parts = []
+    if resume_data:
+        if resume_data.get("experience") and len(resume_data["experience"]) > 0:
+            exp = resume_data["experience"][0]  # Use most recent experience
+            job_title = exp.get("job_title", "")
+            employer = exp.get("employer", "")
+            if job_title or employer:
+                context_parts.append(f"Current role: {job_title} at {employer}" if job_title and employer else f"{job_title or employer}")
+
+        if resume_data.get("skills"):
+            skills = resume_data.get("skills", {})
+            tech_skills = skills.get("technical", [])
+            if tech_skills:
+                context_parts.append(f"Key skills: {', '.join(tech_skills[:5])}")
+
+    return " | ".join(context_parts) if context_parts else ""
+
+
+def _build_user_prompt(job_desc_limited: str, context: str) -> str:
+    """Build the chat-model user prompt shared by the full and stream paths."""
+    user_prompt = f"Job Description:\n{job_desc_limited}"
+    if context:
+        user_prompt += f"\n\nResume Context: {context}"
+    user_prompt += "\n\nGenerate a professional resume summary:"
+    return user_prompt
 
 
 def _generate_template_summary(job_description: str, resume_data: Optional[dict] = None) -> str:
     """Fallback template-based summary generation when API is unavailable."""
-    # Extract key information
-    job_keywords = []
-    job_lower = job_description.lower()
-    
-    # Common job-related keywords
-    tech_keywords = ["java", "python", "javascript", "react", "node", "sql", "aws", "docker", "kubernetes"]
-    for keyword in tech_keywords:
-        if keyword in job_lower:
-            job_keywords.append(keyword.title())
-    
+    # One alternation pass over the job description replaces a substring
+    # scan per keyword; word bounds also stop "java" matching "javascript".
+    # dict.fromkeys dedupes repeats while keeping first-seen order.
+    job_keywords = list(dict.fromkeys(
+        m.title() for m in _TECH_RE.findall(job_description)
+    ))
+
     # Build summary from resume data if available
     experience_text = ""
     skills_text = ""
@@ -80,28 +362,30 @@ def _extract_generated_text(result) -> str:
         return str(result)
 
 
+_DEFAULT_SUMMARY = "Experienced professional with a strong background in relevant skills and expertise."
+
+
 def _format_summary(generated_text: str, prompt: str) -> str:
     """Clean and format the generated summary text."""
     if not generated_text:
-        return "Experienced professional with a strong background in relevant skills and expertise."
-    
+        return _DEFAULT_SUMMARY
+
     # Remove prompt artifacts if present
     generated_text = generated_text.replace(prompt, "").strip()
     # Remove any leading/trailing quotes
     generated_text = generated_text.strip('"\'')
-    # Take first 2-3 sentences
-    sentences = [s.strip() for s in generated_text.split(". ") if s.strip()]
-    if len(sentences) > 3:
-        generated_text = ". ".join(sentences[:3]) + "."
-    elif len(sentences) > 0:
-        generated_text = ". ".join(sentences) + ("." if not generated_text.endswith(".") else "")
-    else:
-        generated_text = generated_text.strip()
-    
+    # Take the first 3 sentences: one compiled-regex split that also
+    # recognizes '?'/'!' and newline boundaries, unlike the old literal
+    # ". " split. Each sentence keeps its own terminal punctuation.
+    sentences = [s.strip() for s in _SENTENCE_SPLIT_RE.split(generated_text) if s.strip()]
+    generated_text = " ".join(sentences[:3])
+    if generated_text and not generated_text.endswith(('.', '!', '?')):
+        generated_text += "."
+
     # Ensure minimum length
     if len(generated_text) < 20:
-        generated_text = "Experienced professional with a strong background in relevant skills and expertise."
-    
+        return _DEFAULT_SUMMARY
+
     return generated_text
 
 
@@ -111,8 +395,9 @@ async def generate_summary_from_job_description(
 ) -> str:
     """
     Generate a professional summary based on job description.
-    Tries google/flan-t5-base via Hugging Face API first, then falls back to OpenRouter.
-    
+    Races google/flan-t5-base via Hugging Face API against OpenRouter and
+    returns whichever answers first; falls back to a template if both fail.
+
     Args:
         job_description: The job description text
         resume_data: Optional resume data (experience, skills, etc.) to tailor the summary
@@ -122,97 +407,254 @@ async def generate_summary_from_job_description(
     """
     if not job_description or not job_description.strip():
         raise ValueError("Job description cannot be empty")
-    
-    # Build context from resume data if available
-    context_parts = []
-    if resume_data:
-        if resume_data.get("experience") and len(resume_data["experience"]) > 0:
-            exp = resume_data["experience"][0]  # Use most recent experience
-            job_title = exp.get("job_title", "")
-            employer = exp.get("employer", "")
-            if job_title or employer:
-                context_parts.append(f"Current role: {job_title} at {employer}" if job_title and employer else f"{job_title or employer}")
-        
-        if resume_data.get("skills"):
-            skills = resume_data.get("skills", {})
-            tech_skills = skills.get("technical", [])
-            if tech_skills:
-                context_parts.append(f"Key skills: {', '.join(tech_skills[:5])}")
-    
-    context = " | ".join(context_parts) if context_parts else ""
-    
+
+    context = _build_context(resume_data)
+
     # Create prompt for summary generation
     job_desc_limited = job_description[:800]
-    
-    # Try Hugging Face API first (for google/flan-t5-base)
+
+    # Exact-match cache first (hash + dict hit), then the semantic cache: a
+    # repeated or paraphrased job description with the same resume context
+    # returns the stored summary without any model call
+    cache_text = f"{job_desc_limited}\n{context}"
+    cache_key = hashlib.blake2b(cache_text.encode(), digest_size=16).hexdigest()
+    cached_summary = _summary_exact_cache.get(cache_key)
+    if cached_summary is not None:
+        _summary_exact_cache.move_to_end(cache_key)
+        return cached_summary
+    # Semantic lookup encodes the text (and loads MiniLM on first use), so
+    # it runs in a worker thread rather than stalling the event loop
+    cached_summary = await asyncio.to_thread(summary_cache.get, cache_text)
+    if cached_summary is not None:
+        return cached_summary
+
+    # Coalesce concurrent identical requests: the first caller runs the
+    # provider race, later callers await its Future instead of issuing
+    # duplicate LLM calls
+    inflight = _inflight.get(cache_key)
+    if inflight is not None:
+        return await inflight
+
+    future: "asyncio.Future[str]" = asyncio.get_running_loop().create_future()
+    _inflight[cache_key] = future
     try:
-        headers = {}
-        if HUGGINGFACE_API_KEY:
-            headers["Authorization"] = f"Bearer {HUGGINGFACE_API_KEY}"
-        
-        prompt = f"Write a professional resume summary for this job: {job_desc_limited}"
+        # Race both providers instead of trying HF, waiting out its timeout
+        # and 503 retry, and only then calling OpenRouter: the first usable
+        # summary wins and the loser is cancelled
+        hf_prompt = f"Write a professional resume summary for this job: {_distill_jd(job_description)}"
         if context:
-            prompt += f" Background: {context}"
-        prompt += " Summary:"
-        
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            api_url = "https://api-inference.huggingface.co/models/google/flan-t5-base"
-            response = await client.post(
-                api_url,
-                headers=headers,
-                json={"inputs": prompt},
-            )
-            
-            if response.status_code == 200:
-                result = response.json()
-                generated_text = _extract_generated_text(result)
-                if generated_text:
-                    return _format_summary(generated_text, prompt)
-            
-            elif response.status_code == 503:
-                # Model is loading, wait and retry once
-                import asyncio
-                await asyncio.sleep(5)
-                response = await client.post(
-                    api_url,
-                    headers=headers,
-                    json={"inputs": prompt},
-                )
-                if response.status_code == 200:
-                    result = response.json()
-                    generated_text = _extract_generated_text(result)
-                    if generated_text:
-                        return _format_summary(generated_text, prompt)
+            hf_prompt += f" Background: {context}"
+        hf_prompt += " Summary:"
+
+        user_prompt = _build_user_prompt(job_desc_limited, context)
+
+        # Local server usually wins the race outright (no network RTT);
+        # if it's down its task just loses and the remote tiers cover it
+        providers = [("hf", _try_huggingface(hf_prompt))]
+        if _get_openrouter_client() is not None:
+            providers.append(("openrouter", _try_openrouter(user_prompt)))
+        if _get_local_client() is not None:
+            providers.append(("local", _try_local(user_prompt)))
+
+        # Adaptive routing: the provider with the best observed p95 launches
+        # immediately; the rest are held back long enough that they only
+        # fire when the favourite is running slower than usual. With no
+        # latency history every provider starts at once (a plain race).
+        providers.sort(key=lambda p: _stats[p[0]].p95())
+        best_p95 = _stats[providers[0][0]].p95()
+        grace = min(best_p95 * 1.5 / 1000.0, 2.0) if best_p95 != float("inf") else 0.0
+
+        pending = {
+            asyncio.create_task(_delayed(0.0 if i == 0 else grace, name, coro))
+            for i, (name, coro) in enumerate(providers)
+        }
+
+        summary = None
+        while pending and summary is None:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                result = task.result()
+                if result:
+                    summary = result
+                    break
+        for task in pending:
+            task.cancel()
+
+        if summary:
+            await _remember_summary(cache_key, cache_text, summary)
+        else:
+            # Final fallback: template-based summary
+            summary = _generate_template_summary(job_description, resume_data)
+        future.set_result(summary)
+        return summary
+    except BaseException as exc:
+        future.set_exception(exc)
+        # Mark retrieved so a run with no waiters doesn't warn on GC;
+        # awaiting callers still receive the exception
+        future.exception()
+        raise
+    finally:
+        _inflight.pop(cache_key, None)
+
+
+async def generate_summary_stream(
+    job_description: str,
+    resume_data: Optional[dict] = None
+) -> AsyncIterator[str]:
+    """Stream summary text chunks as the model produces them.
+
+    Time-to-first-token becomes the user-visible latency instead of the
+    full completion time. Cache hits and the template fallback arrive as a
+    single chunk; a successful stream is remembered in the caches so
+    subsequent full-string calls hit them too.
+    """
+    if not job_description or not job_description.strip():
+        raise ValueError("Job description cannot be empty")
+
+    context = _build_context(resume_data)
+    job_desc_limited = job_description[:800]
+
+    cache_text = f"{job_desc_limited}\n{context}"
+    cache_key = hashlib.blake2b(cache_text.encode(), digest_size=16).hexdigest()
+    cached_summary = _summary_exact_cache.get(cache_key)
+    if cached_summary is not None:
+        _summary_exact_cache.move_to_end(cache_key)
+        yield cached_summary
+        return
+    # Off-loop for the same reason as the non-streaming path: the encode
+    # (and first-use model load) must not stall other requests
+    cached_summary = await asyncio.to_thread(summary_cache.get, cache_text)
+    if cached_summary is not None:
+        yield cached_summary
+        return
+
+    client = _get_openrouter_client()
+    if client is None:
+        yield _generate_template_summary(job_description, resume_data)
+        return
+
+    parts = []
+    try:
+        model, max_tokens = _get_openrouter_params()
+        stream = await client.chat.completions.create(
+            model=model,
+            messages=[
+                {"role": "system", "content": _SYSTEM_PROMPT},
+                {"role": "user", "content": _build_user_prompt(job_desc_limited, context)}
+            ],
+            temperature=0.7,
+            max_tokens=max_tokens,
+            stop=["\n\n"],
+            stream=True,
+        )
+        async for chunk in stream:
+            delta = chunk.choices[0].delta.content
+            if delta:
+                parts.append(delta)
+                yield delta
     except Exception:
-        # Hugging Face API failed, try OpenRouter
+        # Stream died; fall through to whatever arrived (or the template)
         pass
-    
-    # Fallback to OpenRouter if available (uses GPT models which work better)
-    if openrouter_client:
-        try:
-            # Create a better prompt for GPT models
-            system_prompt = "You are a professional resume writer. Generate a concise 2-3 sentence professional summary that matches the job description and highlights relevant experience and skills."
-            
-            user_prompt = f"Job Description:\n{job_desc_limited}"
-            if context:
-                user_prompt += f"\n\nResume Context: {context}"
-            user_prompt += "\n\nGenerate a professional resume summary:"
-            
-            response = openrouter_client.chat.completions.create(
-                model="openai/gpt-3.5-turbo",  # Using GPT-3.5 as it's reliable and cost-effective
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_prompt}
-                ],
-                temperature=0.7,
-                max_tokens=150,
+
+    summary = "".join(parts).strip()
+    if summary:
+        await _remember_summary(cache_key, cache_text, summary)
+    else:
+        yield _generate_template_summary(job_description, resume_data)
+
+
+async def _try_huggingface(prompt: str) -> Optional[str]:
+    """Generate via the HF inference API (google/flan-t5-base); None on failure."""
+    if not _hf_breaker.allow():
+        return None
+    try:
+        # orjson serializes at C level; sending the pre-encoded bytes via
+        # content= skips httpx's stdlib-json encode on every call (and the
+        # retry reuses the same bytes)
+        headers = _get_hf_headers()
+        body = orjson.dumps({"inputs": prompt})
+
+        hf_client = _get_hf_client()
+        api_path = "/models/google/flan-t5-base"
+        response = await hf_client.post(
+            api_path,
+            headers=headers,
+            content=body,
+        )
+
+        # 503 means the model is still loading. Retry with capped exponential
+        # backoff plus jitter instead of a fixed 5s sleep: a model that warms
+        # up quickly is retried within ~250ms, and the jitter keeps concurrent
+        # requests from retrying in lockstep. Bounded by an overall deadline
+        # so a model that never loads doesn't hold the race open.
+        start = time.monotonic()
+        for attempt in range(4):
+            if response.status_code != 503:
+                break
+            delay = min(8.0, 0.25 * (2 ** attempt)) * random.uniform(0.5, 1.5)
+            await asyncio.sleep(delay)
+            if time.monotonic() - start > 15.0:
+                break
+            response = await hf_client.post(
+                api_path,
+                headers=headers,
+                content=body,
             )
-            generated_text = response.choices[0].message.content.strip()
+
+        if response.status_code == 200:
+            generated_text = _extract_generated_text(orjson.loads(response.content))
             if generated_text:
-                return generated_text
-        except Exception as e:
-            # OpenRouter failed, use template fallback
-            pass
-    
-    # Final fallback: template-based summary
-    return _generate_template_summary(job_description, resume_data)
+                _hf_breaker.record_success()
+                return _format_summary(generated_text, prompt)
+    except Exception:
+        # Hugging Face API failed; the race falls through to OpenRouter
+        pass
+    _hf_breaker.record_failure()
+    return None
+
+
+# System prompt for the chat-model providers, built once at import
+_SYSTEM_PROMPT = "You are a professional resume writer. Generate a concise 2-3 sentence professional summary that matches the job description and highlights relevant experience and skills."
+
+
+async def _try_local(user_prompt: str) -> Optional[str]:
+    """Generate via the local OpenAI-compatible server; None on failure."""
+    try:
+        _, max_tokens = _get_openrouter_params()
+        response = await _get_local_client().chat.completions.create(
+            model=os.getenv("LOCAL_LLM_MODEL", "mistralai/Mistral-7B-Instruct-v0.1"),
+            messages=[
+                {"role": "system", "content": _SYSTEM_PROMPT},
+                {"role": "user", "content": user_prompt}
+            ],
+            temperature=0.7,
+            max_tokens=max_tokens,
+            stop=["\n\n"],
+        )
+        generated_text = response.choices[0].message.content.strip()
+        return generated_text or None
+    except Exception:
+        # Local server unreachable; the remote tiers cover it
+        return None
+
+
+async def _try_openrouter(user_prompt: str) -> Optional[str]:
+    """Generate via OpenRouter (uses GPT models which work better); None on failure."""
+    try:
+        model, max_tokens = _get_openrouter_params()
+        response = await _get_openrouter_client().chat.completions.create(
+            model=model,
+            messages=[
+                {"role": "system", "content": _SYSTEM_PROMPT},
+                {"role": "user", "content": user_prompt}
+            ],
+            temperature=0.7,
+            max_tokens=max_tokens,
+            # A blank line means the summary paragraph is done; stop decoding
+            stop=["\n\n"],
+        )
+        generated_text = response.choices[0].message.content.strip()
+        return generated_text or None
+    except Exception:
+        # OpenRouter failed; the race falls through to the template
+        return None
@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+from functools import lru_cache
+from pathlib import Path
+from typing import List, Optional
+
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+# Resolved once at import; avoids re-computing the path on every reload
+ENV_FILE = str(Path(__file__).parent.parent / ".env")
+
+
+class Settings(BaseSettings):
+    """Application settings loaded from environment / backend/.env."""
+
+    model_config = SettingsConfigDict(env_file=ENV_FILE, extra="ignore")
+
+    openrouter_api_key: Optional[str] = None
+    huggingface_api_key: str = ""
+    # Origins allowed for CORS; keep "*" only for local development
+    cors_origins: List[str] = ["*"]
+
+
+@lru_cache
+def get_settings() -> Settings:
+    """Parse and cache settings once per process."""
+    return Settings()
@@ -1,53 +1,146 @@
+import asyncio
+import hashlib
 import os
-import requests
+import string
+import httpx
 from pathlib import Path
 from tqdm import tqdm
 
-def download_file(url: str, filename: str):
-    """Download a file with progress bar."""
-    print(f"Downloading {filename}...")
+# 1 MiB blocks: large writes amortize syscall overhead that 1 KiB chunks
+# paid per block on a multi-GB file
+BLOCK_SIZE = 1 << 20
+
+async def _fetch_lfs_sha256(client: httpx.AsyncClient, url: str):
+    """Look up a file's LFS sha256 from HF's resolve-endpoint headers.
+
+    Hugging Face advertises the LFS object id (its sha256) in the
+    X-Linked-ETag/ETag headers of a HEAD request. Best-effort: returns
+    None for non-LFS files (their ETag isn't a sha256) or on any error,
+    in which case the download simply runs unverified.
+    """
+    try:
+        response = await client.head(url)
+        for resp in [*response.history, response]:
+            etag = (resp.headers.get('x-linked-etag') or resp.headers.get('etag', '')).strip('"')
+            if len(etag) == 64 and all(c in string.hexdigits for c in etag):
+                return etag.lower()
+    except httpx.HTTPError:
+        pass
+    return None
+
+async def _download_one(client: httpx.AsyncClient, url: str, filename: str,
+                        expected_sha256: str = None, position: int = 0):
+    """Download a single file with its own progress bar.
+
+    A partial file from an interrupted run is resumed with a Range request
+    instead of re-downloading gigabytes from byte zero. The hash for the
+    integrity check (expected_sha256, or the LFS sha256 fetched from the
+    file's headers when not given) is computed in the same loop that
+    writes to disk — one pass over the file instead of a separate
+    post-download read.
+    """
     # Create directory if it doesn't exist
     os.makedirs(os.path.dirname(filename), exist_ok=True)
-    
-    # Download the file with progress
-    response = requests.get(url, stream=True)
-    response.raise_for_status()
-    
-    # Get file size for progress bar
-    total_size = int(response.headers.get('content-length', 0))
-    block_size = 1024  # 1 Kibibyte
-    
-    with open(filename, 'wb') as f, tqdm(
-        desc=os.path.basename(filename),
-        total=total_size,
-        unit='iB',
-        unit_scale=True,
-        unit_divisor=1024,
-    ) as bar:
-        for data in response.iter_content(block_size):
-            size = f.write(data)
-            bar.update(size)
-    
+
+    if expected_sha256 is None:
+        expected_sha256 = await _fetch_lfs_sha256(client, url)
+
+    existing = os.path.getsize(filename) if os.path.exists(filename) else 0
+    headers = {"Range": f"bytes={existing}-"} if existing else {}
+
+    async with client.stream("GET", url, headers=headers) as response:
+        if existing and response.status_code == 416:
+            # Requested range starts past the end: the file is complete
+            print(f"{filename} is already complete")
+            return
+        response.raise_for_status()
+
+        # 206 means the server honored the range; anything else (200) is a
+        # full body, so start over from byte zero
+        if response.status_code == 206:
+            mode = 'ab'
+        else:
+            mode = 'wb'
+            existing = 0
+
+        hasher = hashlib.sha256() if expected_sha256 else None
+        if hasher is not None and existing:
+            # Resumed transfer: fold the bytes already on disk into the
+            # hash so the final digest covers the whole file
+            with open(filename, 'rb') as f:
+                for block in iter(lambda: f.read(BLOCK_SIZE), b''):
+                    hasher.update(block)
+
+        # Get file size for progress bar
+        total_size = existing + int(response.headers.get('content-length', 0))
+
+        with open(filename, mode) as f, tqdm(
+            desc=os.path.basename(filename),
+            initial=existing,
+            total=total_size,
+            unit='iB',
+            unit_scale=True,
+            unit_divisor=1024,
+            position=position,
+        ) as bar:
+            async for data in response.aiter_bytes(BLOCK_SIZE):
+                size = f.write(data)
+                if hasher is not None:
+                    hasher.update(data)
+                bar.update(size)
+
+    if hasher is not None and hasher.hexdigest() != expected_sha256:
+        raise ValueError(
+            f"Checksum mismatch for {filename}: "
+            f"expected {expected_sha256}, got {hasher.hexdigest()}"
+        )
+
     print(f"Successfully downloaded {filename}")
 
+async def download_all(urls_and_paths):
+    """Download several files concurrently over one pooled client.
+
+    Entries are (url, path) or (url, path, expected_sha256) tuples.
+    Wall-clock time becomes the longest single transfer instead of the sum,
+    and connect/TLS setup overlaps across files.
+    """
+    # Stream with httpx: HTTP/2 and keep-alive across the redirect chain,
+    # no total timeout (the files are huge) but fail fast on connect
+    async with httpx.AsyncClient(
+        http2=True,
+        follow_redirects=True,
+        timeout=httpx.Timeout(None, connect=10.0),
+        limits=httpx.Limits(max_connections=8),
+    ) as client:
+        await asyncio.gather(*[
+            _download_one(client, *entry, position=i)
+            for i, entry in enumerate(urls_and_paths)
+        ])
+
+def download_file(url: str, filename: str):
+    """Download a file with progress bar."""
+    print(f"Downloading {filename}...")
+    asyncio.run(download_all([(url, filename)]))
+
 def download_mistral_model():
     """Download the Mistral 7B GGUF model."""
     # Model details
     model_name = "mistral-7b-instruct-v0.1.Q4_K_M.gguf"
     model_url = f"https://huggingface.co/TheBloke/Mistral-7B-Instruct-v0.1-GGUF/resolve/main/{model_name}"
-    
+
     # Create models directory
     models_dir = Path(__file__).parent.parent / "models"
     models_dir.mkdir(exist_ok=True)
-    
-    # Download the model
-    model_path = models_dir / model_name
-    if not model_path.exists():
-        download_file(model_url, str(model_path))
-    else:
-        print(f"Model already exists at: {model_path}")
-    
-    return str(model_path)
+
+    # Any sidecar files (tokenizer/config) added here download concurrently.
+    # Every entry goes through _download_one, which resumes partial files
+    # via a Range request and skips complete ones (the server answers the
+    # out-of-range probe with 416) — no exists() pre-check, since a partial
+    # file from an interrupted run also "exists".
+    wanted = [(model_url, str(models_dir / model_name))]
+    asyncio.run(download_all(wanted))
+
+    return str(models_dir / model_name)
 
 if __name__ == "__main__":
     model_path = download_mistral_model()